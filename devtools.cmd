@@ -9,6 +9,7 @@ if "%option%"=="-s" set option=--score
 if "%option%"=="-c" set option=--check
 if "%option%"=="-r" set option=--reformat
 if "%option%"=="-t" set option=--test
+if "%option%"=="-b" set option=--bench
 if "%option%"=="-a" set option=--all
 
 set poetry_cmd=poetry run
@@ -37,6 +38,12 @@ if "%option%"=="--test" (
     goto :eof
 )
 
+if "%option%"=="--bench" (
+    echo Running all benchmarks...
+    call :run_benchmarks
+    goto :eof
+)
+
 if "%option%"=="--all" (
     echo Reformatting code...
     call :reformat
@@ -79,6 +86,14 @@ goto :eof
     %poetry_cmd% python -m unittest discover -s test_ugraph
     goto :eof
 
+:run_benchmarks
+    echo Running all benchmarks...
+    set PYTHONPATH=.\src
+    for %%f in (.\src\benchmark_ugraph\*.py) do (
+        if not "%%~nf"=="__init__" if not "%%~nf"=="_utils" %poetry_cmd% python -m benchmark_ugraph.%%~nf
+    )
+    goto :eof
+
 :usage
     echo.
     echo POOR MANS BUILD PIPELINE
@@ -92,6 +107,7 @@ goto :eof
     echo --reformat, -r    Reformat code
     echo --score, -s       Score code
     echo --test, -t        Run tests
+    echo --bench, -b       Run benchmarks
     echo --all, -a         Execute --reformat, --check, --score, and --test
     echo -h, --help        Display this help message
     echo.
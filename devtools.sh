@@ -15,6 +15,7 @@ usage() {
     echo "  --reformat, -r    Reformat code"
     echo "  --score, -s       Score code"
     echo "  --test, -t        Run tests"
+    echo "  --bench, -b       Run benchmarks"
     echo "  --all, -a         Execute --reformat, --check, --score, and --test"
     echo "  -h, --help        Display this help message"
     echo
@@ -46,6 +47,15 @@ run_tests() {
     PYTHONPATH=./src poetry run python -m unittest discover -s test_ugraph
 }
 
+run_benchmarks() {
+    echo "Running all benchmarks..."
+    for benchmark in ./src/benchmark_ugraph/[!_]*.py; do
+        module="benchmark_ugraph.$(basename "$benchmark" .py)"
+        echo "$module:"
+        PYTHONPATH=./src poetry run python -m "$module"
+    done
+}
+
 option="$1"
 
 case "$option" in
@@ -68,6 +78,10 @@ case "$option" in
         echo "Running all unit tests..."
         run_tests
         ;;
+    -b|--bench)
+        echo "Running all benchmarks..."
+        run_benchmarks
+        ;;
     -a|--all)
         echo "Reformatting code..."
         reformat
@@ -0,0 +1,116 @@
+import gc
+import os
+import timeit
+import tracemalloc
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import igraph
+
+from ugraph import LINK_ATTRIBUTE_KEY, NODE_ATTRIBUTE_KEY, VERTEX_NAME_KEY, EndNodeIdPair, NodeId, ThreeDCoordinates
+from usage.state_network import StateLink, StateLinkType, StateNetwork, StateNode, StateNodeType
+
+
+def create_ring_elements(n_links: int) -> tuple[list[StateNode], list[tuple[EndNodeIdPair, StateLink]]]:
+    """Return the nodes and links of a ring with ``n_links`` nodes, every tenth of them a resource."""
+    nodes = [
+        StateNode(
+            node_id=NodeId(str(i)),
+            coordinates=ThreeDCoordinates(x=float(i), y=float(i % 100), z=0.0),
+            node_type=StateNodeType.INFRASTRUCTURE if i % 10 else StateNodeType.RESOURCE,
+        )
+        for i in range(n_links)
+    ]
+    links = [
+        (
+            EndNodeIdPair((nodes[i].node_id, nodes[(i + 1) % n_links].node_id)),
+            StateLink(link_type=StateLinkType.TRANSITION if i % 10 else StateLinkType.ALLOCATION),
+        )
+        for i in range(n_links)
+    ]
+    return nodes, links
+
+
+def create_ring_network(n_links: int) -> StateNetwork:
+    """Return the ring of ``create_ring_elements``, built directly on igraph to keep the setup cheap."""
+    nodes, links = create_ring_elements(n_links)
+    graph = igraph.Graph(
+        n=n_links,
+        edges=[(i, (i + 1) % n_links) for i in range(n_links)],
+        directed=True,
+        vertex_attrs={VERTEX_NAME_KEY: [node.node_id for node in nodes], NODE_ATTRIBUTE_KEY: nodes},
+        edge_attrs={LINK_ATTRIBUTE_KEY: [link for _, link in links]},
+    )
+    return StateNetwork(graph)
+
+
+def seconds_per_call(function: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+def print_table(header: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    widths = [max(len(str(cell)) for cell in column) for column in zip(header, *rows)]
+    for row in (header, *rows):
+        print("  ".join(str(cell).rjust(width) for cell, width in zip(row, widths)))
+
+
+def memory_growth(function: Callable[[], Any]) -> tuple[Any, int]:
+    """Call ``function`` and return its result together with the memory it kept allocated, in bytes.
+
+    Uses the resident set size where ``/proc`` is available (it includes the C-level igraph structures), and the
+    Python allocations traced by ``tracemalloc`` elsewhere.
+    """
+    if not os.path.exists("/proc/self/statm"):
+        tracemalloc.start()
+        try:
+            result = function()
+            return result, tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+    gc.collect()
+    before = _resident_bytes()
+    result = function()
+    gc.collect()
+    return result, _resident_bytes() - before
+
+
+def peak_memory_growth(function: Callable[[], Any]) -> int:
+    """Return by how much calling ``function`` raises the peak memory above the memory in use before, in bytes.
+
+    Where ``/proc`` is available, ``function`` runs in a forked process (such that memory freed by earlier
+    measurements cannot be reused) and the peak resident set size is measured; elsewhere the peak of the Python
+    allocations traced by ``tracemalloc``.
+    """
+    if not os.path.exists("/proc/self/clear_refs") or not hasattr(os, "fork"):
+        tracemalloc.start()
+        try:
+            function()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover (child process)
+        os.close(read_end)
+        gc.collect()
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")  # resets the peak resident set size to the current one
+        before = _status_bytes("VmRSS")
+        function()
+        os.write(write_end, str(_status_bytes("VmHWM") - before).encode())
+        os._exit(0)  # pylint: disable=protected-access
+    os.close(write_end)
+    with os.fdopen(read_end) as file:
+        growth = file.read()
+    os.waitpid(pid, 0)
+    return int(growth)
+
+
+def _status_bytes(key: str) -> int:
+    with open("/proc/self/status") as file:
+        return next(int(line.split()[1]) * 1024 for line in file if line.startswith(f"{key}:"))
+
+
+def _resident_bytes() -> int:
+    with open("/proc/self/statm") as file:
+        return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
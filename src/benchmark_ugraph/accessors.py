@@ -0,0 +1,59 @@
+"""
+Per-call cost of the single-element and batch accessors of ``ImmutableNetworkABC``.
+
+The accessors read one element (or a batch) directly from the underlying igraph attribute storage, so the time per
+call must stay flat while the network grows. The last column shows the previous approach of materialising the whole
+attribute column (``es[LINK_ATTRIBUTE_KEY][i]``) for comparison, which grows linearly with the number of links.
+
+Run with ``python -m benchmark_ugraph.accessors`` from ``./src``.
+"""
+
+import argparse
+import random
+
+from ugraph import LINK_ATTRIBUTE_KEY, LinkIndex, NodeIndex
+
+from ._utils import create_ring_network, print_table, seconds_per_call
+
+_BATCH_SIZE = 1_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-links", type=int, default=1_000_000)
+    max_links = parser.parse_args().max_links
+
+    rows = []
+    n_links = 10_000
+    while n_links <= max_links:
+        network = create_ring_network(n_links)
+        index = n_links // 2
+        batch = random.Random(n_links).sample(range(n_links), _BATCH_SIZE)
+        timings = (
+            seconds_per_call(lambda: network.node_by_index(NodeIndex(index)), number=10_000),
+            seconds_per_call(lambda: network.node_id_by_index(NodeIndex(index)), number=10_000),
+            seconds_per_call(lambda: network.link_by_index(LinkIndex(index)), number=10_000),
+            seconds_per_call(lambda: network.incident_links_per_node(NodeIndex(index)), number=10_000),
+            seconds_per_call(lambda: network.links_by_indices(batch), number=100),
+            seconds_per_call(lambda: network.all_edges[LINK_ATTRIBUTE_KEY][index], number=5),
+        )
+        rows.append((f"{n_links:,}", *(f"{t * 1e6:.2f}" for t in timings)))
+        n_links *= 10
+
+    print("time per call [us]")
+    print_table(
+        (
+            "links",
+            "node_by_index",
+            "node_id_by_index",
+            "link_by_index",
+            "incident_links",
+            f"links_by_indices({_BATCH_SIZE})",
+            "column[i] (old)",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
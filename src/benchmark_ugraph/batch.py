@@ -0,0 +1,61 @@
+"""
+Interleaved mutations applied one by one against the same mutations queued in ``network.batch()``.
+
+Every round adds a node, links it to the ring, replaces a node and deletes a link. Applied one by one, every deletion
+makes igraph renumber the edges (and the typed columns are compacted each time); inside a batch the inserts are
+appended with one call each and all deletions are merged into a single call.
+
+Run with ``python -m benchmark_ugraph.batch`` from ``./src``.
+"""
+
+import argparse
+import time
+
+from ugraph import EndNodeIdPair, LinkIndex, NodeId, NodeIndex, ThreeDCoordinates
+from usage.state_network import StateLink, StateLinkType, StateNetwork, StateNode, StateNodeType
+
+from ._utils import create_ring_network, print_table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--links", type=int, default=100_000)
+    n_links = parser.parse_args().links
+
+    rows = []
+    for rounds in (10, 100, 1_000):
+        one_by_one = _seconds(n_links, rounds, batched=False)
+        batched = _seconds(n_links, rounds, batched=True)
+        rows.append((f"{rounds:,}", f"{one_by_one * 1e3:.1f}", f"{batched * 1e3:.1f}", f"{one_by_one / batched:.1f}"))
+
+    print(f"time [ms] for a network with {n_links:,} links")
+    print_table(("rounds", "one by one", "batch()", "speedup"), rows)
+
+
+def mutate(network: StateNetwork, rounds: int) -> None:
+    """Apply ``rounds`` rounds of interleaved mutations; link indices are taken from the end of the original ring."""
+    n_links = network.l_count
+    for i in range(rounds):
+        node = StateNode(NodeId(f"new_{i}"), ThreeDCoordinates(0.0, 0.0, 0.0), StateNodeType.INFRASTRUCTURE)
+        network.add_nodes([node])
+        network.add_links([(EndNodeIdPair((NodeId(str(i)), node.node_id)), StateLink(StateLinkType.TRANSITION))])
+        network.replace_node(NodeIndex(i), network.node_by_index(NodeIndex(i)))
+        network.delete_links([LinkIndex(n_links - 1 - i)])
+
+
+def _seconds(n_links: int, rounds: int, batched: bool) -> float:
+    timings = []
+    for _ in range(3):
+        network = create_ring_network(n_links)
+        start = time.perf_counter()
+        if batched:
+            with network.batch():
+                mutate(network, rounds)
+        else:
+            mutate(network, rounds)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    main()
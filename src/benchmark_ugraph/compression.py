@@ -0,0 +1,57 @@
+"""
+Size and time of writing and reading a network per format and compression codec.
+
+Every codec of the standard library (``compression=`` of ``write_json``/``read_json`` and ``write_binary``/
+``read_binary``) compresses while streaming, so the columns show the trade-off between file size and speed when
+picking a codec per use case.
+
+Run with ``python -m benchmark_ugraph.compression`` from ``./src``.
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from ugraph import Compression
+from usage.state_network import StateNetwork
+
+from ._utils import create_ring_network, print_table, seconds_per_call
+
+_CODECS: dict[Compression | None, str] = {None: "", "gzip": ".gz", "lzma": ".xz", "bz2": ".bz2"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--links", type=int, default=100_000)
+    n_links = parser.parse_args().links
+
+    network = create_ring_network(n_links)
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for kind in ("json", "bin"):
+            for compression, suffix in _CODECS.items():
+                path = Path(directory) / f"{StateNetwork.__name__}.{kind}{suffix}"
+                if kind == "json":
+                    write_seconds = seconds_per_call(lambda: network.write_json(path, compression=compression), 1)
+                    read_seconds = seconds_per_call(lambda: StateNetwork.read_json(path, compression=compression), 1)
+                else:
+                    write_seconds = seconds_per_call(lambda: network.write_binary(path, compression=compression), 1)
+                    read_seconds = seconds_per_call(
+                        lambda: StateNetwork.read_binary(path, compression=compression), 1
+                    )
+                rows.append(
+                    (
+                        kind,
+                        compression or "none",
+                        f"{path.stat().st_size / 2**20:.2f}",
+                        f"{write_seconds:.2f}",
+                        f"{read_seconds:.2f}",
+                    )
+                )
+
+    print(f"size [MiB] and time [s] of writing and reading {n_links:,} links")
+    print_table(("format", "compression", "MiB", "write", "read"), rows)
+
+
+if __name__ == "__main__":
+    main()
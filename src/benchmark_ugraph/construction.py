@@ -0,0 +1,71 @@
+"""
+Construction time of ``MutableNetworkABC.create_new`` with the column-wise bulk path.
+
+``add_nodes``/``add_links`` (and thereby ``create_new`` and ``append_``) assign whole attribute columns in one igraph
+call and resolve all ``EndNodeIdPair`` names through the id index in a single pass. The reference column repeats the
+previous approach, which assigned every node, name and link through its own ``vs[i][...]``/``es[i][...]`` call.
+The bulk path must be at least ``SPEEDUP_TARGET`` times faster at every size, otherwise the benchmark exits with an
+error (and so does ``devtools --bench``). Timings are not checked by the unit tests, as they vary on loaded machines.
+
+Run with ``python -m benchmark_ugraph.construction`` from ``./src``.
+"""
+
+import argparse
+import time
+from collections.abc import Callable, Sequence
+
+from ugraph import LINK_ATTRIBUTE_KEY, NODE_ATTRIBUTE_KEY, VERTEX_NAME_KEY, EndNodeIdPair
+from usage.state_network import StateLink, StateNetwork, StateNode
+
+from ._utils import create_ring_elements, print_table
+
+SPEEDUP_TARGET = 3.0
+
+
+def create_per_element(nodes: Sequence[StateNode], links: Sequence[tuple[EndNodeIdPair, StateLink]]) -> StateNetwork:
+    """Reference: construction as done before the bulk path, one Python -> C round-trip per attribute."""
+    network = StateNetwork.create_empty()
+    graph = network.underlying_digraph
+    graph.add_vertices(len(nodes))
+    for i, node in enumerate(nodes):
+        graph.vs[i][NODE_ATTRIBUTE_KEY] = node
+        graph.vs[i][VERTEX_NAME_KEY] = node.node_id
+    graph.add_edges([end_nodes for end_nodes, _ in links])
+    for i, (_, link) in enumerate(links):
+        graph.es[i][LINK_ATTRIBUTE_KEY] = link
+    return network
+
+
+def measure_construction(n_links: int) -> tuple[float, float]:
+    """Return the seconds needed by the per-element reference and by ``create_new`` for a ring of ``n_links``."""
+    nodes, links = create_ring_elements(n_links)
+    return _seconds(lambda: create_per_element(nodes, links)), _seconds(lambda: StateNetwork.create_new(nodes, links))
+
+
+def _seconds(function: Callable[[], StateNetwork]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-links", type=int, default=1_000_000)
+    max_links = parser.parse_args().max_links
+
+    rows, speedups = [], []
+    n_links = 10_000
+    while n_links <= max_links:
+        per_element, bulk = measure_construction(n_links)
+        speedups.append(per_element / bulk)
+        rows.append((f"{n_links:,}", f"{per_element:.3f}", f"{bulk:.3f}", f"{speedups[-1]:.1f}x"))
+        n_links *= 10
+
+    print(f"construction time [s] (target speedup: {SPEEDUP_TARGET:.0f}x)")
+    print_table(("links", "per element (old)", "create_new", "speedup"), rows)
+    if min(speedups) < SPEEDUP_TARGET:
+        raise SystemExit(f"create_new is only {min(speedups):.1f}x faster, the target is {SPEEDUP_TARGET:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Time and memory of ``copy()`` before and after making it copy-on-write.
+
+``copy()`` used to duplicate the underlying igraph graph eagerly. It now shares the graph with the copy and defers the
+physical copy to the first mutation of either network, so taking a copy is O(1) and copies that are only read never
+cost memory. The eager columns show the previous behaviour, the last column the deferred cost paid by the first
+mutation of a copy.
+
+Run with ``python -m benchmark_ugraph.copy_on_write`` from ``./src``.
+"""
+
+import argparse
+
+from ugraph import LinkIndex
+from usage.state_network import StateLink, StateLinkType, StateNetwork
+
+from ._utils import create_ring_network, memory_growth, print_table, seconds_per_call
+
+_KEPT_COPIES = 5  # copies kept alive per measurement, such that freed memory being reused does not hide the growth
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-links", type=int, default=1_000_000)
+    max_links = parser.parse_args().max_links
+
+    rows = []
+    n_links = 10_000
+    while n_links <= max_links:
+        network = create_ring_network(n_links)
+        graph = network.read_only_digraph
+        eager_seconds = seconds_per_call(lambda: StateNetwork(graph.copy()), number=3)
+        eager, eager_bytes = memory_growth(lambda: [StateNetwork(graph.copy()) for _ in range(_KEPT_COPIES)])
+        # the copies taken from here on share the graph of ``network`` until one of them is mutated
+        lazy, lazy_bytes = memory_growth(lambda: [network.copy() for _ in range(_KEPT_COPIES)])
+        timings = (
+            eager_seconds,
+            seconds_per_call(network.copy, number=1_000),
+            seconds_per_call(lambda: _copy_and_mutate(network), number=3),
+        )
+        rows.append(
+            (
+                f"{n_links:,}",
+                f"{timings[0] * 1e3:.3f}",
+                f"{eager_bytes / _KEPT_COPIES / 2**20:.1f}",
+                f"{timings[1] * 1e3:.3f}",
+                f"{lazy_bytes / _KEPT_COPIES / 2**20:.1f}",
+                f"{timings[2] * 1e3:.3f}",
+            )
+        )
+        del eager, lazy
+        n_links *= 10
+
+    print("time [ms] and retained memory [MiB] per copy")
+    print_table(("links", "eager copy", "eager MiB", "copy()", "copy() MiB", "copy() + first mutation"), rows)
+
+
+def _copy_and_mutate(network: StateNetwork) -> StateNetwork:
+    copied = network.copy()
+    copied.replace_link(LinkIndex(0), StateLink(link_type=StateLinkType.TRANSITION))
+    return copied
+
+
+if __name__ == "__main__":
+    main()
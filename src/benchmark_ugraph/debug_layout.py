@@ -0,0 +1,68 @@
+"""
+Time of the layout of ``debug_plot`` for random DAGs: Sugiyama as before, and the cached and incremental layout.
+
+``debug_plot`` used to compute ``layout_sugiyama`` for every DAG on every call. Above ``LARGE_GRAPH_VERTICES`` it now
+uses the grid-based Fruchterman-Reingold layout and caches every layout by a fingerprint of the graph. A slightly
+edited graph (here one added vertex) keeps the positions of the previous layout, and only the new vertex is placed.
+
+Run with ``python -m benchmark_ugraph.debug_layout`` from ``./src``.
+"""
+
+import argparse
+import random
+
+import igraph
+
+from ugraph._abc import _debug
+
+from ._utils import print_table, seconds_per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-vertices", type=int, default=8_000)
+    max_vertices = parser.parse_args().max_vertices
+
+    rows = []
+    n_vertices = 2_000
+    while n_vertices <= max_vertices:
+        graph = _random_dag(n_vertices, 4 * n_vertices)
+        sugiyama = seconds_per_call(graph.layout_sugiyama, number=1)
+        _debug._LAYOUT_CACHE.clear()  # pylint: disable=protected-access
+        first = seconds_per_call(lambda: _first_layout(graph), number=1)
+        cached = seconds_per_call(lambda: _debug._get_layout(graph), number=1)  # pylint: disable=protected-access
+        edited = graph.copy()
+        edited.add_vertex("new")
+        edited.add_edge(edited.vs[0], "new")
+        incremental = seconds_per_call(lambda: _incremental_layout(graph, edited), number=1)
+        rows.append((f"{n_vertices:,}", f"{sugiyama:.2f}", f"{first:.2f}", f"{cached:.4f}", f"{incremental:.2f}"))
+        n_vertices *= 2
+
+    print("time [s] of the layout of a random DAG with four times as many edges as vertices")
+    print_table(("vertices", "sugiyama", "first", "cached", "incremental"), rows)
+
+
+def _random_dag(n_vertices: int, n_edges: int) -> igraph.Graph:
+    random_generator = random.Random(0)
+    edges: set[tuple[int, int]] = set()
+    while len(edges) < n_edges:
+        source, target = sorted(random_generator.sample(range(n_vertices), 2))
+        edges.add((source, target))
+    graph = igraph.Graph(n=n_vertices, edges=sorted(edges), directed=True)
+    graph.vs["name"] = [str(vertex) for vertex in range(n_vertices)]
+    return graph
+
+
+def _first_layout(graph: igraph.Graph) -> None:
+    _debug._LAYOUT_CACHE.clear()  # pylint: disable=protected-access
+    _debug._get_layout(graph)  # pylint: disable=protected-access
+
+
+def _incremental_layout(graph: igraph.Graph, edited: igraph.Graph) -> None:
+    _debug._LAYOUT_CACHE.pop(_debug._fingerprint(edited, None), None)  # pylint: disable=protected-access
+    _debug._get_layout(graph)  # pylint: disable=protected-access
+    _debug._get_layout(edited)  # pylint: disable=protected-access
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Time of ``read_json`` with decoding plans compiled per class, compared to the former per-object decoding.
+
+``ImmutableNetworkDecoder`` used to import the class and call ``get_type_hints`` for every node and link, and to
+resolve every field recursively. It now compiles a plan per class the first time it is seen and reuses it; the
+reference column repeats the former decoder. Both decode the same file, written once by ``write_json``.
+
+Run with ``python -m benchmark_ugraph.decoder`` from ``./src``.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import is_dataclass
+from pathlib import Path
+from types import UnionType
+from typing import Any, Literal, Union, get_args, get_origin, get_type_hints
+
+import igraph
+
+from ugraph import UGraphDecoder
+from usage.state_network import StateNetwork
+
+from ._utils import create_ring_network, print_table
+
+
+class PerObjectDecoder(UGraphDecoder):
+    """Reference: the decoder as it was before decoding plans, resolving classes and type hints per object."""
+
+    @staticmethod
+    def object_hook(dct: dict[str, Any]) -> Any:
+        if "__class__" not in dct:
+            return dct
+        class_name = dct.pop("__class__")
+        if class_name == "igraph.Graph":
+            return UGraphDecoder.object_hook({**dct, "__class__": class_name})
+        module_name, class_name = class_name.rsplit(".", 1)
+        return _dataclass_from_dict(getattr(__import__(module_name, fromlist=[class_name]), class_name), dct)
+
+
+def _dataclass_from_dict(cls: Any, data: Any) -> Any:
+    if get_origin(cls) is Union or get_origin(cls) is UnionType:
+        for arg in get_args(cls):
+            try:
+                return _dataclass_from_dict(arg, data)
+            except Exception:  # pylint: disable=broad-except
+                pass
+        raise ValueError(f"Could not convert {data} to any of {get_args(cls)}")
+    if hasattr(cls, "__supertype__"):
+        return cls(_dataclass_from_dict(cls.__supertype__, data))
+    if get_origin(cls) is Literal:
+        if data in get_args(cls):
+            return data
+        raise ValueError(f"Value {data} is not a valid Literal for {cls}")
+    if not is_dataclass(cls):
+        return data if isinstance(data, igraph.Graph) or data is None else cls(data)
+    field_types = get_type_hints(cls)
+    result = {}
+    for name, field_type in field_types.items():
+        if name not in data:
+            continue
+        args = get_args(field_type)
+        if len(args) > 0 and args[-1] is Ellipsis:
+            result[name] = tuple(_dataclass_from_dict(args[0], item) for item in data[name])
+        else:
+            result[name] = _dataclass_from_dict(field_type, data[name])
+    return cls(**result)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--nodes", type=int, default=500_000)
+    n_nodes = parser.parse_args().nodes
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"{StateNetwork.__name__}.json"
+        network = create_ring_network(n_nodes)
+        network.write_json(path)
+        del network
+        per_object = _seconds(lambda: _load(path, PerObjectDecoder))
+        planned = _seconds(lambda: _load(path, UGraphDecoder))
+        size = path.stat().st_size
+
+    print("time [s] of decoding the file")
+    print_table(
+        ("nodes", "file MiB", "per object", "plans", "speedup"),
+        [
+            (
+                f"{n_nodes:,}",
+                f"{size / 2**20:.0f}",
+                f"{per_object:.2f}",
+                f"{planned:.2f}",
+                f"{per_object / planned:.1f}x",
+            )
+        ],
+    )
+
+
+def _load(path: Path, decoder: type[json.JSONDecoder]) -> StateNetwork:
+    with open(path) as file:
+        return json.load(file, cls=decoder)
+
+
+def _seconds(function: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Time of saving a network after a small edit, rewriting it with ``write_json`` or appending to its journal.
+
+Every edit replaces 10 links. "write_json" rewrites the whole file after the edit, "journal" appends the edit to the
+journal next to the snapshot (``network.journal(snapshot)``). The last column is the time of loading the snapshot
+with the (about 1,000) journaled edits replayed (``read_journaled``).
+
+Run with ``python -m benchmark_ugraph.journal`` from ``./src``.
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from ugraph import LinkIndex
+from usage.state_network import StateLink, StateLinkType, StateNetwork
+
+from ._utils import create_ring_network, print_table, seconds_per_call
+
+_EDITED = 10
+_REPLAYED = 1_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-links", type=int, default=1_000_000)
+    max_links = parser.parse_args().max_links
+
+    rows = []
+    n_links = 10_000
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot = Path(directory) / f"{StateNetwork.__name__}.json"
+        while n_links <= max_links:
+            network = create_ring_network(n_links)
+            rewrite_seconds = seconds_per_call(lambda: _edit_and_rewrite(network, snapshot), number=1)
+            snapshot.unlink()
+            with network.journal(snapshot):
+                journal_seconds = seconds_per_call(lambda: _edit(network), number=_REPLAYED // 3)
+            rows.append(
+                (
+                    f"{n_links:,}",
+                    f"{rewrite_seconds * 1e3:.1f}",
+                    f"{journal_seconds * 1e3:.3f}",
+                    f"{seconds_per_call(lambda: StateNetwork.read_journaled(snapshot), number=1):.2f}",
+                )
+            )
+            snapshot.unlink()
+            Path(f"{snapshot}.journal").unlink()
+            n_links *= 10
+
+    print(f"time [ms] of saving after replacing {_EDITED} links, time [s] of loading")
+    print_table(("links", "write_json", "journal", "read_journaled"), rows)
+
+
+def _edit(network: StateNetwork) -> None:
+    for index in range(_EDITED):
+        network.replace_link(LinkIndex(index), StateLink(link_type=StateLinkType.TRANSITION))
+
+
+def _edit_and_rewrite(network: StateNetwork, snapshot: Path) -> None:
+    _edit(network)
+    network.write_json(snapshot)
+
+
+if __name__ == "__main__":
+    main()
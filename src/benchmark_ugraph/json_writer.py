@@ -0,0 +1,58 @@
+"""
+Peak memory and time of ``write_json`` before and after streaming it.
+
+``write_json`` used to ``json.dump`` the network, which first converts the whole graph to Python objects (a deep copy
+of the graph and one dictionary per node and link). It now writes the same bytes in chunks of nodes and links.
+
+Run with ``python -m benchmark_ugraph.json_writer`` from ``./src``.
+"""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+from ugraph import UGraphEncoder
+from usage.state_network import StateNetwork
+
+from ._utils import create_ring_network, peak_memory_growth, print_table, seconds_per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-links", type=int, default=100_000)
+    max_links = parser.parse_args().max_links
+
+    rows = []
+    n_links = 1_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"{StateNetwork.__name__}.json"
+        while n_links <= max_links:
+            network = create_ring_network(n_links)
+            network.write_json(path)
+            size = path.stat().st_size
+            dump_bytes = peak_memory_growth(lambda: _dump(network, path))
+            streamed_bytes = peak_memory_growth(lambda: network.write_json(path))
+            rows.append(
+                (
+                    f"{n_links:,}",
+                    f"{size / 2**20:.1f}",
+                    f"{dump_bytes / 2**20:.1f}",
+                    f"{seconds_per_call(lambda: _dump(network, path), number=1) * 1e3:.0f}",
+                    f"{streamed_bytes / 2**20:.1f}",
+                    f"{seconds_per_call(lambda: network.write_json(path), number=1) * 1e3:.0f}",
+                )
+            )
+            n_links *= 10
+
+    print("peak memory growth [MiB] and time [ms] of writing the file")
+    print_table(("links", "file MiB", "json.dump MiB", "json.dump", "write_json MiB", "write_json"), rows)
+
+
+def _dump(network: StateNetwork, path: Path) -> None:
+    with open(path, "w") as file:
+        json.dump(network, file, cls=UGraphEncoder)
+
+
+if __name__ == "__main__":
+    main()
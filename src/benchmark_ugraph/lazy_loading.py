@@ -0,0 +1,72 @@
+"""
+Time and memory of reading a JSON network lazily, compared to reading it eagerly.
+
+``read_json(path, lazy=True)`` builds the graph structure and the node ids and decodes the node and link objects only
+when they are first accessed. The "access" columns read the file and access 1,000 nodes and links of the network;
+"materialise" decodes all objects after the lazy read.
+
+Run with ``python -m benchmark_ugraph.lazy_loading`` from ``./src``.
+"""
+
+import argparse
+import random
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+from ugraph import LinkIndex, NodeIndex
+from usage.state_network import StateNetwork
+
+from ._utils import create_ring_network, memory_growth, print_table, seconds_per_call
+
+_ACCESSED = 1_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-links", type=int, default=100_000)
+    max_links = parser.parse_args().max_links
+
+    rows = []
+    n_links = 1_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"{StateNetwork.__name__}.json"
+        while n_links <= max_links:
+            create_ring_network(n_links).write_json(path)
+            indices = random.Random(0).sample(range(n_links), _ACCESSED)
+            eager, eager_bytes = memory_growth(lambda: StateNetwork.read_json(path))
+            del eager
+            lazy, lazy_bytes = memory_growth(lambda: StateNetwork.read_json(path, lazy=True))
+            del lazy
+            rows.append(
+                (
+                    f"{n_links:,}",
+                    _milliseconds(lambda: StateNetwork.read_json(path)),
+                    f"{eager_bytes / 2**20:.1f}",
+                    _milliseconds(lambda: StateNetwork.read_json(path, lazy=True)),
+                    f"{lazy_bytes / 2**20:.1f}",
+                    _milliseconds(lambda: _access(StateNetwork.read_json(path), indices)),
+                    _milliseconds(lambda: _access(StateNetwork.read_json(path, lazy=True), indices)),
+                    _milliseconds(lambda: StateNetwork.read_json(path, lazy=True).materialise()),
+                )
+            )
+            n_links *= 10
+
+    print("time [ms] and retained memory [MiB] of reading the file")
+    print_table(
+        ("links", "eager", "eager MiB", "lazy", "lazy MiB", "eager access", "lazy access", "lazy + materialise"), rows
+    )
+
+
+def _milliseconds(function: Callable[[], object]) -> str:
+    return f"{seconds_per_call(function, number=1) * 1e3:.0f}"
+
+
+def _access(network: StateNetwork, indices: list[int]) -> None:
+    for index in indices:
+        network.node_by_index(NodeIndex(index))
+        network.link_by_index(LinkIndex(index))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Time and memory of opening a binary network file memory-mapped, compared to reading it.
+
+``read_binary(path, mapped=True)`` loads the structure and the node ids and leaves the node and link objects in the
+mapped file until they are accessed. The last columns access 1,000 nodes and links of the opened network.
+
+Run with ``python -m benchmark_ugraph.mapped`` from ``./src``.
+"""
+
+import argparse
+import random
+import tempfile
+from pathlib import Path
+
+from ugraph import LinkIndex, NodeIndex
+from usage.state_network import StateNetwork
+
+from ._utils import create_ring_network, memory_growth, print_table, seconds_per_call
+
+_ACCESSED = 1_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-links", type=int, default=1_000_000)
+    max_links = parser.parse_args().max_links
+
+    rows = []
+    n_links = 10_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"{StateNetwork.__name__}.bin"
+        while n_links <= max_links:
+            create_ring_network(n_links).write_binary(path)
+            indices = random.Random(0).sample(range(n_links), _ACCESSED)
+            read, read_bytes = memory_growth(lambda: StateNetwork.read_binary(path))
+            del read
+            mapped, mapped_bytes = memory_growth(lambda: StateNetwork.read_binary(path, mapped=True))
+            del mapped
+            rows.append(
+                (
+                    f"{n_links:,}",
+                    f"{seconds_per_call(lambda: StateNetwork.read_binary(path), number=1) * 1e3:.0f}",
+                    f"{read_bytes / 2**20:.1f}",
+                    f"{seconds_per_call(lambda: StateNetwork.read_binary(path, mapped=True), number=1) * 1e3:.0f}",
+                    f"{mapped_bytes / 2**20:.1f}",
+                    f"{seconds_per_call(lambda: _open_and_access(path, indices), number=1) * 1e3:.0f}",
+                )
+            )
+            n_links *= 10
+
+    print("time [ms] and retained memory [MiB] of opening the file")
+    print_table(("links", "read", "read MiB", "mapped", "mapped MiB", f"mapped + {_ACCESSED:,} accesses"), rows)
+
+
+def _open_and_access(path: Path, indices: list[int]) -> None:
+    network = StateNetwork.read_binary(path, mapped=True)
+    for index in indices:
+        network.node_by_index(NodeIndex(index))
+        network.link_by_index(LinkIndex(index))
+
+
+if __name__ == "__main__":
+    main()
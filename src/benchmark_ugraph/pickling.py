@@ -0,0 +1,88 @@
+"""
+Time of pickling a network and of sending it to a worker process, compared to igraph's default pickling.
+
+Networks pickle their graph in the columnar binary format (``__reduce_ex__``); "legacy" pickles the graph object with
+its per-element attribute lists, as networks did before. The worker columns submit the pickled network to a
+``ProcessPoolExecutor`` worker that unpickles it and accesses 1,000 of its nodes and links.
+
+Run with ``python -m benchmark_ugraph.pickling`` from ``./src``.
+"""
+
+import argparse
+import io
+import pickle
+import random
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from ugraph import ImmutableNetworkABC, LinkIndex, NodeIndex
+
+from ._utils import create_ring_network, print_table, seconds_per_call
+
+_ACCESSED = 1_000
+
+
+class LegacyPickler(pickle.Pickler):
+    """Pickles networks with the default ``object.__reduce_ex__``, i.e. via ``__getstate__``."""
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, ImmutableNetworkABC):
+            return object.__reduce_ex__(obj, pickle.DEFAULT_PROTOCOL)
+        return NotImplemented
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-links", type=int, default=100_000)
+    max_links = parser.parse_args().max_links
+
+    rows = []
+    n_links = 1_000
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        while n_links <= max_links:
+            network = create_ring_network(n_links)
+            indices = random.Random(0).sample(range(n_links), min(_ACCESSED, n_links))
+            legacy, current = _legacy_dumps(network), pickle.dumps(network)
+            rows.append(
+                (
+                    f"{n_links:,}",
+                    f"{len(legacy) / 2**20:.2f}",
+                    f"{len(current) / 2**20:.2f}",
+                    _milliseconds(lambda: _legacy_dumps(network)),
+                    _milliseconds(lambda: pickle.loads(legacy)),
+                    _milliseconds(lambda: pickle.dumps(network)),
+                    _milliseconds(lambda: pickle.loads(current)),
+                    _milliseconds(lambda: executor.submit(_access, _legacy_dumps(network), indices).result()),
+                    _milliseconds(lambda: executor.submit(_access, pickle.dumps(network), indices).result()),
+                )
+            )
+            n_links *= 10
+
+    print("pickle size [MiB] and time [ms]")
+    print_table(
+        ("links", "legacy MiB", "MiB", "legacy dumps", "legacy loads", "dumps", "loads", "legacy worker", "worker"),
+        rows,
+    )
+
+
+def _legacy_dumps(network: ImmutableNetworkABC) -> bytes:
+    file = io.BytesIO()
+    LegacyPickler(file, protocol=pickle.DEFAULT_PROTOCOL).dump(network)
+    return file.getvalue()
+
+
+def _milliseconds(function: Callable[[], object]) -> str:
+    return f"{seconds_per_call(function, number=1) * 1e3:.0f}"
+
+
+def _access(data: bytes, indices: list[int]) -> int:
+    network = pickle.loads(data)
+    for index in indices:
+        network.node_by_index(NodeIndex(index))
+        network.link_by_index(LinkIndex(index))
+    return network.n_count
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Figure build time and HTML size of ``add_3d_ugraph_to_figure`` with one arrow trace per link type.
+
+The arrows used to be one ``go.Cone`` trace per link, so a network with 20,000 links became a figure with 20,000
+traces. They are now one trace per link type with the midpoints and directions of all its links. The reference
+columns rebuild the per-link arrow traces as before (on top of the same edge and node traces). The HTML size excludes
+plotly.js.
+
+Run with ``python -m benchmark_ugraph.plot_arrows`` from ``./src``.
+"""
+
+import argparse
+
+import plotly.graph_objects as go
+
+from ugraph import ImmutableNetworkABC
+from ugraph.plot import ColorMap, PlotOptions, add_3d_ugraph_to_figure
+from usage.state_network import StateLinkType, StateNodeType
+
+from ._utils import create_ring_network, print_table, seconds_per_call
+
+_COLOR_MAP = ColorMap(
+    {
+        StateNodeType.RESOURCE: "green",
+        StateNodeType.INFRASTRUCTURE: "blue",
+        StateLinkType.ALLOCATION: "green",
+        StateLinkType.TRANSITION: "blue",
+    }
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-links", type=int, default=10_000)
+    max_links = parser.parse_args().max_links
+
+    rows = []
+    n_links = 100
+    while n_links <= max_links:
+        network = create_ring_network(n_links)
+        per_link = _with_per_link_arrows(network)
+        batched = add_3d_ugraph_to_figure(network, _COLOR_MAP)
+        rows.append(
+            (
+                f"{n_links:,}",
+                len(per_link.data),
+                f"{seconds_per_call(lambda: _with_per_link_arrows(network), number=1):.3f}",
+                f"{_html_mebibytes(per_link):.2f}",
+                len(batched.data),
+                f"{seconds_per_call(lambda: add_3d_ugraph_to_figure(network, _COLOR_MAP), number=1):.3f}",
+                f"{_html_mebibytes(batched):.2f}",
+            )
+        )
+        n_links *= 10
+
+    print("number of traces, build time [s] and HTML size [MiB] of the figure")
+    print_table(("links", "per link", "time", "MiB", "per type", "time", "MiB"), rows)
+
+
+def _with_per_link_arrows(network: ImmutableNetworkABC) -> go.Figure:
+    """Reference: the figure with one arrow trace per link, as built before."""
+    options = PlotOptions()
+    options.add_arrow = False
+    figure = add_3d_ugraph_to_figure(network, _COLOR_MAP, options)
+    nodes_by_id = {node.node_id: node for node in network.all_nodes}
+    arrows = []
+    for (source_id, target_id), link in network.iter_links_with_end_nodes():
+        s_cords, t_cords = nodes_by_id[source_id].coordinates, nodes_by_id[target_id].coordinates
+        arrows.append(
+            go.Cone(
+                x=[(s_cords.x + t_cords.x) * 0.5],
+                y=[(s_cords.y + t_cords.y) * 0.5],
+                z=[(s_cords.z + t_cords.z) * 0.5],
+                u=[t_cords.x - s_cords.x],
+                v=[t_cords.y - s_cords.y],
+                w=[t_cords.z - s_cords.z],
+                sizemode="absolute",
+                sizeref=options.arrow_width,
+                anchor="tail",
+                colorscale=[[0, _COLOR_MAP[link.link_type]], [1, _COLOR_MAP[link.link_type]]],
+                showscale=False,
+                name=f"Arrow: {link.link_type.name}",
+                legendgroup=link.link_type.name,
+            )
+        )
+    figure.add_traces(arrows)
+    return figure
+
+
+def _html_mebibytes(figure: go.Figure) -> float:
+    return len(figure.to_html(include_plotlyjs=False).encode("utf-8")) / 2**20
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Size and build time of a slider animation over time steps, with full frames or with delta frames.
+
+Every time step draws the same network with ``add_3d_ugraph_to_figure`` plus one marker that moves along the ring,
+like the state of a simulation on a fixed infrastructure. With full frames,
+``compose_collection_of_figures_with_slider`` copies every trace of every step into its frame; with
+``delta_frames=True`` the unchanged network traces are emitted once and the frames only carry the marker. The HTML
+size excludes plotly.js.
+
+Run with ``python -m benchmark_ugraph.plot_frames`` from ``./src``.
+"""
+
+import argparse
+
+import plotly.graph_objects as go
+
+from ugraph.plot import ColorMap, PlotOptions, add_3d_ugraph_to_figure, compose_collection_of_figures_with_slider
+from usage.state_network import StateLinkType, StateNodeType
+
+from ._utils import create_ring_network, print_table, seconds_per_call
+
+_COLOR_MAP = ColorMap(
+    {
+        StateNodeType.RESOURCE: "green",
+        StateNodeType.INFRASTRUCTURE: "blue",
+        StateLinkType.ALLOCATION: "green",
+        StateLinkType.TRANSITION: "blue",
+    }
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--links", type=int, default=10_000)
+    parser.add_argument("--steps", type=int, default=20)
+    arguments = parser.parse_args()
+
+    network = create_ring_network(arguments.links)
+    options = PlotOptions()
+    options.add_arrow = False
+    figures = []
+    for step in range(arguments.steps):
+        figure = add_3d_ugraph_to_figure(network, _COLOR_MAP, options)
+        figure.add_trace(go.Scatter3d(x=[float(step)], y=[float(step % 100)], z=[0.0], name="train", mode="markers"))
+        figures.append(figure)
+
+    rows = []
+    for delta_frames in (False, True):
+
+        def compose() -> go.Figure:
+            return compose_collection_of_figures_with_slider(figures, delta_frames=delta_frames)
+
+        composed = compose()
+        seconds = seconds_per_call(compose, 1)
+        rows.append(
+            (
+                "delta" if delta_frames else "full",
+                f"{seconds:.2f}",
+                f"{len(composed.to_html(include_plotlyjs=False).encode('utf-8')) / 2**20:.1f}",
+            )
+        )
+
+    print(f"build time [s] and HTML size [MiB] of {arguments.steps} steps over {arguments.links:,} links")
+    print_table(("frames", "time", "MiB"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Build time and size of a 2D figure drawn in full, or with WebGL traces thinned to a budget outside a focus box.
+
+``PlotOptions.renderer = "webgl"`` draws the traces with ``go.Scattergl``, and ``max_nodes``/``max_links`` thin the
+nodes and links of every type on a grid once they exceed the budget. Within ``focus_box`` (here the first 1% of the
+ring) every node and link is kept. The size is that of the figure JSON, which is what the browser has to parse and
+render. Arrows are left out.
+
+Run with ``python -m benchmark_ugraph.plot_level_of_detail`` from ``./src``.
+"""
+
+import argparse
+
+from ugraph.plot import ColorMap, PlotOptions, add_2d_ugraph_to_figure
+from usage.state_network import StateLinkType, StateNodeType
+
+from ._utils import create_ring_network, print_table, seconds_per_call
+
+_COLOR_MAP = ColorMap(
+    {
+        StateNodeType.RESOURCE: "green",
+        StateNodeType.INFRASTRUCTURE: "blue",
+        StateLinkType.ALLOCATION: "green",
+        StateLinkType.TRANSITION: "blue",
+    }
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-links", type=int, default=1_000_000)
+    parser.add_argument("--budget", type=int, default=10_000)
+    arguments = parser.parse_args()
+
+    full = PlotOptions()
+    full.add_arrow = False
+    rows = []
+    n_links = 10_000
+    while n_links <= arguments.max_links:
+        network = create_ring_network(n_links)
+        network.coordinate_column()  # the columns are built once per network, not per figure
+        thinned = PlotOptions()
+        thinned.add_arrow = False
+        thinned.renderer = "webgl"
+        thinned.max_nodes = thinned.max_links = arguments.budget
+        thinned.focus_box = (0.0, 0.0, n_links * 0.01, 100.0)
+        row = [f"{n_links:,}"]
+        for options in (full, thinned):
+            figure = add_2d_ugraph_to_figure(network, _COLOR_MAP, options)
+            row.append(f"{sum(len(trace.x) // 4 for trace in figure.data if trace.mode == 'lines'):,}")
+            row.append(f"{seconds_per_call(lambda: add_2d_ugraph_to_figure(network, _COLOR_MAP, options), 1):.3f}")
+            row.append(f"{len(figure.to_json().encode('utf-8')) / 2**20:.1f}")
+        rows.append(row)
+        n_links *= 10
+
+    print(f"drawn links, build time [s] and JSON size [MiB] of the figure, budget {arguments.budget:,} per type")
+    print_table(("links", "full", "time", "MiB", "thinned", "time", "MiB"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Build time of the edge and node traces of ``add_2d_ugraph_to_figure``, per element or from the typed columns.
+
+The traces used to be built from Python lists extended link by link, with a ``nodes_by_id`` lookup and an f-string
+hover label per link and per node. They are now gathered per type from the coordinate column and the edge list, and
+plotly renders the hover labels from the node ids in ``customdata`` and ``text`` via a ``hovertemplate``. The
+reference column repeats the previous construction. Arrows are left out of both.
+
+Run with ``python -m benchmark_ugraph.plot_traces`` from ``./src``.
+"""
+
+import argparse
+from collections import defaultdict
+
+import plotly.graph_objects as go
+
+from ugraph import ImmutableNetworkABC
+from ugraph.plot import ColorMap, PlotOptions, add_2d_ugraph_to_figure
+from usage.state_network import StateLinkType, StateNodeType
+
+from ._utils import create_ring_network, print_table, seconds_per_call
+
+_COLOR_MAP = ColorMap(
+    {
+        StateNodeType.RESOURCE: "green",
+        StateNodeType.INFRASTRUCTURE: "blue",
+        StateLinkType.ALLOCATION: "green",
+        StateLinkType.TRANSITION: "blue",
+    }
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-links", type=int, default=1_000_000)
+    max_links = parser.parse_args().max_links
+
+    options = PlotOptions()
+    options.add_arrow = False
+    rows = []
+    n_links = 1_000
+    while n_links <= max_links:
+        network = create_ring_network(n_links)
+        network.coordinate_column()  # the columns are built once per network, not per figure
+        per_element = seconds_per_call(lambda: _per_element_figure(network, options), number=1)
+        columnar = seconds_per_call(lambda: add_2d_ugraph_to_figure(network, _COLOR_MAP, options), number=1)
+        rows.append((f"{n_links:,}", f"{per_element:.3f}", f"{columnar:.3f}", f"{per_element / columnar:.1f}"))
+        n_links *= 10
+
+    print("time [s] of building the figure")
+    print_table(("links", "per element", "columnar", "speedup"), rows)
+
+
+def _per_element_figure(network: ImmutableNetworkABC, options: PlotOptions) -> go.Figure:
+    """Reference: the edge and node traces built as before."""
+    nodes_by_id = {node.node_id: node for node in network.all_nodes}
+    edges_by_type: dict = defaultdict(lambda: {"x": [], "y": [], "info": []})
+    for (source_id, target_id), link in network.iter_links_with_end_nodes():
+        s_cords, t_cords = nodes_by_id[source_id].coordinates, nodes_by_id[target_id].coordinates
+        edges = edges_by_type[link.link_type]
+        edges["x"].extend((s_cords.x, (t_cords.x + s_cords.x) * 0.5, t_cords.x, None))
+        edges["y"].extend((s_cords.y, (t_cords.y + s_cords.y) * 0.5, t_cords.y, None))
+        text = f"S:{source_id} T:{target_id},<br>link_type:{link.link_type}"
+        edges["info"].extend((text, text, text, None))
+    nodes_by_type: dict = defaultdict(lambda: {"x": [], "y": [], "name": []})
+    for node in network.all_nodes:
+        nodes = nodes_by_type[node.node_type]
+        nodes["x"].append(node.coordinates.x)
+        nodes["y"].append(node.coordinates.y)
+        nodes["name"].append(f"{node.node_id} {node.node_type.name}")
+    traces = [
+        go.Scatter(
+            x=edges["x"],
+            y=edges["y"],
+            line={"width": options.edge_width, "color": _COLOR_MAP[link_type], "dash": options.edge_dash},
+            mode="lines",
+            name=link_type.name,
+            legendgroup=link_type.name,
+            opacity=options.edge_opacity,
+            hoverinfo="text",
+            text=edges["info"],
+        )
+        for link_type, edges in edges_by_type.items()
+    ] + [
+        go.Scatter(
+            x=nodes["x"],
+            y=nodes["y"],
+            text=nodes["name"],
+            name=node_type.name,
+            mode="markers",
+            hoverinfo="x+y+text",
+            legendgroup=node_type.name,
+            marker={"size": options.node_size, "color": _COLOR_MAP[node_type], "symbol": options.node_shape},
+        )
+        for node_type, nodes in nodes_by_type.items()
+    ]
+    return go.Figure(data=traces)
+
+
+if __name__ == "__main__":
+    main()
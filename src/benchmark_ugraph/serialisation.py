@@ -0,0 +1,49 @@
+"""
+File size and write/read time of the JSON format and the columnar binary format.
+
+Run with ``python -m benchmark_ugraph.serialisation`` from ``./src``.
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from usage.state_network import StateNetwork
+
+from ._utils import create_ring_network, print_table, seconds_per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-links", type=int, default=100_000)
+    max_links = parser.parse_args().max_links
+
+    rows = []
+    n_links = 1_000
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = Path(directory) / f"{StateNetwork.__name__}.json"
+        binary_path = Path(directory) / f"{StateNetwork.__name__}.bin"
+        while n_links <= max_links:
+            network = create_ring_network(n_links)
+            timings = (
+                seconds_per_call(lambda: network.write_json(json_path), number=3),
+                seconds_per_call(lambda: StateNetwork.read_json(json_path), number=3),
+                seconds_per_call(lambda: network.write_binary(binary_path), number=3),
+                seconds_per_call(lambda: StateNetwork.read_binary(binary_path), number=3),
+            )
+            rows.append(
+                (
+                    f"{n_links:,}",
+                    f"{json_path.stat().st_size / 2**20:.2f}",
+                    f"{binary_path.stat().st_size / 2**20:.2f}",
+                    *(f"{seconds * 1e3:.1f}" for seconds in timings),
+                )
+            )
+            n_links *= 10
+
+    print("file size [MiB] and time [ms]")
+    print_table(("links", "json MiB", "binary MiB", "write_json", "read_json", "write_binary", "read_binary"), rows)
+
+
+if __name__ == "__main__":
+    main()
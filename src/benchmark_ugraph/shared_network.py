@@ -0,0 +1,74 @@
+"""
+Time of evaluating many scenarios against one network in a process pool, sending the network with every task or
+publishing it once into shared memory.
+
+Every task draws 1,000 random links of the network and counts their types. "pickled" sends the network with every
+task, "shared" publishes it once (``network.share()``, included in the time) and sends its handle.
+
+Run with ``python -m benchmark_ugraph.shared_network`` from ``./src``.
+"""
+
+import argparse
+import random
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+from ugraph import LinkIndex, SharedNetworkHandle
+from usage.state_network import StateLinkType, StateNetwork
+
+from ._utils import create_ring_network, print_table, seconds_per_call
+
+_SAMPLED = 1_000
+_WORKERS = 4
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--links", type=int, default=100_000)
+    parser.add_argument("--max-tasks", type=int, default=1_000)
+    arguments = parser.parse_args()
+
+    network = create_ring_network(arguments.links)
+    rows = []
+    n_tasks = 10
+    with ProcessPoolExecutor(max_workers=_WORKERS) as executor:
+        while n_tasks <= arguments.max_tasks:
+            seeds = range(n_tasks)
+            rows.append(
+                (
+                    f"{n_tasks:,}",
+                    _milliseconds(lambda: list(executor.map(_pickled_scenario, [network] * n_tasks, seeds))),
+                    _milliseconds(lambda: _run_shared(executor, network, seeds)),
+                )
+            )
+            n_tasks *= 10
+
+    print(f"time [ms] of evaluating the scenarios on {_WORKERS} workers, {arguments.links:,} links")
+    print_table(("tasks", "pickled", "shared"), rows)
+
+
+def _run_shared(executor: ProcessPoolExecutor, network: StateNetwork, seeds: range) -> None:
+    with network.share() as handle:
+        list(executor.map(_shared_scenario, [handle] * len(seeds), seeds))
+
+
+def _pickled_scenario(network: StateNetwork, seed: int) -> Counter[StateLinkType]:
+    return _scenario(network, seed)
+
+
+def _shared_scenario(handle: SharedNetworkHandle[StateNetwork], seed: int) -> Counter[StateLinkType]:
+    return _scenario(handle.open(), seed)
+
+
+def _scenario(network: StateNetwork, seed: int) -> Counter[StateLinkType]:
+    sampled = random.Random(seed).sample(range(network.l_count), _SAMPLED)
+    return Counter(network.link_by_index(LinkIndex(index)).link_type for index in sampled)
+
+
+def _milliseconds(function: Callable[[], object]) -> str:
+    return f"{seconds_per_call(function, number=1) * 1e3:.0f}"
+
+
+if __name__ == "__main__":
+    main()
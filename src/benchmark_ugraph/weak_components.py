@@ -0,0 +1,76 @@
+"""
+Weak components after every small edit: recomputed from scratch against maintained incrementally.
+
+The network consists of short chains, i.e. of many small components. Every edit either links two random nodes or
+deletes a random link; afterwards the component of the edited node is looked up. Previously this required
+``weak_components()``, which recomputes the membership and materialises every component as a new network. The
+incremental index merges components on insertion and only recomputes the touched component on deletion.
+
+Run with ``python -m benchmark_ugraph.weak_components`` from ``./src``.
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+from ugraph import EndNodeIdPair, LinkIndex, NodeIndex
+from usage.state_network import StateLink, StateLinkType, StateNetwork
+
+from ._utils import create_ring_elements, print_table
+
+_CHAIN_LENGTH = 10
+_EDITS = 20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--max-nodes", type=int, default=100_000)
+    max_nodes = parser.parse_args().max_nodes
+
+    rows = []
+    n_nodes = 1_000
+    while n_nodes <= max_nodes:
+        network = create_chains(n_nodes)
+        from_scratch = _seconds_per_edit(network, lambda edited: len(StateNetwork.weak_components(edited)))
+        incremental = _seconds_per_edit(network, lambda edited: edited.component_id_of(NodeIndex(0)))
+        sizes = _seconds_per_edit(network, lambda edited: len(edited.component_sizes()))
+        rows.append(
+            (
+                f"{n_nodes:,}",
+                f"{from_scratch * 1e3:.2f}",
+                f"{incremental * 1e3:.3f}",
+                f"{sizes * 1e3:.2f}",
+                f"{from_scratch / incremental:.0f}",
+            )
+        )
+        n_nodes *= 10
+
+    print("time per edit [ms]")
+    print_table(("nodes", "weak_components()", "component_id_of", "component_sizes", "speedup"), rows)
+
+
+def create_chains(n_nodes: int) -> StateNetwork:
+    """Return ``n_nodes`` nodes arranged as chains of ``_CHAIN_LENGTH`` nodes."""
+    nodes, links = create_ring_elements(n_nodes)
+    chains = [link for i, link in enumerate(links) if (i + 1) % _CHAIN_LENGTH]
+    return StateNetwork.create_new(nodes, chains)
+
+
+def _seconds_per_edit(network: StateNetwork, query: Callable[[StateNetwork], object]) -> float:
+    edited = network.copy()
+    query(edited)  # build the derived data once, as it would be after the previous validation
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for edit in range(_EDITS):
+        if edit % 2 == 0:
+            source, target = (edited.node_id_by_index(i) for i in rng.sample(range(edited.n_count), 2))
+            edited.add_links([(EndNodeIdPair((source, target)), StateLink(StateLinkType.TRANSITION))])
+        else:
+            edited.delete_links([LinkIndex(rng.randrange(edited.l_count))])
+        query(edited)
+    return (time.perf_counter() - start) / _EDITS
+
+
+if __name__ == "__main__":
+    main()
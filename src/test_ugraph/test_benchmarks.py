@@ -0,0 +1,22 @@
+import unittest
+
+from benchmark_ugraph._utils import create_ring_elements
+from benchmark_ugraph.construction import create_per_element, measure_construction
+from usage.state_network import StateNetwork
+
+
+class TestConstructionBenchmark(unittest.TestCase):
+    def test_bulk_construction_matches_per_element_construction(self) -> None:
+        nodes, links = create_ring_elements(1_000)
+        bulk = StateNetwork.create_new(nodes, links)
+        per_element = create_per_element(nodes, links)
+        self.assertEqual(bulk.node_ids, per_element.node_ids)
+        self.assertEqual(bulk.all_nodes, per_element.all_nodes)
+        self.assertEqual(bulk.all_links, per_element.all_links)
+        self.assertEqual(list(bulk.iter_edge_tuples()), list(per_element.iter_edge_tuples()))
+
+    def test_construction_benchmark_runs(self) -> None:
+        # the speedup itself is checked by running the benchmark (``devtools --bench``), not by the unit tests
+        per_element, bulk = measure_construction(1_000)
+        self.assertGreater(per_element, 0.0)
+        self.assertGreater(bulk, 0.0)
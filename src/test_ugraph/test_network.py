@@ -0,0 +1,551 @@
+import pickle
+import random
+import unittest
+from dataclasses import replace
+
+from ugraph import EndNodeIdPair, LinkIndex, NodeId, NodeIndex, ThreeDCoordinates, node_distance
+from usage.create_state_network_example import create_example_state_railway_network
+from usage.state_network import StateLink, StateLinkType, StateNode, StateNodeType
+
+
+def _create_node(node_id: str) -> StateNode:
+    return StateNode(
+        node_id=NodeId(node_id), coordinates=ThreeDCoordinates(0, 0, 0), node_type=StateNodeType.INFRASTRUCTURE
+    )
+
+
+class TestNodeIdIndex(unittest.TestCase):
+    def assert_index_consistent(self, network) -> None:  # type: ignore
+        for i, node_id in enumerate(network.node_ids):
+            self.assertEqual(network.node_index_by_id(node_id), i)
+            self.assertTrue(network.has_node_id(node_id))
+
+    def test_lookup(self) -> None:
+        network = create_example_state_railway_network()
+        self.assert_index_consistent(network)
+        self.assertEqual(network.node_by_id(NodeId("3_forward")).node_id, "3_forward")
+        self.assertFalse(network.has_node_id(NodeId("unknown")))
+        with self.assertRaises(ValueError):
+            network.node_index_by_id(NodeId("unknown"))
+
+    def test_lookup_takes_ints_as_indices(self) -> None:
+        network = create_example_state_railway_network()
+        last = network.n_count - 1
+
+        self.assertEqual(3, network.node_index_by_id(3))  # type: ignore[arg-type]
+        self.assertEqual(last, network.node_index_by_id(-1))  # type: ignore[arg-type]
+        self.assertEqual([last, 2], network.node_indices_by_ids([network.node_ids[last], 2]))  # type: ignore[list-item]
+        with self.assertRaises(IndexError):
+            network.node_index_by_id(network.n_count)  # type: ignore[arg-type]
+
+    def test_index_follows_rename_through_underlying_digraph(self) -> None:
+        network = create_example_state_railway_network()
+        network.node_index_by_id(NodeId("0"))  # build the index before mutating
+
+        network.underlying_digraph.vs[0]["name"] = "z"
+
+        self.assertEqual(network.node_index_by_id(NodeId("z")), 0)
+        self.assertFalse(network.has_node_id(NodeId("0_forward")))
+
+    def test_reading_the_graph_keeps_the_indices(self) -> None:
+        network = create_example_state_railway_network()
+        network.node_index_by_id(NodeId("0"))  # build the index before reading the graph
+        copied = network.copy()
+        view = network.view(node_indices=[NodeIndex(0), NodeIndex(1)])
+        version = network.version
+
+        self.assertTrue(network.read_only_digraph.is_directed())
+
+        self.assertEqual(version, network.version)
+        self.assertIsNotNone(network._node_id_index._mapping)  # pylint: disable=protected-access
+        self.assertIs(network.read_only_digraph, copied.read_only_digraph)
+        self.assertEqual(view.node_ids, network.node_ids[:2])
+
+    def test_batch_lookup(self) -> None:
+        network = create_example_state_railway_network()
+        ids = [NodeId("5"), NodeId("0_forward"), NodeId("2_backward")]
+        self.assertEqual(network.node_indices_by_ids(ids), [network.node_index_by_id(i) for i in ids])
+        nodes = network.nodes_by_ids(ids + [NodeId("unknown")])
+        self.assertEqual({n.node_id for n in nodes}, set(ids))
+        with self.assertRaises(ValueError):
+            network.node_indices_by_ids([NodeId("unknown")])
+
+    def test_index_follows_mutations(self) -> None:
+        network = create_example_state_railway_network()
+        network.node_index_by_id(NodeId("0"))  # build the index before mutating
+
+        network.add_nodes([_create_node("isolated_a"), _create_node("isolated_b")])
+        self.assert_index_consistent(network)
+
+        network.replace_node(network.node_index_by_id(NodeId("isolated_a")), _create_node("renamed"), renamed=True)
+        self.assertFalse(network.has_node_id(NodeId("isolated_a")))
+        self.assert_index_consistent(network)
+        with self.assertRaises(AssertionError):
+            network.replace_node(NodeIndex(0), _create_node("renamed"), renamed=True)
+
+        network.delete_nodes([NodeId("0_forward")])
+        self.assertFalse(network.has_node_id(NodeId("0_forward")))
+        self.assert_index_consistent(network)
+
+        network.remove_isolated_nodes()
+        self.assertFalse(network.has_node_id(NodeId("renamed")))
+        self.assert_index_consistent(network)
+
+        network.delete_nodes_with_type(frozenset((StateNodeType.RESOURCE,)))
+        self.assertFalse(network.has_node_id(NodeId("1")))
+        self.assert_index_consistent(network)
+
+        sub_network = network.sub_network([NodeId("1_forward"), NodeId("2_forward")])
+        self.assertEqual(sub_network.n_count, 2)
+        self.assert_index_consistent(sub_network)
+
+    def test_add_links_resolves_ids(self) -> None:
+        network = create_example_state_railway_network()
+        network.add_nodes({NodeId("new"): _create_node("new")})
+        network.add_links([(EndNodeIdPair((NodeId("new"), NodeId("0_forward"))), StateLink(StateLinkType.TRANSITION))])
+        self.assertEqual(network.link_end_node_id_pair_by_index(LinkIndex(network.l_count - 1)), ("new", "0_forward"))
+        with self.assertRaises(ValueError):
+            network.add_links(
+                [(EndNodeIdPair((NodeId("new"), NodeId("unknown"))), StateLink(StateLinkType.TRANSITION))]
+            )
+
+    def test_append_skips_existing_ids(self) -> None:
+        network = create_example_state_railway_network()
+        other = network.copy()
+        other.add_nodes([_create_node("new")])
+        network.append_(other.sub_network([NodeId("new"), NodeId("0")]))
+        self.assertEqual(network.n_count, 25)
+        self.assert_index_consistent(network)
+
+
+class TestAccessors(unittest.TestCase):
+    def test_single_element_accessors_match_columns(self) -> None:
+        network = create_example_state_railway_network()
+        for i, (node_id, node) in enumerate(zip(network.node_ids, network.all_nodes)):
+            self.assertEqual(network.node_id_by_index(NodeIndex(i)), node_id)
+            self.assertIs(network.node_by_index(NodeIndex(i)), node)
+        for i, link in enumerate(network.all_links):
+            self.assertIs(network.link_by_index(LinkIndex(i)), link)
+
+    def test_batch_accessors(self) -> None:
+        network = create_example_state_railway_network()
+        indices = [NodeIndex(5), NodeIndex(2), NodeIndex(5)]
+        self.assertEqual(network.node_ids_by_indices(indices), [network.node_ids[i] for i in indices])
+        self.assertEqual(network.nodes_by_indices(indices), [network.all_nodes[i] for i in indices])
+        self.assertEqual(network.links_by_indices([LinkIndex(3)]), [network.all_links[3]])
+        self.assertEqual(network.nodes_by_indices([]), [])
+        self.assertEqual(network.links_by_indices([]), [])
+
+        node_index = network.node_index_by_id(NodeId("1_forward"))
+        incident = network.incident_link_idx_per_node(node_index, mode="out")
+        self.assertEqual(
+            network.incident_links_per_node(node_index, mode="out"), [network.all_links[i] for i in incident]
+        )
+
+
+class TestColumns(unittest.TestCase):
+    def assert_columns_consistent(self, network) -> None:  # type: ignore
+        self.assertEqual(list(network.node_type_column()), [n.node_type for n in network.all_nodes])
+        self.assertEqual(list(network.link_type_column()), [link.link_type for link in network.all_links])
+        coordinates = network.coordinate_column()
+        for i, node in enumerate(network.all_nodes):
+            c = node.coordinates
+            self.assertEqual(list(coordinates[3 * i : 3 * i + 3]), [c.x, c.y, c.z])
+
+    def test_columns_follow_mutations(self) -> None:
+        network = create_example_state_railway_network()
+        self.assert_columns_consistent(network)
+
+        network.add_nodes([_create_node("new")])
+        network.add_links([(EndNodeIdPair((NodeId("new"), NodeId("0"))), StateLink(StateLinkType.ALLOCATION))])
+        self.assert_columns_consistent(network)
+
+        moved = StateNode(node_id=NodeId("new"), coordinates=ThreeDCoordinates(1, 2, 3), node_type=StateNodeType.AGENT)
+        network.replace_node(network.node_index_by_id(NodeId("new")), moved)
+        network.replace_link(LinkIndex(0), StateLink(StateLinkType.OCCUPATION))
+        self.assert_columns_consistent(network)
+
+        network.delete_links([LinkIndex(1), LinkIndex(4)])
+        self.assert_columns_consistent(network)
+        network.delete_nodes([NodeId("0_forward"), NodeIndex(3)])
+        self.assert_columns_consistent(network)
+        network.delete_links_with_type(frozenset((StateLinkType.ALLOCATION,)))
+        self.assertNotIn(StateLinkType.ALLOCATION, network.link_type_column())
+        self.assert_columns_consistent(network)
+
+    def test_columns_follow_edits_through_underlying_digraph(self) -> None:
+        network = create_example_state_railway_network()
+        self.assert_columns_consistent(network)
+
+        moved = StateNode(
+            node_id=NodeId("0_forward"), coordinates=ThreeDCoordinates(7, 8, 9), node_type=StateNodeType.AGENT
+        )
+        network.underlying_digraph.vs[0]["node"] = moved
+        network.underlying_digraph.es[0]["link"] = StateLink(StateLinkType.OCCUPATION)
+
+        self.assert_columns_consistent(network)
+        self.assertEqual(network.node_indices_of_type(frozenset((StateNodeType.AGENT,))), [0])
+        self.assertEqual(
+            network.node_distances([(NodeIndex(0), NodeIndex(1))]),
+            [node_distance(moved, network.node_by_index(NodeIndex(1)))],
+        )
+
+    def test_type_filters(self) -> None:
+        network = create_example_state_railway_network()
+        network.delete_links_without_type(frozenset((StateLinkType.TRANSITION,)))
+        self.assertEqual(set(network.link_type_column()), {StateLinkType.TRANSITION})
+        network.delete_nodes_with_type(frozenset((StateNodeType.RESOURCE,)))
+        self.assertEqual(set(network.node_type_column()), {StateNodeType.INFRASTRUCTURE})
+        self.assert_columns_consistent(network)
+
+    def test_link_lengths(self) -> None:
+        network = create_example_state_railway_network()
+        expected = [
+            node_distance(network.node_by_index(s), network.node_by_index(t)) for s, t in network.iter_edge_tuples()
+        ]
+        self.assertEqual(network.link_lengths(), expected)
+
+
+class TestTypeIndex(unittest.TestCase):
+    def assert_type_index_consistent(self, network) -> None:  # type: ignore
+        for node_type in StateNodeType:
+            expected = [i for i, n in enumerate(network.all_nodes) if n.node_type == node_type]
+            self.assertEqual(network.node_indices_of_type(frozenset((node_type,))), expected)
+        for link_type in StateLinkType:
+            expected = [i for i, link in enumerate(network.all_links) if link.link_type == link_type]
+            self.assertEqual(network.link_indices_of_type(frozenset((link_type,))), expected)
+
+    def test_queries(self) -> None:
+        network = create_example_state_railway_network()
+        resources = network.nodes_of_type(frozenset((StateNodeType.RESOURCE,)))
+        self.assertEqual(len(resources), 8)
+        self.assertTrue(all(n.node_type == StateNodeType.RESOURCE for n in resources))
+        both = frozenset((StateNodeType.RESOURCE, StateNodeType.INFRASTRUCTURE))
+        self.assertEqual(network.node_indices_of_type(both), list(range(network.n_count)))
+        self.assertEqual(len(network.links_of_type(frozenset((StateLinkType.ALLOCATION,)))), 16)
+        self.assertEqual(network.links_of_type(frozenset((StateLinkType.OCCUPATION,))), [])
+
+    def test_index_follows_mutations(self) -> None:
+        network = create_example_state_railway_network()
+        self.assert_type_index_consistent(network)
+
+        network.add_nodes([_create_node("new")])
+        network.add_links([(EndNodeIdPair((NodeId("new"), NodeId("0"))), StateLink(StateLinkType.ALLOCATION))])
+        self.assert_type_index_consistent(network)
+
+        agent = StateNode(
+            node_id=NodeId("0_forward"), coordinates=ThreeDCoordinates(0, 0, 0), node_type=StateNodeType.AGENT
+        )
+        network.replace_node(network.node_index_by_id(NodeId("0_forward")), agent)
+        network.replace_link(LinkIndex(5), StateLink(StateLinkType.RESERVATION))
+        self.assert_type_index_consistent(network)
+
+        network.delete_nodes_with_type(frozenset((StateNodeType.AGENT,)))
+        network.delete_links_with_type(frozenset((StateLinkType.RESERVATION,)))
+        self.assert_type_index_consistent(network)
+
+    def test_reductions_match_copy_and_delete(self) -> None:
+        rng = random.Random(0)
+        network = create_example_state_railway_network()
+        # igraph builds small subgraphs of large graphs from scratch, in another link order, unless told otherwise
+        network.add_nodes(
+            [replace(_create_node(f"new_{i}"), node_type=rng.choice(list(StateNodeType))) for i in range(4000)]
+        )
+        node_ids = network.node_ids
+        network.add_links(
+            [
+                (EndNodeIdPair(tuple(rng.sample(node_ids, 2))), StateLink(rng.choice(list(StateLinkType))))
+                for _ in range(8000)
+            ]
+        )
+        resource, infrastructure, agent = StateNodeType.RESOURCE, StateNodeType.INFRASTRUCTURE, StateNodeType.AGENT
+        for reduce, types in (
+            (network.reduce_to_agent_network, (agent,)),
+            (network.reduce_to_resource_network, (resource,)),
+            (network.reduce_to_transition_network, (infrastructure,)),
+            (network.reduce_to_resource_and_infrastructure_network, (resource, infrastructure)),
+            (network.reduce_to_infrastructure_and_agent_network, (infrastructure, agent)),
+        ):
+            reduced = reduce()
+            expected = network.copy()
+            expected.delete_nodes_without_type(frozenset(types))
+            self.assertEqual(reduced.node_ids, expected.node_ids)
+            self.assertEqual(reduced.all_links, expected.all_links)
+            self.assertEqual(list(reduced.iter_edge_tuples()), list(expected.iter_edge_tuples()))
+
+
+class TestNetworkView(unittest.TestCase):
+    def test_view_matches_materialised_sub_network(self) -> None:
+        network = create_example_state_railway_network()
+        view = network.view(network.node_indices_of_type(frozenset((StateNodeType.INFRASTRUCTURE,))))
+        expected = network.reduce_to_transition_network()
+
+        self.assertEqual((view.n_count, view.l_count), (expected.n_count, expected.l_count))
+        self.assertEqual(view.node_ids, expected.node_ids)
+        self.assertEqual(view.all_nodes, expected.all_nodes)
+        self.assertEqual(list(view.iter_links_with_end_nodes()), list(expected.iter_links_with_end_nodes()))
+        self.assertEqual(view.in_degrees(), expected.in_degrees())
+        self.assertEqual(view.out_degrees(), expected.out_degrees())
+        self.assertEqual(view.degrees(), expected.degrees())
+        self.assertEqual(
+            view.neighbors(NodeId("1_forward"), mode="out"), expected.neighbors(NodeId("1_forward"), "out")
+        )
+        self.assertEqual([c.node_ids for c in view.weak_components()], [c.node_ids for c in expected.weak_components()])
+        self.assertEqual(view.is_dag(), expected.read_only_digraph.is_dag())
+        self.assertEqual(view.is_simple(), expected.read_only_digraph.is_simple())
+
+        materialised = view.materialise()
+        self.assertIsInstance(materialised, network.__class__)
+        self.assertEqual(list(materialised.iter_links_with_end_nodes()), list(expected.iter_links_with_end_nodes()))
+
+    def test_link_mask(self) -> None:
+        network = create_example_state_railway_network()
+        allocations = network.link_indices_of_type(frozenset((StateLinkType.ALLOCATION,)))
+        view = network.view(link_indices=allocations)
+        self.assertEqual(view.n_count, network.n_count)
+        self.assertEqual(view.link_indices, allocations)
+        self.assertEqual(len(view.weak_components()), 8)
+        self.assertEqual(view.materialise().l_count, len(allocations))
+        self.assertEqual(view.neighbors(NodeId("0"), mode="out"), [])
+        self.assertEqual(len(view.neighbors(NodeId("0"), mode="in")), 2)
+
+    def test_cycles_and_outside_nodes(self) -> None:
+        network = create_example_state_railway_network()
+        network.add_links(
+            [(EndNodeIdPair((NodeId("1_forward"), NodeId("0_forward"))), StateLink(StateLinkType.TRANSITION))]
+        )
+        view = network.view(network.node_indices_of_type(frozenset((StateNodeType.INFRASTRUCTURE,))))
+        self.assertFalse(view.is_dag())
+        self.assertTrue(view.is_simple())
+        with self.assertRaises(ValueError):
+            view.neighbors(NodeId("0"))
+
+    def test_small_views_build_the_same_structure_from_the_selected_links(self) -> None:
+        rng = random.Random(0)
+        network = create_example_state_railway_network()
+        network.add_links(
+            [
+                (EndNodeIdPair(tuple(rng.choices(network.node_ids, k=2))), StateLink(StateLinkType.TRANSITION))
+                for _ in range(40)
+            ]
+        )
+        for _ in range(20):
+            node_indices = rng.sample(range(network.n_count), rng.randrange(1, network.n_count))
+            link_indices = rng.sample(range(network.l_count), rng.randrange(network.l_count))
+            for view in (
+                network.view(node_indices),
+                network.view(link_indices=link_indices),
+                network.view(node_indices, link_indices),
+            ):
+                # pylint: disable=protected-access
+                selected = view._selected_structure(network.read_only_digraph)
+                thinned = view._thinned_structure(network.read_only_digraph)
+                self.assertEqual(selected.vcount(), thinned.vcount())
+                self.assertEqual(selected.get_edgelist(), thinned.get_edgelist())
+                self.assertEqual(selected.es["link_index"], thinned.es["link_index"])
+
+    def test_view_detects_mutation(self) -> None:
+        network = create_example_state_railway_network()
+        view = network.view()
+        network.add_nodes([_create_node("new")])
+        with self.assertRaises(RuntimeError):
+            _ = view.all_nodes
+
+
+class TestCopyOnWrite(unittest.TestCase):
+    def test_copy_shares_graph_until_mutation(self) -> None:
+        network = create_example_state_railway_network()
+        copied = network.copy()
+        self.assertIs(copied._underlying_digraph, network._underlying_digraph)  # pylint: disable=protected-access
+        copied.add_nodes([_create_node("new")])
+        self.assertIsNot(copied._underlying_digraph, network._underlying_digraph)  # pylint: disable=protected-access
+        self.assertFalse(network.has_node_id(NodeId("new")))
+        self.assertEqual(copied.n_count, network.n_count + 1)
+        self.assertEqual(copied.node_index_by_id(NodeId("new")), network.n_count)
+
+    def test_mutating_original_keeps_copies(self) -> None:
+        network = create_example_state_railway_network()
+        first, second = network.copy(), network.copy()
+        links_before = network.all_links
+        network.delete_links_with_type(frozenset((StateLinkType.TRANSITION,)))
+        network.replace_node(NodeIndex(0), _create_node("renamed"), renamed=True)
+        for copied in (first, second):
+            self.assertEqual(copied.all_links, links_before)
+            self.assertFalse(copied.has_node_id(NodeId("renamed")))
+            self.assertEqual(copied.node_type_column(), first.node_type_column())
+        second.delete_nodes([NodeIndex(0)])
+        self.assertEqual(first.n_count, second.n_count + 1)
+
+    def test_escape_hatch_and_pickling_detach(self) -> None:
+        network = create_example_state_railway_network()
+        copied = network.copy()
+        copied.underlying_digraph.delete_vertices([0])
+        self.assertEqual(network.n_count, copied.n_count + 1)
+        first, second = pickle.loads(pickle.dumps([network, network.copy()]))
+        first.delete_nodes([NodeIndex(0)])
+        self.assertEqual(second.n_count, network.n_count)
+
+
+class TestBatch(unittest.TestCase):
+    def test_batch_matches_individual_mutations(self) -> None:
+        expected, network = create_example_state_railway_network(), create_example_state_railway_network()
+        new_nodes = [_create_node("new_0"), _create_node("new_1")]
+        new_links = [(EndNodeIdPair((NodeId("new_0"), NodeId("new_1"))), StateLink(StateLinkType.TRANSITION))]
+        renamed = _create_node("renamed")
+        with network.batch() as queued:
+            network.add_nodes(new_nodes)
+            network.add_links(new_links)
+            network.replace_node(NodeIndex(2), renamed, renamed=True)
+            network.delete_links([LinkIndex(0), LinkIndex(3)])
+            network.delete_nodes([NodeIndex(5), NodeId("0_forward")])
+            network.delete_links([LinkIndex(3)])
+            self.assertEqual(network.n_count, expected.n_count)  # nothing applied yet
+            self.assertEqual(len(queued), 8)
+        expected.replace_node(NodeIndex(2), renamed, renamed=True)
+        expected.add_nodes(new_nodes)
+        expected.add_links(new_links)
+        expected.delete_links([LinkIndex(0), LinkIndex(3)])
+        expected.delete_nodes([NodeIndex(5), expected.node_index_by_id(NodeId("0_forward"))])
+        self.assertEqual(network.node_ids, expected.node_ids)
+        self.assertEqual(list(network.iter_links_with_end_nodes()), list(expected.iter_links_with_end_nodes()))
+        self.assertEqual(network.node_index_by_id(NodeId("new_1")), expected.node_index_by_id(NodeId("new_1")))
+        self.assertEqual(network.node_type_column(), expected.node_type_column())
+
+    def test_failing_block_discards_changes(self) -> None:
+        network = create_example_state_railway_network()
+        links_before = network.all_links
+        with self.assertRaises(KeyError):
+            with network.batch():
+                network.delete_links([LinkIndex(0)])
+                raise KeyError("abort")
+        self.assertEqual(network.all_links, links_before)
+        network.delete_links([LinkIndex(0)])  # the batch is closed, mutations apply immediately
+        self.assertEqual(network.l_count, len(links_before) - 1)
+
+    def test_failed_validation_rolls_back(self) -> None:
+        network = create_example_state_railway_network()
+        copied = network.copy()
+        nodes_before, links_before = network.all_nodes, network.all_links
+        with self.assertRaises(ValueError):
+            with network.batch(validate=lambda updated: updated.n_count == len(nodes_before)):
+                network.add_nodes([_create_node("new")])
+                network.delete_links([LinkIndex(1)])
+        self.assertEqual((network.all_nodes, network.all_links), (nodes_before, links_before))
+        self.assertFalse(network.has_node_id(NodeId("new")))
+        with network.batch(validate=lambda updated: updated.validate_topology()):
+            network.delete_links([LinkIndex(1)])
+        self.assertEqual(network.l_count, len(links_before) - 1)
+        self.assertEqual(copied.all_links, links_before)
+
+
+class TestVersionAndCache(unittest.TestCase):
+    def test_mutators_bump_versions(self) -> None:
+        network = create_example_state_railway_network()
+        versions = [(network.version, network.structural_version)]
+        network.replace_link(LinkIndex(0), network.link_by_index(LinkIndex(0)))
+        versions.append((network.version, network.structural_version))
+        network.add_nodes([_create_node("new")])
+        versions.append((network.version, network.structural_version))
+        network.delete_links([LinkIndex(0)])
+        versions.append((network.version, network.structural_version))
+        self.assertEqual([v for v, _ in versions], sorted(set(v for v, _ in versions)))
+        self.assertEqual(versions[0][1], versions[1][1])
+        self.assertLess(versions[1][1], versions[2][1])
+        self.assertLess(versions[2][1], versions[3][1])
+
+    def test_cached_results_follow_mutations(self) -> None:
+        network = create_example_state_railway_network()
+        calls: list[int] = []
+
+        def count_nodes(counted) -> int:  # type: ignore
+            calls.append(1)
+            return counted.n_count
+
+        self.assertEqual(network.cached("n", count_nodes), network.cached("n", count_nodes))
+        self.assertEqual(network.cached("n", count_nodes, structural=True), network.n_count)
+        self.assertEqual(len(calls), 1)
+        network.replace_node(NodeIndex(0), network.node_by_index(NodeIndex(0)))
+        network.cached("n", count_nodes, structural=True)
+        self.assertEqual(len(calls), 1)
+        network.cached("n", count_nodes)
+        self.assertEqual(len(calls), 2)
+        network.add_nodes([_create_node("new")])
+        self.assertEqual(network.cached("n", count_nodes, structural=True), network.n_count)
+        self.assertEqual(len(calls), 3)
+        for key in range(100):
+            network.cached(key, count_nodes)
+        self.assertLessEqual(len(network._derived), 32)  # pylint: disable=protected-access
+
+    def test_memoised_graph_properties(self) -> None:
+        network = create_example_state_railway_network()
+        expected = network.copy()
+        self.assertEqual(network.is_dag(), expected.read_only_digraph.is_dag())
+        self.assertEqual(network.is_simple(), expected.read_only_digraph.is_simple())
+        order = network.topological_order()
+        position = {index: i for i, index in enumerate(order)}
+        self.assertTrue(all(position[s] < position[t] for s, t in network.iter_edge_tuples()))
+        network.add_links(
+            [
+                (
+                    EndNodeIdPair((network.node_id_by_index(order[-1]), network.node_ids[order[0]])),
+                    StateLink(StateLinkType.TRANSITION),
+                )
+            ]
+        )
+        self.assertFalse(network.is_dag())
+        with self.assertRaises(ValueError):
+            network.topological_order()
+        self.assertTrue(expected.is_dag())
+
+
+class TestWeakComponents(unittest.TestCase):
+    def assert_components_match_igraph(self, network) -> None:  # type: ignore
+        graph = network.read_only_digraph
+        expected = [members for members in graph.connected_components(mode="weak")]
+        self.assertEqual(network.component_sizes(), {members[0]: len(members) for members in expected})
+        for members in expected:
+            self.assertEqual({network.component_id_of(NodeIndex(i)) for i in members}, {members[0]})
+        self.assertEqual(
+            [c.node_ids for c in network.weak_components()],
+            [network.node_ids_by_indices(members) for members in expected],
+        )
+
+    def test_components_follow_mutations(self) -> None:
+        rng = random.Random(0)
+        network = create_example_state_railway_network()
+        self.assert_components_match_igraph(network)
+        for step in range(60):
+            action = step % 4
+            if action == 0:
+                network.add_nodes([_create_node(f"new_{step}")])
+            elif action == 1:
+                source, target = rng.sample(network.node_ids, 2)
+                network.add_links([(EndNodeIdPair((source, target)), StateLink(StateLinkType.TRANSITION))])
+            elif action == 2:
+                network.delete_links(rng.sample(range(network.l_count), min(2, network.l_count)))
+            elif step % 12 == 3:
+                network.delete_nodes([NodeIndex(rng.randrange(network.n_count))])
+            self.assert_components_match_igraph(network)
+
+    def test_components_follow_rewiring_through_underlying_digraph(self) -> None:
+        network = create_example_state_railway_network()
+        network.add_nodes([_create_node("isolated")])
+        self.assert_components_match_igraph(network)  # build the index before rewiring
+
+        graph = network.underlying_digraph
+        graph.delete_edges([0])
+        graph.add_edge(network.n_count - 1, 0, link=StateLink(StateLinkType.TRANSITION))
+
+        self.assertEqual(network.component_id_of(NodeIndex(network.n_count - 1)), network.component_id_of(NodeIndex(0)))
+        self.assert_components_match_igraph(network)
+
+    def test_lazy_components(self) -> None:
+        network = create_example_state_railway_network()
+        node_id = network.node_ids[-1]
+        component = network.weak_component(network.component_id_of(node_id))
+        self.assertIn(node_id, component.node_ids)
+        self.assertEqual(component.n_count, network.component_sizes()[network.component_id_of(node_id)])
+        first = next(network.iter_weak_components())
+        self.assertEqual(first.node_ids, network.weak_components()[0].node_ids)
+        with self.assertRaises(ValueError):
+            network.weak_component(network.n_count)
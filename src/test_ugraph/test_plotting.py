@@ -1,8 +1,17 @@
+import math
+import tempfile
 import unittest
 from pathlib import Path
 
+import igraph
+import plotly.graph_objects as go
+
+from ugraph import LinkIndex, NodeIndex
+from ugraph._abc import _debug
 from ugraph.plot import (
     ColorMap,
+    PlotOptions,
+    add_2d_ugraph_to_figure,
     add_3d_ugraph_to_figure,
     compose_collection_of_figures_with_slider,
     compose_with_dropdown,
@@ -11,6 +20,17 @@ from usage.create_state_network_example import create_example_state_railway_netw
 from usage.state_network import StateLinkType, StateNodeType
 
 
+_COLOR_MAP = ColorMap(
+    {
+        StateNodeType.RESOURCE: "green",
+        StateNodeType.INFRASTRUCTURE: "blue",
+        StateLinkType.ALLOCATION: "green",
+        StateLinkType.TRANSITION: "blue",
+        StateLinkType.OCCUPATION: "purple",
+    }
+)
+
+
 class TestUgraphPlot(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -68,3 +88,135 @@ class TestUgraphPlot(unittest.TestCase):
         network = create_example_state_railway_network()
 
         network.debug_plot(with_labels=True, file_name="test_plot.png")
+
+    def test_arrows_are_one_trace_per_link_type(self):
+        network = create_example_state_railway_network()
+        link_types = list(dict.fromkeys(link.link_type for link in network.all_links))
+        source, target = network.nodes_by_indices(network.link_source_target_by_index(LinkIndex(0)))
+
+        for add_to_figure in (add_2d_ugraph_to_figure, add_3d_ugraph_to_figure):
+            arrows = [trace for trace in add_to_figure(network, _COLOR_MAP).data if isinstance(trace, go.Cone)]
+
+            self.assertEqual([f"Arrow: {link_type.name}" for link_type in link_types], [a.name for a in arrows])
+            self.assertEqual(network.l_count, sum(len(arrow.x) for arrow in arrows))
+            self.assertEqual(
+                [[0, _COLOR_MAP[link_types[0]]], [1, _COLOR_MAP[link_types[0]]]],
+                [list(stop) for stop in arrows[0].colorscale],
+            )
+            self.assertEqual(
+                ((source.coordinates.x + target.coordinates.x) * 0.5, target.coordinates.y - source.coordinates.y),
+                (arrows[0].x[0], arrows[0].v[0]),
+            )
+
+    def test_edge_and_node_traces_are_built_from_columns(self):
+        network = create_example_state_railway_network()
+        s_node, t_node = network.nodes_by_indices(network.link_source_target_by_index(LinkIndex(0)))
+        link_type = network.link_by_index(LinkIndex(0)).link_type
+        node = network.node_by_index(NodeIndex(0))
+
+        figure = add_3d_ugraph_to_figure(network, _COLOR_MAP)
+        edges = next(trace for trace in figure.data if trace.name == link_type.name and trace.mode == "lines")
+        nodes = next(trace for trace in figure.data if trace.name == node.node_type.name)
+
+        # the fourth point of every link separates its line from the next one
+        self.assertEqual(
+            [s_node.coordinates.x, (s_node.coordinates.x + t_node.coordinates.x) * 0.5, t_node.coordinates.x],
+            list(edges.x[:3]),
+        )
+        self.assertEqual([(s_node.node_id, t_node.node_id)] * 3, list(zip(edges.customdata[:3], edges.text[:3])))
+        self.assertEqual(4 * len(network.link_indices_of_type({link_type})), len(edges.z))
+        self.assertEqual(
+            (node.coordinates.x, node.coordinates.y, node.node_id), (nodes.x[0], nodes.y[0], nodes.customdata[0])
+        )
+        self.assertEqual(len(network.node_indices_of_type({node.node_type})), len(nodes.customdata))
+
+    def test_webgl_traces_are_thinned_outside_the_focus_box(self):
+        network = create_example_state_railway_network()
+        options = PlotOptions()
+        options.renderer, options.max_nodes, options.max_links, options.focus_box = "webgl", 2, 2, (0, 0, 20, 10)
+        options.add_arrow = False
+        in_focus = {node.node_id for node in network.all_nodes if node.coordinates.x <= 20 and node.coordinates.y <= 10}
+
+        figure = add_2d_ugraph_to_figure(network, _COLOR_MAP, options)
+        nodes = [trace for trace in figure.data if trace.mode == "markers"]
+        edges = [trace for trace in figure.data if trace.mode == "lines"]
+
+        self.assertTrue(all(isinstance(trace, go.Scattergl) for trace in nodes + edges))
+        self.assertTrue(in_focus <= {node_id for trace in nodes for node_id in trace.customdata})
+        self.assertTrue(all(len(trace.customdata) <= len(in_focus) + options.max_nodes for trace in nodes))
+        drawn = [pair for trace in edges for pair in zip(trace.customdata[0::4], trace.text[0::4])]
+        pairs_in_focus = [pair for pair, _ in network.iter_links_with_end_nodes() if in_focus.intersection(pair)]
+        self.assertTrue(set(pairs_in_focus) <= set(drawn))
+        self.assertLessEqual(len(drawn), len(pairs_in_focus) + options.max_links * len(edges))
+        self.assertLess(len(drawn), network.l_count)
+
+    def test_zero_budgets_draw_only_the_focus_box(self):
+        network = create_example_state_railway_network()
+        options = PlotOptions()
+        options.max_nodes, options.max_links, options.focus_box = 0, 0, (0, 0, 20, 10)
+        options.add_arrow = False
+        in_focus = {node.node_id for node in network.all_nodes if node.coordinates.x <= 20 and node.coordinates.y <= 10}
+
+        figure = add_2d_ugraph_to_figure(network, _COLOR_MAP, options)
+
+        nodes = [trace for trace in figure.data if trace.mode == "markers" and trace.customdata is not None]
+        drawn = {node_id for trace in nodes for node_id in trace.customdata}
+        self.assertEqual(in_focus, drawn)
+        with self.assertRaises(ValueError):
+            options.max_links = -1
+
+    def test_delta_frames_carry_only_the_changing_traces(self):
+        network = create_example_state_railway_network()
+        figures = []
+        for step in range(3):
+            figure = add_3d_ugraph_to_figure(network, _COLOR_MAP)
+            figure.add_trace(go.Scatter3d(x=[step], y=[0], z=[0], name="train"))
+            figures.append(figure)
+        figures[-1].add_trace(go.Scatter3d(x=[0], y=[0], z=[0], name="delay"))
+        train, delay = len(figures[0].data) - 1, len(figures[0].data)
+
+        full = compose_collection_of_figures_with_slider(figures)
+        delta = compose_collection_of_figures_with_slider(figures, delta_frames=True)
+
+        self.assertEqual(len(figures[-1].data), len(delta.data))
+        self.assertFalse(delta.data[delay].visible)
+        self.assertEqual([[train, delay]] * 3, [list(frame.traces) for frame in delta.frames])
+        self.assertEqual([[0], [1], [2]], [list(frame.data[0].x) for frame in delta.frames])
+        self.assertEqual([False, False, None], [frame.data[1].visible for frame in delta.frames])
+        self.assertEqual([{}] * 3, [frame.layout.to_plotly_json() for frame in delta.frames])
+        self.assertLess(len(delta.to_json()), len(full.to_json()) / 2)
+
+    def test_debug_layout_is_cached_and_seeds_the_layout_after_an_edit(self):
+        _debug._LAYOUT_CACHE.clear()  # pylint: disable=protected-access
+        graph = igraph.Graph.Ring(_debug.LARGE_GRAPH_VERTICES + 1, directed=True)
+        graph.vs["name"] = [str(vertex) for vertex in range(graph.vcount())]
+
+        with tempfile.TemporaryDirectory() as directory:
+            layout = _debug._get_layout(graph, layout_cache=directory)  # pylint: disable=protected-access
+            _debug._LAYOUT_CACHE.clear()  # pylint: disable=protected-access
+            from_disk = _debug._get_layout(graph, layout_cache=directory)  # pylint: disable=protected-access
+            self.assertEqual(1, len(list(Path(directory).iterdir())))
+        self.assertEqual(layout.coords, from_disk.coords)
+        self.assertEqual(layout.coords, _debug._get_layout(graph).coords)  # pylint: disable=protected-access
+
+        graph.add_vertex("new")
+        graph.add_edge("0", "new")
+        seed = _debug._seed_from_previous_layout(graph)  # pylint: disable=protected-access
+        self.assertEqual(layout.coords, seed[:-1])
+        # the new vertex is placed next to its neighbour, not on top of it
+        self.assertNotEqual(layout.coords[0], seed[-1])
+        self.assertLess(math.dist(layout.coords[0], seed[-1]), math.dist(layout.coords[0], layout.coords[1]) * 10)
+
+    def test_debug_layout_read_from_disk_seeds_graphs_with_non_str_names(self) -> None:
+        _debug._LAYOUT_CACHE.clear()  # pylint: disable=protected-access
+        graph = igraph.Graph.Ring(_debug.LARGE_GRAPH_VERTICES + 1, directed=True)
+        graph.vs["name"] = list(range(graph.vcount()))
+
+        with tempfile.TemporaryDirectory() as directory:
+            layout = _debug._get_layout(graph, layout_cache=directory)  # pylint: disable=protected-access
+            _debug._LAYOUT_CACHE.clear()  # pylint: disable=protected-access
+            _debug._get_layout(graph, layout_cache=directory)  # pylint: disable=protected-access
+
+        graph.add_vertex(graph.vcount())
+        seed = _debug._seed_from_previous_layout(graph)  # pylint: disable=protected-access
+        self.assertEqual(layout.coords, seed[:-1])
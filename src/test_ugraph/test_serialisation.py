@@ -1,17 +1,82 @@
+import copy
 import json
+import pickle
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
+from typing import Any, Literal, Optional
 
-from ugraph import UGraphDecoder, UGraphEncoder
+from ugraph import (
+    EndNodeIdPair,
+    LinkABC,
+    LinkIndex,
+    NodeABC,
+    NodeId,
+    NodeIndex,
+    SharedNetworkHandle,
+    ThreeDCoordinates,
+    UGraphDecoder,
+    UGraphEncoder,
+)
 from usage.create_state_network_example import create_example_state_railway_network
-from usage.state_network import StateNetwork
+from usage.minimal_example import ExampleNetwork, create_example_network
+from usage.state_network import StateLinkType, StateNetwork, StateNodeType
+
+
+@dataclass(frozen=True, slots=True)
+class DetailedNode(NodeABC[StateNodeType]):
+    node_type: StateNodeType
+    label: Optional[str]
+    kind: Literal["stop", "junction"]
+    offsets: tuple[float, ...]
+    reference: int | NodeId
+
+
+@dataclass(frozen=True, slots=True)
+class MeasuredLink(LinkABC[StateLinkType]):
+    link_type: StateLinkType
+    length: float | int
+    anchor: ThreeDCoordinates | tuple[float, ...] | None
+
+
+@dataclass(frozen=True, slots=True)
+class AnnotatedNode(NodeABC[StateNodeType]):
+    node_type: StateNodeType
+    positions: dict[str, ThreeDCoordinates]
+    payload: Any
+
+
+@dataclass(frozen=True, slots=True)
+class WeightedLink(LinkABC[StateLinkType]):
+    link_type: StateLinkType
+    weight: float = field(kw_only=True)
+    capacity: int
+
+
+_SUFFIXES = {"gzip": "gz", "lzma": "xz", "bz2": "bz2"}
+
+
+def _links_of_shared(handle: SharedNetworkHandle[StateNetwork]) -> list[LinkABC]:
+    links = handle.open().all_links
+    handle.detach()
+    return links
 
 
 class TestUgraphSerializer(unittest.TestCase):
 
     def setUp(self) -> None:
         # delete the file if it exists
-        for path in (Path("test_serialisation.json"), Path(f"{StateNetwork.__name__}.json")):
+        for path in (
+            Path("test_serialisation.json"),
+            Path(f"{StateNetwork.__name__}.json"),
+            Path(f"{StateNetwork.__name__}.json.journal"),
+            Path(f"{StateNetwork.__name__}.bin"),
+            Path(f"{StateNetwork.__name__}.bin.journal"),
+            Path(f"{ExampleNetwork.__name__}.bin"),
+            *(Path(f"{StateNetwork.__name__}.{kind}.{end}") for kind in ("json", "bin") for end in _SUFFIXES.values()),
+        ):
             if path.exists():
                 path.unlink()
 
@@ -43,3 +108,336 @@ class TestUgraphSerializer(unittest.TestCase):
         self.assertEqual(graph.n_count, loaded.n_count)
         self.assertEqual(graph.all_nodes, loaded.all_nodes)
         self.assertEqual(graph.all_links, loaded.all_links)
+
+    def test_binary_full_cycle(self) -> None:
+        graph = create_example_state_railway_network()
+
+        graph.write_binary(Path(f"{graph.__class__.__name__}.bin"))
+        loaded = StateNetwork.read_binary(Path(f"{graph.__class__.__name__}.bin"))
+
+        self.assertIs(type(loaded), StateNetwork)
+        self.assertEqual(graph.node_ids, loaded.node_ids)
+        self.assertEqual(graph.all_nodes, loaded.all_nodes)
+        self.assertEqual(graph.all_links, loaded.all_links)
+        self.assertEqual(list(graph.iter_edge_tuples()), list(loaded.iter_edge_tuples()))
+
+    def test_binary_matches_json_round_trip(self) -> None:
+        network = create_example_network()
+        graph = network.underlying_digraph
+        graph["description"] = {"source": "test", "tags": ["a", "b"]}
+        graph.vs["weight"] = [1, None]
+        graph.es["label"] = ["first"]
+
+        network.write_binary(Path(f"{ExampleNetwork.__name__}.bin"))
+        from_binary = ExampleNetwork.read_binary(Path(f"{ExampleNetwork.__name__}.bin"))
+        from_json = json.loads(json.dumps(network, cls=UGraphEncoder), cls=UGraphDecoder)
+
+        for loaded in (from_binary, from_json):
+            self.assertEqual(network.all_nodes, loaded.all_nodes)
+            self.assertEqual(network.all_links, loaded.all_links)
+        binary_graph, json_graph = from_binary.read_only_digraph, from_json.read_only_digraph
+        self.assertEqual(json_graph["description"], binary_graph["description"])
+        self.assertEqual(json_graph.vs["weight"], binary_graph.vs["weight"])
+        self.assertEqual(json_graph.es["label"], binary_graph.es["label"])
+
+    def test_binary_passes_keyword_only_fields_by_name(self) -> None:
+        graph = StateNetwork.create_empty()
+        origin = ThreeDCoordinates(0.0, 0.0, 0.0)
+        graph.add_nodes(
+            [DetailedNode(NodeId(name), origin, StateNodeType.RESOURCE, None, "stop", (), 0) for name in "ab"]
+        )
+        link = WeightedLink(StateLinkType.OCCUPATION, 4, weight=1.5)
+        graph.add_links([(EndNodeIdPair((NodeId("a"), NodeId("b"))), link)])
+        path = Path(f"{StateNetwork.__name__}.bin")
+        graph.write_binary(path)
+
+        for mapped in (False, True):
+            self.assertEqual(graph.all_links, StateNetwork.read_binary(path, mapped=mapped).all_links)
+
+    def test_binary_is_smaller_than_json(self) -> None:
+        graph = create_example_state_railway_network()
+
+        graph.write_json(Path(f"{graph.__class__.__name__}.json"))
+        graph.write_binary(Path(f"{graph.__class__.__name__}.bin"))
+
+        self.assertLess(
+            Path(f"{graph.__class__.__name__}.bin").stat().st_size,
+            Path(f"{graph.__class__.__name__}.json").stat().st_size,
+        )
+
+    def test_binary_rejects_other_files(self) -> None:
+        Path(f"{StateNetwork.__name__}.bin").write_bytes(b"{}")
+        with self.assertRaises(ValueError):
+            StateNetwork.read_binary(Path(f"{StateNetwork.__name__}.bin"))
+
+    def test_write_json_matches_json_dump(self) -> None:
+        graph = create_example_state_railway_network()
+        graph.underlying_digraph["description"] = "test"
+
+        graph.write_json(Path(f"{graph.__class__.__name__}.json"))
+
+        self.assertEqual(json.dumps(graph, cls=UGraphEncoder), Path(f"{graph.__class__.__name__}.json").read_text())
+
+    def test_decoding_converts_fields_to_their_hints(self) -> None:
+        nodes = [
+            DetailedNode(NodeId("a"), ThreeDCoordinates(0.0, 1.0, 2.5), StateNodeType.RESOURCE, None, "stop", (), 1),
+            DetailedNode(
+                NodeId("b"),
+                ThreeDCoordinates(1.0, 0.0, 0.0),
+                StateNodeType.INFRASTRUCTURE,
+                "B",
+                "junction",
+                (0.5, 1.0),
+                NodeId("a"),
+            ),
+        ]
+
+        decoded = json.loads(json.dumps(nodes, cls=UGraphEncoder), cls=UGraphDecoder)
+
+        self.assertEqual(nodes, decoded)
+        self.assertIs(type(decoded[0].node_type), StateNodeType)
+        self.assertIs(type(decoded[1].offsets), tuple)
+        with self.assertRaises(ValueError):
+            json.loads(json.dumps(nodes[0], cls=UGraphEncoder).replace('"stop"', '"depot"'), cls=UGraphDecoder)
+
+    def test_union_tags_select_the_alternative(self) -> None:
+        links = [
+            MeasuredLink(StateLinkType.TRANSITION, 3, ThreeDCoordinates(1.0, 2.0, 3.0)),
+            MeasuredLink(StateLinkType.ALLOCATION, 2.5, (1.0, 2.0)),
+            MeasuredLink(StateLinkType.TRANSITION, 1, None),
+        ]
+
+        tagged = json.dumps(links, cls=UGraphEncoder, tag_unions=True)
+        decoded = json.loads(tagged, cls=UGraphDecoder)
+
+        self.assertIn('"__union__": "int"', tagged)
+        self.assertEqual(links, decoded)
+        self.assertEqual([int, float, int], [type(link.length) for link in decoded])
+        self.assertIsInstance(decoded[0].anchor, ThreeDCoordinates)
+        self.assertEqual((1.0, 2.0), decoded[1].anchor)
+
+    def test_untagged_unions_use_the_first_accepting_alternative(self) -> None:
+        link = MeasuredLink(StateLinkType.TRANSITION, 3, None)
+
+        decoded = json.loads(json.dumps(link, cls=UGraphEncoder), cls=UGraphDecoder)
+
+        self.assertNotIn("__union__", json.dumps(link, cls=UGraphEncoder))
+        self.assertEqual(link, decoded)
+        self.assertIs(type(decoded.length), float)
+
+    def test_write_json_with_union_tags(self) -> None:
+        graph = create_example_state_railway_network()
+
+        graph.write_json(Path(f"{graph.__class__.__name__}.json"), tag_unions=True)
+        loaded = graph.read_json(Path(f"{graph.__class__.__name__}.json"))
+
+        self.assertEqual(graph.all_nodes, loaded.all_nodes)
+        self.assertEqual(graph.all_links, loaded.all_links)
+
+    def test_mapped_binary_decodes_on_access(self) -> None:
+        graph = create_example_state_railway_network()
+        path = Path(f"{graph.__class__.__name__}.bin")
+        graph.write_binary(path)
+
+        mapped = StateNetwork.read_binary(path, mapped=True)
+
+        self.assertEqual(graph.node_ids, mapped.node_ids)
+        self.assertEqual(graph.node_by_index(NodeIndex(3)), mapped.node_by_index(NodeIndex(3)))
+        self.assertEqual(graph.node_by_id(graph.node_ids[5]), mapped.node_by_id(graph.node_ids[5]))
+        self.assertEqual(graph.incident_links_per_node(NodeIndex(2)), mapped.incident_links_per_node(NodeIndex(2)))
+        self.assertEqual(graph.all_nodes, mapped.all_nodes)
+        self.assertEqual(graph.all_links, mapped.all_links)
+        self.assertEqual(list(graph.link_type_column()), list(mapped.link_type_column()))
+
+    def test_mapped_binary_network_can_be_mutated_and_copied(self) -> None:
+        graph = create_example_state_railway_network()
+        path = Path(f"{graph.__class__.__name__}.bin")
+        graph.write_binary(path)
+        mapped = StateNetwork.read_binary(path, mapped=True)
+
+        copied = mapped.copy()
+        mapped.replace_link(LinkIndex(0), graph.link_by_index(LinkIndex(1)))
+
+        self.assertEqual(graph.link_by_index(LinkIndex(1)), mapped.link_by_index(LinkIndex(0)))
+        self.assertEqual(graph.all_links, copied.all_links)
+        self.assertEqual(graph.all_nodes, pickle.loads(pickle.dumps(copied)).all_nodes)
+
+    def test_lazy_json_decodes_on_access(self) -> None:
+        graph = create_example_state_railway_network()
+        path = Path(f"{graph.__class__.__name__}.json")
+        graph.write_json(path)
+
+        lazy = StateNetwork.read_json(path, lazy=True)
+
+        self.assertEqual(graph.node_ids, lazy.node_ids)
+        self.assertEqual(graph.node_by_index(NodeIndex(3)), lazy.node_by_index(NodeIndex(3)))
+        self.assertEqual(graph.link_by_index(LinkIndex(2)), lazy.link_by_index(LinkIndex(2)))
+        self.assertEqual(list(graph.link_type_column()), list(lazy.link_type_column()))
+        self.assertTrue(lazy.validate_topology())
+
+        lazy.materialise()
+
+        self.assertEqual(graph.all_nodes, lazy.read_only_digraph.vs["node"])
+        self.assertEqual(graph.all_links, lazy.all_links)
+
+    def test_pickle_ships_graph_in_out_of_band_buffer(self) -> None:
+        graph = create_example_state_railway_network()
+        buffers: list[pickle.PickleBuffer] = []
+
+        data = pickle.dumps(graph, protocol=5, buffer_callback=buffers.append)
+        loaded = pickle.loads(data, buffers=buffers)
+
+        self.assertEqual(1, len(buffers))
+        self.assertEqual(graph.node_ids, loaded.node_ids)
+        self.assertEqual(graph.all_nodes, loaded.all_nodes)
+        self.assertEqual(graph.all_links, loaded.all_links)
+        for protocol in (2, pickle.DEFAULT_PROTOCOL):
+            self.assertEqual(graph.all_links, pickle.loads(pickle.dumps(graph, protocol=protocol)).all_links)
+        loaded.delete_nodes([NodeIndex(0)])
+        self.assertEqual(graph.n_count, loaded.n_count + 1)
+
+    def test_pickle_keeps_values_the_binary_format_does_not_round_trip(self) -> None:
+        graph = StateNetwork.create_empty()
+        positions = {"platform": ThreeDCoordinates(1.0, 2.0, 3.0)}
+        graph.add_nodes(
+            [AnnotatedNode(NodeId("a"), ThreeDCoordinates(0.0, 0.0, 0.0), StateNodeType.RESOURCE, positions, (1, 2))]
+        )
+        buffers: list[pickle.PickleBuffer] = []
+
+        loaded = pickle.loads(pickle.dumps(graph, protocol=5, buffer_callback=buffers.append), buffers=buffers)
+
+        self.assertEqual(0, len(buffers))
+        self.assertEqual(graph.all_nodes, loaded.all_nodes)
+        self.assertEqual(graph.all_nodes, copy.deepcopy(graph).all_nodes)
+        with self.assertRaises(ValueError):
+            graph.share()
+
+    def test_shared_network_is_opened_by_workers(self) -> None:
+        graph = create_example_state_railway_network()
+
+        with graph.share() as handle:
+            opened = handle.open()
+            opened.delete_nodes([NodeIndex(0)])
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                links_per_task = list(executor.map(_links_of_shared, [handle] * 3))
+
+            self.assertEqual(graph.all_nodes, handle.open().all_nodes)
+        self.assertEqual([graph.all_links] * 3, links_per_task)
+        self.assertEqual(graph.n_count, opened.n_count + 1)
+        self.assertLess(len(pickle.dumps(handle)), 200)
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(handle.name)
+
+    def test_shared_network_handle_is_detached(self) -> None:
+        graph = create_example_state_railway_network()
+
+        with graph.share() as handle:
+            opened = handle.open()
+            handle.detach()
+            reopened = handle.open()
+            handle.detach()
+            handle.detach()  # detaching a handle that is not attached does nothing
+
+        self.assertEqual(graph.all_links, opened.all_links)
+        self.assertEqual(graph.all_nodes, reopened.all_nodes)
+
+    def test_journal_is_replayed_onto_snapshot(self) -> None:
+        graph = create_example_state_railway_network()
+        snapshot = Path(f"{graph.__class__.__name__}.json")
+
+        with graph.journal(snapshot):
+            graph.delete_nodes([NodeIndex(0)])
+            graph.replace_link(LinkIndex(0), graph.link_by_index(LinkIndex(1)))
+            with graph.batch():
+                graph.add_nodes([replace(graph.node_by_index(NodeIndex(1)), node_id=NodeId("added"))])
+                graph.add_links([((NodeId("added"), graph.node_id_by_index(NodeIndex(2))), graph.all_links[0])])
+            with self.assertRaises(ValueError):
+                with graph.batch(validate=lambda _: False):
+                    graph.delete_links([LinkIndex(0)])
+        graph.delete_links([LinkIndex(0)])  # after closing the journal, mutations are not recorded
+
+        loaded = StateNetwork.read_journaled(snapshot)
+
+        self.assertEqual(4, len(Path(f"{snapshot}.journal").read_text().splitlines()) - 1)
+        self.assertEqual(graph.node_ids, loaded.node_ids)
+        self.assertEqual(graph.all_nodes, loaded.all_nodes)
+        self.assertEqual(graph.all_links, loaded.all_links[1:])
+
+    def test_journal_keeps_the_changes_of_a_batch_that_failed_partway(self) -> None:
+        graph = create_example_state_railway_network()
+        snapshot = Path(f"{graph.__class__.__name__}.json")
+
+        with graph.journal(snapshot):
+            with self.assertRaises(ValueError):
+                with graph.batch():
+                    graph.add_nodes([replace(graph.node_by_index(NodeIndex(1)), node_id=NodeId("added"))])
+                    graph.add_links([((NodeId("added"), NodeId("unknown")), graph.all_links[0])])
+            # the node was added before adding the link failed, and later entries refer to it
+            graph.delete_nodes([graph.node_index_by_id(NodeId("added"))])
+            graph.delete_nodes([NodeIndex(0)])
+
+        loaded = StateNetwork.read_journaled(snapshot)
+
+        self.assertEqual(graph.node_ids, loaded.node_ids)
+        self.assertEqual(graph.all_nodes, loaded.all_nodes)
+        self.assertEqual(graph.all_links, loaded.all_links)
+
+    def test_journal_is_continued_after_an_incomplete_line(self) -> None:
+        graph = create_example_state_railway_network()
+        snapshot = Path(f"{graph.__class__.__name__}.json")
+        with graph.journal(snapshot):
+            graph.delete_nodes([NodeIndex(3)])
+        with open(f"{snapshot}.journal", "a") as file:
+            file.write('["delete_nodes", [0')  # the process died while writing
+
+        reopened = StateNetwork.read_journaled(snapshot)
+        with reopened.journal(snapshot):
+            reopened.delete_links([LinkIndex(0)])
+            duplicated = reopened.node_by_index(NodeIndex(0))
+            reopened.add_nodes({duplicated.node_id: duplicated, NodeId("added"): duplicated})
+
+        loaded = StateNetwork.read_journaled(snapshot)
+
+        self.assertEqual(reopened.node_ids, loaded.node_ids)
+        self.assertEqual(reopened.all_nodes, loaded.all_nodes)
+        self.assertEqual(reopened.all_links, loaded.all_links)
+
+    def test_journal_is_compacted_into_snapshot(self) -> None:
+        graph = create_example_state_railway_network()
+        snapshot = Path(f"{graph.__class__.__name__}.bin")
+        with graph.journal(snapshot):
+            graph.delete_nodes([NodeIndex(3)])
+        with open(f"{snapshot}.journal", "a") as file:
+            file.write('["delete_nodes", [0')  # a line that was not written completely is ignored
+
+        compacted = StateNetwork.compact_journal(snapshot)
+
+        self.assertEqual(1, len(Path(f"{snapshot}.journal").read_text().splitlines()))
+        self.assertEqual(graph.all_nodes, compacted.all_nodes)
+        self.assertEqual(graph.all_nodes, StateNetwork.read_binary(snapshot).all_nodes)
+        with self.assertRaises(ValueError):
+            create_example_state_railway_network().replay_journal(f"{snapshot}.journal")
+
+    def test_compressed_full_cycle(self) -> None:
+        graph = create_example_state_railway_network()
+
+        for compression, suffix in _SUFFIXES.items():
+            json_path = Path(f"{graph.__class__.__name__}.json.{suffix}")
+            binary_path = Path(f"{graph.__class__.__name__}.bin.{suffix}")
+            graph.write_json(json_path, compression=compression)
+            graph.write_binary(binary_path, compression=compression)
+
+            for loaded in (
+                StateNetwork.read_json(json_path, compression=compression),
+                StateNetwork.read_json(json_path, lazy=True, compression=compression),
+                StateNetwork.read_binary(binary_path, compression=compression),
+            ):
+                self.assertEqual(graph.all_nodes, loaded.all_nodes)
+                self.assertEqual(graph.all_links, loaded.all_links)
+            with self.assertRaises(ValueError):
+                StateNetwork.read_binary(binary_path, mapped=True, compression=compression)
+        graph.write_json(Path(f"{graph.__class__.__name__}.json"))
+        self.assertLess(
+            Path(f"{graph.__class__.__name__}.json.gz").stat().st_size,
+            Path(f"{graph.__class__.__name__}.json").stat().st_size,
+        )
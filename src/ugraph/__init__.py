@@ -4,6 +4,7 @@ from ._abc import (
     VERTEX_NAME_KEY,
     BaseLinkType,
     BaseNodeType,
+    Compression,
     EndNodeIdPair,
     ImmutableNetworkABC,
     LinkABC,
@@ -11,11 +12,16 @@ from ._abc import (
     LinkT,
     LinkTypeT,
     MutableNetworkABC,
+    NetworkBatch,
+    NetworkJournal,
+    NetworkView,
     NodeABC,
     NodeId,
     NodeIndex,
     NodeT,
     NodeTypeT,
+    SharedNetwork,
+    SharedNetworkHandle,
     ThreeDCoordinates,
     UGraphDecoder,
     UGraphEncoder,
@@ -28,14 +34,20 @@ __all__ = [
     "VERTEX_NAME_KEY",
     "BaseLinkType",
     "BaseNodeType",
+    "Compression",
     "EndNodeIdPair",
     "ImmutableNetworkABC",
     "LinkABC",
     "LinkIndex",
     "MutableNetworkABC",
+    "NetworkBatch",
+    "NetworkJournal",
+    "NetworkView",
     "NodeABC",
     "NodeId",
     "NodeIndex",
+    "SharedNetwork",
+    "SharedNetworkHandle",
     "ThreeDCoordinates",
     "UGraphDecoder",
     "UGraphEncoder",
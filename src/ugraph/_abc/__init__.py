@@ -1,4 +1,7 @@
+from ._batch import NetworkBatch
+from ._compression import Compression
 from ._immutablenetwork import ImmutableNetworkABC, ImmutableNetworkDecoder, ImmutableNetworkEncoder, LinkIndex
+from ._journal import NetworkJournal
 from ._link import BaseLinkType, EndNodeIdPair, LinkABC
 from ._mutablenetwork import (
     LINK_ATTRIBUTE_KEY,
@@ -10,7 +13,9 @@ from ._mutablenetwork import (
     NodeT,
     NodeTypeT,
 )
+from ._networkview import NetworkView
 from ._node import BaseNodeType, NodeABC, NodeId, NodeIndex, ThreeDCoordinates, node_distance
+from ._shared_network import SharedNetwork, SharedNetworkHandle
 
 UGraphEncoder = ImmutableNetworkEncoder
 UGraphDecoder = ImmutableNetworkDecoder
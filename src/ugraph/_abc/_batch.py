@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Generic, TypeVar
+
+from ._link import EndNodeIdPair, LinkABC, LinkIndex
+from ._node import NodeABC, NodeId, NodeIndex
+
+NodeT = TypeVar("NodeT", bound=NodeABC)
+LinkT = TypeVar("LinkT", bound=LinkABC)
+
+
+class NetworkBatch(Generic[NodeT, LinkT]):
+    """Mutations queued by ``MutableNetworkABC.batch``, applied together when the batch exits.
+
+    Node and link indices refer to the network as it was when the batch started: queued deletions do not renumber
+    anything until the batch is applied. Replacing the same element twice keeps the last replacement, and deleting
+    an element twice deletes it once.
+    """
+
+    __slots__ = (
+        "node_ids",
+        "nodes",
+        "links",
+        "node_replacements",
+        "link_replacements",
+        "deleted_nodes",
+        "deleted_links",
+    )
+
+    def __init__(self) -> None:
+        self.node_ids: list[NodeId] = []
+        self.nodes: list[NodeT] = []
+        self.links: list[tuple[EndNodeIdPair, LinkT]] = []
+        self.node_replacements: dict[NodeIndex, tuple[NodeT, bool]] = {}
+        self.link_replacements: dict[LinkIndex, LinkT] = {}
+        self.deleted_nodes: set[NodeIndex] = set()
+        self.deleted_links: set[LinkIndex] = set()
+
+    def __len__(self) -> int:
+        """Return the number of queued changes."""
+        return (
+            len(self.nodes)
+            + len(self.links)
+            + len(self.node_replacements)
+            + len(self.link_replacements)
+            + len(self.deleted_nodes)
+            + len(self.deleted_links)
+        )
+
+    def add_nodes(self, node_ids: Sequence[NodeId], nodes: Sequence[NodeT]) -> None:
+        self.node_ids.extend(node_ids)
+        self.nodes.extend(nodes)
+
+    def add_links(self, links: Iterable[tuple[EndNodeIdPair, LinkT]]) -> None:
+        self.links.extend(links)
+
+    def replace_node(self, index: NodeIndex, updated: NodeT, renamed: bool) -> None:
+        self.node_replacements[index] = (updated, renamed)
+
+    def replace_link(self, index: LinkIndex, new_link: LinkT) -> None:
+        self.link_replacements[index] = new_link
+
+    def delete_nodes(self, indices: Iterable[NodeIndex]) -> None:
+        self.deleted_nodes.update(indices)
+
+    def delete_links(self, indices: Iterable[LinkIndex]) -> None:
+        self.deleted_links.update(indices)
@@ -0,0 +1,422 @@
+"""Columnar binary representation of an ``igraph.Graph`` holding ugraph nodes and links.
+
+Layout (all numbers little-endian)::
+
+    magic (8 bytes) | format version (uint32) | header length (uint32) | header (UTF-8 JSON) | padding | blobs
+
+Every blob is a packed ``array.array`` starting at a multiple of 8 bytes after the header; the header lists their
+offsets, sizes and type codes together with the column specifications below. The edge list is stored as packed
+integers, all strings (vertex names, string fields, ...) in one deduplicated string table, and the objects of every
+dataclass in typed columns per class (nested dataclasses are flattened into columns as well). Values that do not fit
+a typed column are stored as JSON texts in the string table and decoded like the JSON format does, so every graph
+that the JSON format supports round-trips.
+
+As every column is a plain array at a known offset, the file can also be memory-mapped and its node and link objects
+decoded one at a time when they are accessed (see ``open_graph``).
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import sys
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import fields, is_dataclass
+from functools import cache, partial
+from inspect import Parameter, signature
+from operator import attrgetter
+from typing import IO, Any, get_type_hints
+
+import igraph
+
+from ._decoder_plans import class_by_path, round_trips
+from ._lazy_attributes import LazyAttributes, LazyColumn
+
+MAGIC = b"UGRAPHB\x00"
+FORMAT_VERSION = 1
+_ALIGNMENT = 8
+_INT_CODE = "q"
+_FLOAT_CODE = "d"
+_TEXT_CODE = "B"
+_UNSIGNED_CODES = ("B", "H", "I", "Q")
+# column kinds decoded eagerly by ``open_graph``
+_PRIMITIVE_KINDS = ("str", "int", "float")
+
+# a buffer holding the binary representation, e.g. the contents or the memory-map of a file
+Buffer = bytes | memoryview | mmap.mmap
+
+# encodes a value that has no typed column to JSON, given the type hint of the dataclass field it belongs to (if any)
+JsonEncoder = Callable[[Any, Any], str]
+# decodes such a value, optionally given the type hint of the dataclass field it belongs to
+JsonDecoder = Callable[[str, Any], Any]
+
+
+def write_graph(file: IO[bytes], graph: igraph.Graph, network_class: str, encode: JsonEncoder) -> dict[str, Any]:
+    """Write ``graph`` in the binary format to ``file`` and return the header (see ``is_lossless``)."""
+    writer = _BlobWriter()
+    header = {
+        "network": network_class,
+        "directed": graph.is_directed(),
+        "node_count": graph.vcount(),
+        "edge_count": graph.ecount(),
+        "graph_attributes": encode({key: graph[key] for key in graph.attributes()}, None),
+        "edges": writer.add_indices(_flatten(graph.get_edgelist())),
+        "vertex_attributes": [
+            [key, _encode_values(writer, graph.vs[key], None, encode)] for key in graph.vs.attribute_names()
+        ],
+        "edge_attributes": [
+            [key, _encode_values(writer, graph.es[key], None, encode)] for key in graph.es.attribute_names()
+        ],
+    }
+    header["strings"] = writer.add_string_table()
+    writer.write(file, header)
+    return header
+
+
+def is_lossless(header: dict[str, Any]) -> bool:
+    """Return whether the graph written with ``header`` is read back with equal attributes.
+
+    That is, beyond what the JSON format preserves: attributes without a type hint (i.e. of the graph or not holding
+    dataclasses) are stored as JSON texts, which e.g. turn tuples into lists, so they must be in primitive columns.
+    """
+    columns = header["vertex_attributes"] + header["edge_attributes"]
+    return header["graph_attributes"] == "{}" and all(_column_round_trips(spec) for _, spec in columns)
+
+
+def read_graph(file: IO[bytes], decode: JsonDecoder) -> tuple[str, igraph.Graph]:
+    """Return the class path of the network stored in ``file`` and its graph."""
+    reader = _BlobReader(file.read())
+    header = reader.header
+    graph = _structure(reader, decode)
+    for key, spec in header["vertex_attributes"]:
+        graph.vs[key] = _decode_values(reader, spec, None, decode)
+    for key, spec in header["edge_attributes"]:
+        graph.es[key] = _decode_values(reader, spec, None, decode)
+    return header["network"], graph
+
+
+def open_graph(buffer: Buffer, decode: JsonDecoder) -> tuple[str, igraph.Graph, LazyAttributes]:
+    """Like ``read_graph`` for a (memory-mapped) buffer, but leave dataclass and JSON attributes undecoded.
+
+    The graph holds the structure and all attributes stored in primitive columns (e.g. the node ids); the other
+    attributes (i.e. the node and link objects) are returned as lazy columns reading their fields from ``buffer``
+    element by element, without copying the columns.
+    """
+    reader = _BlobReader(buffer)
+    header = reader.header
+    graph = _structure(reader, decode)
+    lazy_vertex: dict[str, LazyColumn] = {}
+    lazy_edge: dict[str, LazyColumn] = {}
+    for sequence, specs, lazy in (
+        (graph.vs, header["vertex_attributes"], lazy_vertex),
+        (graph.es, header["edge_attributes"], lazy_edge),
+    ):
+        for key, spec in specs:
+            # the vertex names are needed by the name lookups of igraph and the node id index
+            if spec["kind"] in _PRIMITIVE_KINDS or (sequence is graph.vs and key == "name"):
+                sequence[key] = _decode_values(reader, spec, None, decode)
+            else:
+                lazy[key] = LazyColumn(
+                    len(sequence),
+                    _element_decoder(reader, spec, None, decode),
+                    partial(_decode_values, reader, spec, None, decode),
+                )
+    return header["network"], graph, LazyAttributes(lazy_vertex, lazy_edge)
+
+
+def _structure(reader: _BlobReader, decode: JsonDecoder) -> igraph.Graph:
+    header = reader.header
+    edges = reader.indices(header["edges"])
+    return igraph.Graph(
+        n=header["node_count"],
+        edges=list(zip(edges[::2], edges[1::2])),
+        directed=header["directed"],
+        graph_attrs=decode(header["graph_attributes"], None),
+    )
+
+
+def class_path(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__name__}"
+
+
+class _BlobWriter:
+    __slots__ = ("_blobs", "_strings")
+
+    def __init__(self) -> None:
+        self._blobs: list[array] = []
+        self._strings: dict[str, int] = {}
+
+    def add(self, values: array) -> int:
+        self._blobs.append(values)
+        return len(self._blobs) - 1
+
+    def add_indices(self, values: Sequence[int]) -> dict[str, int]:
+        largest = max(values, default=0)
+        code = next(code for code in _UNSIGNED_CODES if largest < 1 << (8 * array(code).itemsize))
+        return {"blob": self.add(array(code, values))}
+
+    def add_strings(self, values: Sequence[str]) -> dict[str, int]:
+        """Add the strings to the string table and return the column of their positions in it."""
+        table = self._strings
+        return self.add_indices([table.setdefault(value, len(table)) for value in values])
+
+    def add_string_table(self) -> dict[str, Any]:
+        strings = list(self._strings)
+        text = "".join(strings)
+        offsets = array(_INT_CODE, [0])
+        offsets.extend(map(len, strings))
+        for i in range(1, len(offsets)):
+            offsets[i] += offsets[i - 1]
+        return {"text": self.add(array(_TEXT_CODE, text.encode("utf-8"))), "offsets": self.add(offsets)}
+
+    def write(self, file: IO[bytes], header: dict[str, Any]) -> None:
+        blob_specs, offset = [], 0
+        for blob in self._blobs:
+            blob_specs.append([offset, len(blob), blob.typecode])
+            offset += _padded(len(blob) * blob.itemsize)
+        header["blobs"] = blob_specs
+        encoded_header = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        prefix = MAGIC + FORMAT_VERSION.to_bytes(4, "little") + len(encoded_header).to_bytes(4, "little")
+        file.write(prefix + encoded_header)
+        file.write(bytes(_padded(len(prefix) + len(encoded_header)) - len(prefix) - len(encoded_header)))
+        for blob in self._blobs:
+            if sys.byteorder == "big":
+                blob = array(blob.typecode, blob)
+                blob.byteswap()
+            file.write(memoryview(blob).cast("B"))
+            file.write(bytes(_padded(len(blob) * blob.itemsize) - len(blob) * blob.itemsize))
+
+
+class _BlobReader:
+    __slots__ = ("header", "_data", "_data_start", "_strings")
+
+    def __init__(self, data: Buffer) -> None:
+        if bytes(data[: len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a ugraph binary file")
+        version = int.from_bytes(data[len(MAGIC) : len(MAGIC) + 4], "little")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"Unsupported ugraph binary format version {version} (supported: {FORMAT_VERSION})")
+        header_start = len(MAGIC) + 8
+        header_end = header_start + int.from_bytes(data[len(MAGIC) + 4 : header_start], "little")
+        self.header: dict[str, Any] = json.loads(bytes(data[header_start:header_end]))
+        self._data = memoryview(data)
+        self._data_start = _padded(header_end)
+        self._strings: list[str] | None = None
+
+    def view(self, index: int) -> Sequence[Any]:
+        """Return the blob without copying it (a view into the buffer where the byte order allows it)."""
+        if sys.byteorder == "big":
+            return self.blob(index)
+        offset, length, code = self.header["blobs"][index]
+        start = self._data_start + offset
+        return self._data[start : start + length * array(code).itemsize].cast(code)
+
+    def blob(self, index: int) -> array:
+        offset, length, code = self.header["blobs"][index]
+        values = array(code)
+        start = self._data_start + offset
+        values.frombytes(self._data[start : start + length * values.itemsize])
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    def indices(self, spec: dict[str, int]) -> array:
+        return self.blob(spec["blob"])
+
+    def string_table(self) -> list[str]:
+        if self._strings is None:
+            table = self.header["strings"]
+            text = self.blob(table["text"]).tobytes().decode("utf-8")
+            offsets = self.blob(table["offsets"])
+            self._strings = list(map(text.__getitem__, map(slice, offsets, offsets[1:])))
+        return self._strings
+
+    def strings(self, spec: dict[str, int]) -> list[str]:
+        return list(map(self.string_table().__getitem__, self.indices(spec)))
+
+
+def _encode_values(writer: _BlobWriter, values: list[Any], hint: Any, encode: JsonEncoder) -> dict[str, Any]:
+    """Return the specification of the column holding ``values``; ``hint`` is the type of the field they belong to."""
+    base = _unwrap_new_type(hint)
+    if (
+        hint is None
+        and len(values) > 0
+        and all(is_dataclass(value) and not isinstance(value, type) for value in values)
+    ):
+        return _encode_dataclasses(writer, values, encode)
+    if base is str or (hint is None and _all_of_type(values, str)):
+        if all(isinstance(value, str) for value in values):
+            return {"kind": "str", **writer.add_strings(values)}
+    elif base is float or (hint is None and _all_of_type(values, float)):
+        if all(type(value) in (int, float) for value in values):
+            return {"kind": "float", "blob": writer.add(array(_FLOAT_CODE, values))}
+    elif _is_int_type(base) or (hint is None and _all_of_type(values, int)):
+        if all(isinstance(value, int) for value in values):
+            try:
+                column = {"kind": "int", "blob": writer.add(array(_INT_CODE, values))}
+            except OverflowError:
+                pass
+            else:
+                return column | ({"class": class_path(base)} if base not in (None, int) else {})
+    elif is_dataclass(base) and isinstance(base, type) and _all_of_type(values, base):
+        return _encode_dataclass(writer, base, values, encode)
+    return {"kind": "json", **writer.add_strings([encode(value, hint) for value in values])}
+
+
+def _encode_dataclasses(writer: _BlobWriter, values: list[Any], encode: JsonEncoder) -> dict[str, Any]:
+    by_class: dict[type, list[Any]] = {}
+    for value in values:
+        by_class.setdefault(type(value), []).append(value)
+    spec: dict[str, Any] = {
+        "kind": "dataclasses",
+        "classes": [_encode_dataclass(writer, cls, members, encode) for cls, members in by_class.items()],
+    }
+    if len(by_class) > 1:
+        codes = {cls: code for code, cls in enumerate(by_class)}
+        spec["codes"] = writer.add_indices([codes[type(value)] for value in values])
+    return spec
+
+
+def _encode_dataclass(writer: _BlobWriter, cls: type, values: list[Any], encode: JsonEncoder) -> dict[str, Any]:
+    hints = get_type_hints(cls)
+    return {
+        "kind": "dataclass",
+        "class": class_path(cls),
+        "count": len(values),
+        "fields": [
+            [field.name, _encode_values(writer, list(map(attrgetter(field.name), values)), hints[field.name], encode)]
+            for field in fields(cls)
+            if field.init
+        ],
+    }
+
+
+def _decode_values(reader: _BlobReader, spec: dict[str, Any], hint: Any, decode: JsonDecoder) -> list[Any]:
+    kind = spec["kind"]
+    if kind == "str":
+        return reader.strings(spec)
+    if kind == "float":
+        return reader.blob(spec["blob"]).tolist()
+    if kind == "int":
+        values = reader.blob(spec["blob"]).tolist()
+        return list(map(class_by_path(spec["class"]), values)) if "class" in spec else values
+    if kind == "json":
+        return [decode(text, hint) for text in reader.strings(spec)]
+    if kind == "dataclass":
+        cls = class_by_path(spec["class"])
+        hints = get_type_hints(cls) if any(field[1]["kind"] == "json" for field in spec["fields"]) else {}
+        columns = [_decode_values(reader, field, hints.get(name), decode) for name, field in spec["fields"]]
+        if not columns:
+            return [cls() for _ in range(spec["count"])]
+        names = tuple(name for name, _ in spec["fields"])
+        if _takes_positionally(cls, names):
+            return list(map(cls, *columns))
+        return [cls(**dict(zip(names, row))) for row in zip(*columns)]
+    if kind == "dataclasses":
+        per_class = [_decode_values(reader, class_spec, None, decode) for class_spec in spec["classes"]]
+        if "codes" not in spec:
+            return per_class[0]
+        iterators: list[Iterator[Any]] = [iter(members) for members in per_class]
+        return [next(iterators[code]) for code in reader.indices(spec["codes"])]
+    raise ValueError(f"Unknown column kind {kind!r}")
+
+
+def _element_decoder(reader: _BlobReader, spec: dict[str, Any], hint: Any, decode: JsonDecoder) -> Callable[[int], Any]:
+    """Return a function decoding the element with the given index of the column ``spec``, like ``_decode_values``."""
+    kind = spec["kind"]
+    if kind in ("str", "json"):
+        table, indices = reader.string_table(), reader.view(spec["blob"])
+        if kind == "str":
+            return lambda index: table[indices[index]]
+        return lambda index: decode(table[indices[index]], hint)
+    if kind in ("float", "int"):
+        column = reader.view(spec["blob"])
+        if "class" in spec:
+            cls = class_by_path(spec["class"])
+            return lambda index: cls(column[index])
+        return column.__getitem__
+    if kind == "dataclass":
+        return _dataclass_element_decoder(reader, spec, decode)
+    if kind == "dataclasses":
+        per_class = [_dataclass_element_decoder(reader, class_spec, decode) for class_spec in spec["classes"]]
+        if "codes" not in spec:
+            return per_class[0]
+        return _MixedClassDecoder(reader.view(spec["codes"]), per_class)
+    raise ValueError(f"Unknown column kind {kind!r}")
+
+
+def _dataclass_element_decoder(reader: _BlobReader, spec: dict[str, Any], decode: JsonDecoder) -> Callable[[int], Any]:
+    cls = class_by_path(spec["class"])
+    hints = get_type_hints(cls) if any(field[1]["kind"] == "json" for field in spec["fields"]) else {}
+    fields_of = [_element_decoder(reader, field, hints.get(name), decode) for name, field in spec["fields"]]
+    names = tuple(name for name, _ in spec["fields"])
+    if _takes_positionally(cls, names):
+        return lambda index: cls(*[field_of(index) for field_of in fields_of])
+    return lambda index: cls(**{name: field_of(index) for name, field_of in zip(names, fields_of)})
+
+
+@cache
+def _takes_positionally(cls: type, names: tuple[str, ...]) -> bool:
+    """Whether ``cls(*values)`` passes the values to the fields ``names`` in this order.
+
+    Not the case for ``kw_only`` fields or an ``__init__`` with another parameter order; those are passed by keyword.
+    """
+    parameters = list(signature(cls).parameters.values())[: len(names)]
+    return len(parameters) == len(names) and all(
+        parameter.name == name and parameter.kind is Parameter.POSITIONAL_OR_KEYWORD
+        for parameter, name in zip(parameters, names)
+    )
+
+
+class _MixedClassDecoder:
+    """Decodes an element of a column holding objects of several classes, each stored in its own columns."""
+
+    __slots__ = ("_codes", "_per_class", "_positions")
+
+    def __init__(self, codes: Sequence[int], per_class: list[Callable[[int], Any]]) -> None:
+        self._codes = codes
+        self._per_class = per_class
+        self._positions: array | None = None
+
+    def __call__(self, index: int) -> Any:
+        if self._positions is None:
+            # position of every element within the columns of its class
+            counts = [0] * len(self._per_class)
+            self._positions = array(_INT_CODE, bytes(8 * len(self._codes)))
+            for i, code in enumerate(self._codes):
+                self._positions[i] = counts[code]
+                counts[code] += 1
+        return self._per_class[self._codes[index]](self._positions[index])
+
+
+def _column_round_trips(spec: dict[str, Any]) -> bool:
+    kind = spec["kind"]
+    if kind == "dataclass":
+        return round_trips(class_by_path(spec["class"]))
+    if kind == "dataclasses":
+        return all(map(_column_round_trips, spec["classes"]))
+    return kind in _PRIMITIVE_KINDS
+
+
+def _unwrap_new_type(hint: Any) -> Any:
+    while hasattr(hint, "__supertype__"):
+        hint = hint.__supertype__
+    return hint
+
+
+def _is_int_type(hint: Any) -> bool:
+    return isinstance(hint, type) and issubclass(hint, int)
+
+
+def _all_of_type(values: list[Any], _type: type) -> bool:
+    # subclasses (e.g. enums or bools for int) are excluded, the JSON format does not preserve them either
+    return len(values) > 0 and all(type(value) is _type for value in values)  # pylint: disable=unidiomatic-typecheck
+
+
+def _flatten(pairs: Sequence[tuple[int, int]]) -> list[int]:
+    return [index for pair in pairs for index in pair]
+
+
+def _padded(size: int) -> int:
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
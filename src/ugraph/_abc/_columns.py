@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from array import array
+from bisect import insort
+from collections.abc import Collection, Iterable, Sequence
+from itertools import chain, compress
+from math import dist
+from typing import AbstractSet, cast
+
+import igraph
+
+from ._link import LinkABC, LinkIndex
+from ._node import NodeABC, NodeIndex
+
+_NODE_ATTRIBUTE_KEY = "node"
+_LINK_ATTRIBUTE_KEY = "link"
+_TYPE_CODE = "q"
+_COORDINATE_CODE = "d"
+
+
+class NetworkColumns:
+    """Typed columns of node types, link types and node coordinates kept alongside an ``igraph.Graph``.
+
+    The columns mirror the ``node_type``/``link_type``/``coordinates`` fields of the node and link objects stored on
+    the graph (which stay the public API), so that filters and geometric operations can run over contiguous arrays
+    instead of touching every dataclass. Coordinates are stored row-major as an (N, 3) array of ``x, y, z``.
+    Node and link columns are built lazily and independently, maintained incrementally by the mutating methods of
+    the owning network, invalidated when the graph is handed out for direct modification, and rebuilt whenever the
+    element count of the graph no longer matches. Each type column
+    comes with a ``TypeIndex`` so that selecting the elements of a few types costs time proportional to their number.
+    """
+
+    __slots__ = (
+        "_node_types",
+        "_coordinates",
+        "_vertex_count",
+        "_node_type_index",
+        "_link_types",
+        "_edge_count",
+        "_link_type_index",
+    )
+
+    def __init__(self) -> None:
+        self._node_types: array[int] = array(_TYPE_CODE)
+        self._coordinates: array[float] = array(_COORDINATE_CODE)
+        self._vertex_count = -1
+        self._node_type_index = TypeIndex()
+        self._link_types: array[int] = array(_TYPE_CODE)
+        self._edge_count = -1
+        self._link_type_index = TypeIndex()
+
+    def node_types(self, graph: igraph.Graph) -> array[int]:
+        self._ensure_nodes(graph)
+        return self._node_types
+
+    def coordinates(self, graph: igraph.Graph) -> array[float]:
+        self._ensure_nodes(graph)
+        return self._coordinates
+
+    def link_types(self, graph: igraph.Graph) -> array[int]:
+        self._ensure_links(graph)
+        return self._link_types
+
+    def node_indices_with_types(
+        self, graph: igraph.Graph, types: AbstractSet[int], negate: bool = False
+    ) -> list[NodeIndex]:
+        return cast(list[NodeIndex], self._node_type_index.select(self.node_types(graph), types, negate))
+
+    def link_indices_with_types(
+        self, graph: igraph.Graph, types: AbstractSet[int], negate: bool = False
+    ) -> list[LinkIndex]:
+        return cast(list[LinkIndex], self._link_type_index.select(self.link_types(graph), types, negate))
+
+    def distances(self, graph: igraph.Graph, pairs: Iterable[tuple[int, int]]) -> list[float]:
+        coordinates = self.coordinates(graph)
+        return [dist(coordinates[3 * s : 3 * s + 3], coordinates[3 * t : 3 * t + 3]) for s, t in pairs]
+
+    def extend_nodes(self, first_index: int, nodes: Sequence[NodeABC]) -> None:
+        # columns that were not built yet (e.g. while a network is constructed) are built when they are first used
+        if first_index == 0 or self._vertex_count != first_index:
+            self.invalidate_nodes()
+            return
+        node_types = [node.node_type for node in nodes]
+        self._node_types.extend(node_types)
+        self._node_type_index.append(first_index, node_types)
+        self._coordinates.extend(_flat_coordinates(nodes))
+        self._vertex_count += len(nodes)
+
+    def extend_links(self, first_index: int, links: Sequence[LinkABC]) -> None:
+        if first_index == 0 or self._edge_count != first_index:
+            self.invalidate_links()
+            return
+        link_types = [link.link_type for link in links]
+        self._link_types.extend(link_types)
+        self._link_type_index.append(first_index, link_types)
+        self._edge_count += len(links)
+
+    def replace_node(self, index: int, node: NodeABC) -> None:
+        if self._vertex_count < 0:
+            return
+        self._node_type_index.replace(index, self._node_types[index], node.node_type)
+        self._node_types[index] = node.node_type
+        self._coordinates[3 * index : 3 * index + 3] = array(_COORDINATE_CODE, _flat_coordinates((node,)))
+
+    def replace_link(self, index: int, link: LinkABC) -> None:
+        if self._edge_count >= 0:
+            self._link_type_index.replace(index, self._link_types[index], link.link_type)
+            self._link_types[index] = link.link_type
+
+    def delete_nodes(self, indices: Collection[int]) -> None:
+        """Drop the rows of the deleted nodes; links incident to them are gone as well, so links are rebuilt."""
+        self.invalidate_links()
+        if self._vertex_count < 0:
+            return
+        keep = _keep_mask(self._vertex_count, indices)
+        self._node_type_index.invalidate()
+        self._node_types = array(_TYPE_CODE, compress(self._node_types, keep))
+        self._coordinates = array(
+            _COORDINATE_CODE, compress(self._coordinates, bytes(chain.from_iterable(zip(keep, keep, keep))))
+        )
+        self._vertex_count = len(self._node_types)
+
+    def delete_links(self, indices: Collection[int]) -> None:
+        if self._edge_count < 0:
+            return
+        self._link_type_index.invalidate()
+        self._link_types = array(_TYPE_CODE, compress(self._link_types, _keep_mask(self._edge_count, indices)))
+        self._edge_count = len(self._link_types)
+
+    def copy(self) -> NetworkColumns:
+        # pylint: disable=protected-access
+        copied = NetworkColumns()
+        copied._node_types, copied._coordinates = self._node_types[:], self._coordinates[:]
+        copied._vertex_count, copied._node_type_index = self._vertex_count, self._node_type_index.copy()
+        copied._link_types, copied._edge_count = self._link_types[:], self._edge_count
+        copied._link_type_index = self._link_type_index.copy()
+        return copied
+
+    def invalidate_nodes(self) -> None:
+        self._node_types, self._coordinates, self._vertex_count = array(_TYPE_CODE), array(_COORDINATE_CODE), -1
+        self._node_type_index.invalidate()
+
+    def invalidate_links(self) -> None:
+        self._link_types, self._edge_count = array(_TYPE_CODE), -1
+        self._link_type_index.invalidate()
+
+    def _ensure_nodes(self, graph: igraph.Graph) -> None:
+        if self._vertex_count == graph.vcount():
+            return
+        nodes = graph.vs[_NODE_ATTRIBUTE_KEY] if graph.vcount() > 0 else []
+        self._node_type_index.invalidate()
+        self._node_types = array(_TYPE_CODE, (node.node_type for node in nodes))
+        self._coordinates = array(_COORDINATE_CODE, _flat_coordinates(nodes))
+        self._vertex_count = len(nodes)
+
+    def _ensure_links(self, graph: igraph.Graph) -> None:
+        if self._edge_count == graph.ecount():
+            return
+        links = graph.es[_LINK_ATTRIBUTE_KEY] if graph.ecount() > 0 else []
+        self._link_type_index.invalidate()
+        self._link_types = array(_TYPE_CODE, (link.link_type for link in links))
+        self._edge_count = len(links)
+
+
+class TypeIndex:
+    """``type -> indices`` mapping over a type column, keeping the indices of every type in ascending order."""
+
+    __slots__ = ("_indices",)
+
+    def __init__(self) -> None:
+        self._indices: dict[int, array[int]] | None = None
+
+    def select(self, column: array[int], types: AbstractSet[int], negate: bool) -> list[int]:
+        """Return the ascending indices whose type is in ``types`` (or not in ``types`` if ``negate``)."""
+        if self._indices is None:
+            self._indices = _group_by_type(column)
+        wanted = frozenset(types)
+        selected = [indices for _type, indices in self._indices.items() if (_type in wanted) != negate]
+        if len(selected) == 1:
+            return selected[0].tolist()
+        return sorted(chain.from_iterable(selected))
+
+    def append(self, first_index: int, types: Iterable[int]) -> None:
+        if self._indices is None:
+            return
+        for index, _type in enumerate(types, start=first_index):
+            if _type not in self._indices:
+                self._indices[_type] = array(_TYPE_CODE)
+            self._indices[_type].append(index)
+
+    def replace(self, index: int, old_type: int, new_type: int) -> None:
+        if self._indices is None or old_type == new_type:
+            return
+        self._indices[old_type].remove(index)
+        if new_type not in self._indices:
+            self._indices[new_type] = array(_TYPE_CODE)
+        insort(self._indices[new_type], index)
+
+    def copy(self) -> TypeIndex:
+        # pylint: disable=protected-access
+        copied = TypeIndex()
+        if self._indices is not None:
+            copied._indices = {_type: indices[:] for _type, indices in self._indices.items()}
+        return copied
+
+    def invalidate(self) -> None:
+        self._indices = None
+
+
+def _group_by_type(column: array[int]) -> dict[int, array[int]]:
+    # one C-level pass per distinct type, the number of types is small compared to the number of elements
+    return {_type: array(_TYPE_CODE, compress(range(len(column)), map(_type.__eq__, column))) for _type in set(column)}
+
+
+def _flat_coordinates(nodes: Iterable[NodeABC]) -> Iterable[float]:
+    return chain.from_iterable((node.coordinates.x, node.coordinates.y, node.coordinates.z) for node in nodes)
+
+
+def _keep_mask(count: int, deleted: Collection[int]) -> bytearray:
+    keep = bytearray(b"\x01") * count
+    for index in deleted:
+        keep[index] = 0
+    return keep
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import IO, Any, Literal
+
+# stdlib codecs that ``write_json``/``write_binary`` can compress with while streaming
+Compression = Literal["gzip", "lzma", "bz2"]
+
+_SUFFIXES: dict[str | None, str] = {None: "", "gzip": ".gz", "lzma": ".xz", "bz2": ".bz2"}
+
+
+def compression_suffix(compression: Compression | None) -> str:
+    """Return the extension appended to the file names of networks written with ``compression``."""
+    if compression not in _SUFFIXES:
+        raise ValueError(f"Unknown compression {compression!r}, expected one of {[*_SUFFIXES][1:]}")
+    return _SUFFIXES[compression]
+
+
+def open_compressed(path: Path | str, mode: Literal["r", "w", "rb", "wb"], compression: Compression | None) -> IO[Any]:
+    """Open ``path`` like ``open``, (de)compressing what is written or read on the fly with ``compression``."""
+    if compression is None:
+        return open(path, mode)
+    text_mode = mode if "b" in mode else f"{mode}t"
+    if compression == "gzip":
+        return gzip.open(path, text_mode)
+    if compression == "lzma":
+        return lzma.open(path, text_mode)
+    if compression == "bz2":
+        return bz2.open(path, text_mode)
+    raise ValueError(f"Unknown compression {compression!r}, expected one of {[*_SUFFIXES][1:]}")
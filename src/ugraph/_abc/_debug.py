@@ -1,4 +1,9 @@
+import hashlib
+import json
+import math
 import warnings
+from array import array
+from collections import OrderedDict
 from collections.abc import Hashable, Sequence
 from pathlib import Path
 from typing import Any
@@ -6,14 +11,99 @@ from typing import Any
 import igraph as ig
 import plotly.graph_objects as go
 
+# above this many vertices, the layout is computed with the grid-based Fruchterman-Reingold algorithm, which scales
+# to large graphs, instead of Sugiyama (DAGs) or ``layout_auto``
+LARGE_GRAPH_VERTICES = 1000
+# the most recent layout is reused for a large graph if it places at least this share of its vertices (matched by
+# name), e.g. after a small edit; only the other vertices are placed, so the plots stay comparable
+INCREMENTAL_MIN_SHARE = 0.9
+# new vertices are offset from the centre of their neighbours by this share of the mean distance between vertices
+_NEW_VERTEX_OFFSET = 0.5
+_GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+_LAYOUT_CACHE_SIZE = 32
 
-def _get_layout(graph: ig.Graph, weights: Sequence[float] | None = None) -> ig.Layout:
-    """Return an appropriate layout for ``graph`` based on ``weights``."""
+# fingerprint -> vertex names and coordinates of the layout, the most recently used last
+_LAYOUT_CACHE: OrderedDict[str, tuple[list[Any], list[list[float]]]] = OrderedDict()
+
+
+def _get_layout(
+    graph: ig.Graph, weights: Sequence[float] | None = None, layout_cache: str | Path | None = None
+) -> ig.Layout:
+    """Return an appropriate layout for ``graph`` based on ``weights``.
+
+    Layouts are cached in memory by a fingerprint of the structure of ``graph``, and in the directory
+    ``layout_cache`` if given, so plotting the same graph again (e.g. on every validation failure) is free.
+    """
+    key = _fingerprint(graph, weights)
+    cached = _LAYOUT_CACHE.get(key)
+    cache_file = Path(layout_cache) / f"{key}.json" if layout_cache is not None else None
+    if cached is None and cache_file is not None and cache_file.is_file():
+        cached = tuple(json.loads(cache_file.read_text(encoding="utf-8")))
+    if cached is None:
+        cached = _names(graph), _compute_layout(graph, weights).coords
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(cached, default=str), encoding="utf-8")
+    _LAYOUT_CACHE[key] = cached
+    _LAYOUT_CACHE.move_to_end(key)
+    if len(_LAYOUT_CACHE) > _LAYOUT_CACHE_SIZE:
+        _LAYOUT_CACHE.popitem(last=False)
+    return ig.Layout(cached[1])
+
+
+def _compute_layout(graph: ig.Graph, weights: Sequence[float] | None) -> ig.Layout:
+    if graph.vcount() > LARGE_GRAPH_VERTICES:
+        seed = _seed_from_previous_layout(graph)
+        return ig.Layout(seed) if seed is not None else graph.layout_fruchterman_reingold(weights=weights, grid=True)
     if weights is not None:
         return graph.layout_auto(weights=weights)
     return graph.layout_sugiyama() if graph.is_dag() else graph.layout_auto()
 
 
+def _seed_from_previous_layout(graph: ig.Graph) -> list[list[float]] | None:
+    """Return the positions of the vertices of ``graph`` in the most recent layout, matched by name.
+
+    Returns None if that layout places less than ``INCREMENTAL_MIN_SHARE`` of the vertices. The others are placed
+    near the centre of their placed neighbours (or of all placed vertices), each at a small offset of its own so that
+    it does not cover a neighbour. Names are compared as strings, as layouts read from disk only have those.
+    """
+    if not _LAYOUT_CACHE or "name" not in graph.vs.attributes():
+        return None
+    previous_names, previous_coords = next(reversed(_LAYOUT_CACHE.values()))
+    previous = {str(name): position for name, position in zip(previous_names, previous_coords)}
+    seed: list[list[float] | None] = [previous.get(str(name)) for name in graph.vs["name"]]
+    placed = [position for position in seed if position is not None]
+    if len(placed) < INCREMENTAL_MIN_SHARE * graph.vcount():
+        return None
+    centre = [sum(axis) / len(placed) for axis in zip(*placed)]
+    extent = max((max(axis) - min(axis) for axis in zip(*placed)), default=0.0)
+    offset = _NEW_VERTEX_OFFSET * (extent / math.sqrt(len(placed)) if extent > 0 else 1.0)
+    for vertex, position in enumerate(seed):
+        if position is None:
+            neighbours = [seed[neighbour] for neighbour in graph.neighbors(vertex) if seed[neighbour] is not None]
+            position = [sum(axis) / len(neighbours) for axis in zip(*neighbours)] if neighbours else centre[:]
+            # a deterministic direction per vertex, spread evenly around the circle
+            position[0] += offset * math.cos(vertex * _GOLDEN_ANGLE)
+            position[1] += offset * math.sin(vertex * _GOLDEN_ANGLE)
+            seed[vertex] = position
+    return seed  # type: ignore[return-value]
+
+
+def _fingerprint(graph: ig.Graph, weights: Sequence[float] | None) -> str:
+    """Return a hash of the vertex count, the edge list, the vertex names and ``weights`` of ``graph``."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(array("q", [graph.vcount(), graph.is_directed()]).tobytes())
+    digest.update(array("q", [vertex for edge in graph.get_edgelist() for vertex in edge]).tobytes())
+    digest.update(json.dumps(_names(graph), default=str).encode("utf-8"))
+    if weights is not None:
+        digest.update(array("d", weights).tobytes())
+    return digest.hexdigest()
+
+
+def _names(graph: ig.Graph) -> list[Any]:
+    return graph.vs["name"] if "name" in graph.vs.attributes() else list(range(graph.vcount()))
+
+
 def debug_plot(
         graph: ig.Graph,
         with_labels: bool = True,
@@ -21,11 +111,12 @@ def debug_plot(
         weights: Sequence[float] | None = None,
         show_direction: bool = True,
         arrow_scale: float = 0.18,
+        layout_cache: str | Path | None = None,
         **kwargs: dict[Hashable, Any],
 ) -> None:
     if with_labels:
         graph.vs["label"] = graph.vs["name"]
-    layout = _get_layout(graph, weights)
+    layout = _get_layout(graph, weights, layout_cache)
 
     try:
         ig.plot(graph, layout=layout, bbox=(4000, 4000), vertex_size=3, **kwargs).save(
@@ -0,0 +1,179 @@
+"""Decoding plans compiled once per type hint and reused for every decoded object.
+
+A plan converts decoded JSON data to the hinted type exactly like the former recursive ``_dataclass_from_dict`` did,
+but resolves everything that only depends on the type ahead of time: the class behind a ``__class__`` path, the type
+hints of every dataclass (``get_type_hints`` is called once per class), the supertype of ``NewType`` hints, the
+alternatives of unions, the values of ``Literal`` hints and the element type of variadic tuple fields. Decoding an
+object then is a single loop over its fields.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import fields, is_dataclass
+from types import NoneType
+from typing import Any, Literal, get_args, get_origin, get_type_hints
+
+import igraph
+
+from ._union_tags import UNION_TAG_KEY, UNION_VALUE_KEY, alternative_tags, is_union
+
+Converter = Callable[[Any], Any]
+
+# builtin types ``t`` for which ``t(data)`` returns ``data`` itself if it already is of type ``t``
+_IMMUTABLE_BUILTINS = (str, int, float, bool)
+
+_converters: dict[Any, Converter] = {}
+_classes: dict[str, type] = {}
+_round_trips: dict[Any, bool] = {}
+
+
+def class_by_path(path: str) -> type:
+    """Return the class ``module.name`` refers to, importing its module only the first time."""
+    cls = _classes.get(path)
+    if cls is None:
+        module_name, class_name = path.rsplit(".", 1)
+        cls = _classes[path] = getattr(__import__(module_name, fromlist=[class_name]), class_name)
+    return cls
+
+
+def converter_for(hint: Any) -> Converter:
+    """Return the (cached) converter of decoded JSON data to ``hint``."""
+    try:
+        return _converters[hint]
+    except KeyError:
+        converter = _converters[hint] = _compile(hint)
+    except TypeError:  # unhashable hints are compiled every time
+        converter = _compile(hint)
+    return converter
+
+
+def field_converter_for(hint: Any) -> Converter:
+    """Return the converter for a dataclass field, which additionally converts lists to variadic tuples."""
+    args = get_args(hint)
+    if len(args) > 0 and args[-1] is Ellipsis:
+        convert_element = converter_for(args[0])
+        return lambda data: tuple(map(convert_element, data))
+    return converter_for(hint)
+
+
+def round_trips(hint: Any) -> bool:
+    """Return whether values of type ``hint``, encoded to JSON with tagged unions, are decoded to equal values.
+
+    The plans convert anything else by calling the hinted type on the decoded JSON data: e.g. ``dict`` or ``list``
+    return nested dataclasses as dictionaries, and calling ``Any`` or a ``TypeVar`` fails.
+    """
+    try:
+        return _round_trips[hint]
+    except KeyError:
+        _round_trips[hint] = False  # a recursive dataclass is not assumed to round-trip while it is checked
+        result = _round_trips[hint] = _check_round_trip(hint)
+    except TypeError:  # unhashable hints are checked every time
+        result = _check_round_trip(hint)
+    return result
+
+
+class DataclassPlan:
+    """Converter of a decoded dictionary to an instance of ``cls``; the field converters are compiled on first use."""
+
+    __slots__ = ("cls", "_fields")
+
+    def __init__(self, cls: type) -> None:
+        self.cls = cls
+        self._fields: tuple[tuple[str, Converter], ...] | None = None
+
+    def __call__(self, data: Any) -> Any:
+        plan = self._fields
+        if plan is None:
+            plan = self._fields = tuple(
+                (name, field_converter_for(hint)) for name, hint in get_type_hints(self.cls).items()
+            )
+        return self.cls(**{name: convert(data[name]) for name, convert in plan if name in data})
+
+
+def _compile(hint: Any) -> Converter:
+    if is_union(hint):
+        return _union_converter(hint)
+    origin = get_origin(hint)
+    if hasattr(hint, "__supertype__"):
+        # calling a NewType returns its argument unchanged
+        return converter_for(hint.__supertype__)
+    if origin is Literal:
+        return _literal_converter(hint)
+    if isinstance(hint, type) and is_dataclass(hint):
+        return DataclassPlan(hint)
+    return _class_converter(hint)
+
+
+def _check_round_trip(hint: Any) -> bool:
+    if is_union(hint):
+        return all(map(round_trips, get_args(hint)))
+    if hasattr(hint, "__supertype__"):
+        return round_trips(hint.__supertype__)
+    origin = get_origin(hint)
+    if origin is Literal:
+        return True
+    if origin is tuple:
+        # only dataclass fields convert the elements of variadic tuples, so these must be of a JSON type
+        args = get_args(hint)
+        return len(args) == 2 and args[-1] is Ellipsis and args[0] in _IMMUTABLE_BUILTINS
+    if isinstance(hint, type) and is_dataclass(hint):
+        hints = get_type_hints(hint)
+        return all(round_trips(hints[field.name]) for field in fields(hint) if field.init)
+    return hint is NoneType or (isinstance(hint, type) and issubclass(hint, _IMMUTABLE_BUILTINS))
+
+
+def _union_converter(hint: Any) -> Converter:
+    alternatives = get_args(hint)
+    converters = tuple(map(converter_for, alternatives))
+    by_tag = dict(zip(alternative_tags(hint), converters))
+    # without dataclass alternatives (a dataclass without fields accepts None), every alternative either returns None
+    # for None or fails, and NoneType returns it
+    optional = NoneType in alternatives and not any(map(is_dataclass, alternatives))
+
+    def convert(data: Any) -> Any:
+        if data is None and optional:
+            return None
+        if type(data) is dict and UNION_TAG_KEY in data:  # pylint: disable=unidiomatic-typecheck
+            tag = data[UNION_TAG_KEY]
+            if tag not in by_tag:
+                raise ValueError(f"Unknown union tag {tag!r} for {hint}, expected one of {tuple(by_tag)}")
+            return by_tag[tag](data[UNION_VALUE_KEY])
+        # untagged values: the first alternative that accepts the value
+        for alternative in converters:
+            try:
+                return alternative(data)
+            except Exception:  # pylint: disable=broad-except
+                pass
+        raise ValueError(f"Could not convert {data} to any of {alternatives}")
+
+    return convert
+
+
+def _literal_converter(hint: Any) -> Converter:
+    values = get_args(hint)
+
+    def convert(data: Any) -> Any:
+        if data in values:
+            return data  # Valid literal value
+        raise ValueError(f"Value {data} is not a valid Literal for {hint}")
+
+    return convert
+
+
+def _class_converter(cls: Any) -> Converter:
+    if cls in _IMMUTABLE_BUILTINS:
+
+        def convert_builtin(data: Any) -> Any:
+            if data is None or type(data) is cls:  # pylint: disable=unidiomatic-typecheck
+                return data
+            return cls(data)
+
+        return convert_builtin
+
+    def convert(data: Any) -> Any:
+        if isinstance(data, igraph.Graph) or data is None:
+            return data
+        return cls(data)
+
+    return convert
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_SIZE = 32
+
+
+class DerivedCache:
+    """Version counters of a network together with a bounded LRU cache of results derived from it.
+
+    ``version`` is bumped by every mutation, ``structural_version`` only by mutations that add or remove nodes or
+    links. Every entry remembers the versions it was computed at; an entry looked up as ``structural`` stays valid
+    while only attributes change (e.g. after ``replace_node``), any other entry is recomputed after every mutation.
+    Entries are not pickled.
+    """
+
+    __slots__ = ("version", "structural_version", "_entries", "_max_size")
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.version = 0
+        self.structural_version = 0
+        self._entries: OrderedDict[Hashable, tuple[int, int, Any]] = OrderedDict()
+        self._max_size = max_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def bump(self, structural: bool) -> None:
+        self.version += 1
+        if structural:
+            self.structural_version += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T], structural: bool) -> T:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == self.structural_version and (structural or entry[1] == self.version):
+            self._entries.move_to_end(key)
+            return entry[2]
+        value = compute()
+        self._entries[key] = (self.structural_version, self.version, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def copy(self) -> DerivedCache:
+        copied = DerivedCache(self._max_size)
+        copied.version, copied.structural_version = self.version, self.structural_version
+        copied._entries = self._entries.copy()  # pylint: disable=protected-access
+        return copied
+
+    def __getstate__(self) -> tuple[int, int, int]:
+        return self.version, self.structural_version, self._max_size
+
+    def __setstate__(self, state: tuple[int, int, int]) -> None:
+        self.version, self.structural_version, self._max_size = state
+        self._entries = OrderedDict()
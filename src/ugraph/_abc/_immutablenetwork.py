@@ -1,25 +1,40 @@
 from __future__ import annotations
 
+import io
 import json
+import mmap
+import pickle
 import warnings
+import weakref
 from abc import ABC
-from collections.abc import Iterable
-from dataclasses import asdict, dataclass, is_dataclass
+from array import array
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
-from types import UnionType
-from typing import Any, Generic, Iterator, Literal, NewType, Type, TypeVar, Union, get_args, get_origin, get_type_hints
+from typing import AbstractSet, Any, Generic, Iterator, Literal, Type, TypeVar
 
 import igraph
 
+from ._binary import class_path, is_lossless, open_graph, read_graph, write_graph
+from ._columns import NetworkColumns
+from ._compression import Compression, compression_suffix, open_compressed
 from ._debug import debug_plot
-from ._link import EndNodeIdPair, LinkABC, LinkTypeT
+from ._decoder_plans import class_by_path, converter_for, field_converter_for
+from ._derived_cache import DerivedCache
+from ._lazy_attributes import LazyAttributes, LazyColumn
+from ._link import EndNodeIdPair, LinkABC, LinkIndex, LinkTypeT
+from ._networkview import NetworkView
 from ._node import BaseNodeType, NodeABC, NodeId, NodeIndex
+from ._node_id_index import NodeIdIndex
+from ._shared_network import SharedNetwork
+from ._union_tags import tag_value, tagged_dataclass_dict
+from ._weak_components import WeakComponentIndex
 
 NodeT = TypeVar("NodeT", bound=NodeABC)
 LinkT = TypeVar("LinkT", bound=LinkABC)
 NodeTypeT = TypeVar("NodeTypeT", bound=BaseNodeType)
 Self = TypeVar("Self", bound="ImmutableNetworkABC")
-LinkIndex = NewType("LinkIndex", int)
+T = TypeVar("T")
 
 VERTEX_NAME_KEY: Literal["name"] = "name"  # is given by igraph library
 assert VERTEX_NAME_KEY == "name"  # is given by igraph library and cannot be changed
@@ -32,6 +47,23 @@ assert LINK_ATTRIBUTE_KEY != VERTEX_NAME_KEY  # must be different
 assert NODE_ATTRIBUTE_KEY == "node"  # must be "node"
 assert LINK_ATTRIBUTE_KEY == "link"  # must be "link"
 
+# keys of the results that the network memoises itself via ``cached``
+_IS_DAG_KEY = "ugraph.is_dag"
+_IS_SIMPLE_KEY = "ugraph.is_simple"
+_TOPOLOGICAL_ORDER_KEY = "ugraph.topological_order"
+
+# structures derived from the graph, shared and copied together with it (see ``copy``)
+_GRAPH_DERIVED_ATTRIBUTES = ("_node_id_index", "_columns", "_weak_components")
+
+# attributes that ``__reduce_ex__`` does not pickle, as they are rebuilt together with the graph
+_PICKLED_WITH_GRAPH = ("_underlying_digraph", "_graph_sharers", "_lazy", *_GRAPH_DERIVED_ATTRIBUTES)
+
+# attributes (of mutable networks) that hold open files, they are reset to None when pickled
+_NOT_PICKLED = ("_journal",)
+
+# number of nodes or links converted at a time by ``write_json``
+_JSON_CHUNK_SIZE = 10_000
+
 
 @dataclass(init=False, frozen=True, eq=False)
 class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
@@ -41,6 +73,18 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
         if not _underlying_digraph.is_directed():
             raise TypeError("Only directed graphs allowed")
         object.__setattr__(self, "_underlying_digraph", _underlying_digraph)
+        self._node_id_index: NodeIdIndex
+        object.__setattr__(self, "_node_id_index", NodeIdIndex())
+        self._columns: NetworkColumns
+        object.__setattr__(self, "_columns", NetworkColumns())
+        self._weak_components: WeakComponentIndex
+        object.__setattr__(self, "_weak_components", WeakComponentIndex())
+        self._graph_sharers: weakref.WeakValueDictionary[int, ImmutableNetworkABC] | None
+        object.__setattr__(self, "_graph_sharers", None)
+        self._derived: DerivedCache
+        object.__setattr__(self, "_derived", DerivedCache())
+        self._lazy: LazyAttributes | None
+        object.__setattr__(self, "_lazy", None)
 
     def __hash__(self) -> int:
         return id(self)
@@ -56,6 +100,15 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
             f"compare nodes and links"
         )
 
+    @property
+    def read_only_digraph(self) -> igraph.Graph:
+        """Return the graph for reading, e.g. to run an igraph algorithm on it; it must not be modified.
+
+        Unlike ``MutableNetworkABC.underlying_digraph``, this keeps the derived indices, the copies sharing the graph
+        and the views on the network valid.
+        """
+        return self._attributed_graph()
+
     @property
     def n_count(self) -> int:
         return self._underlying_digraph.vcount()
@@ -64,6 +117,24 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
     def l_count(self) -> int:
         return self._underlying_digraph.ecount()
 
+    @property
+    def version(self) -> int:
+        """Counter bumped by every mutation of this network (including attribute replacements)."""
+        return self._derived.version
+
+    @property
+    def structural_version(self) -> int:
+        """Counter bumped by every mutation that adds or removes nodes or links."""
+        return self._derived.structural_version
+
+    def cached(self: Self, key: Hashable, compute: Callable[[Self], T], structural: bool = False) -> T:
+        """Return ``compute(self)``, reusing the result stored under ``key`` if the network did not change since.
+
+        With ``structural``, the result is reused as long as no node or link was added or removed, i.e. it must only
+        depend on the structure of the graph. The cache keeps the most recently used results only.
+        """
+        return self._derived.get_or_compute(key, lambda: compute(self), structural)
+
     @property
     def node_ids(self) -> list[NodeId]:
         if self._underlying_digraph.vcount() == 0:
@@ -84,10 +155,8 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
         return self.iter_end_node_id_pairs()
 
     def iter_end_node_id_pairs(self) -> Iterator[EndNodeIdPair]:
-        return (
-            EndNodeIdPair((es.source_vertex[VERTEX_NAME_KEY], es.target_vertex[VERTEX_NAME_KEY]))
-            for es in self._underlying_digraph.es
-        )  # noqa
+        names = self.node_ids
+        return (EndNodeIdPair((names[s], names[t])) for s, t in self._underlying_digraph.get_edgelist())
 
     @property
     def edge_tuple_iterator(self) -> Iterator[tuple[NodeIndex, NodeIndex]]:
@@ -97,23 +166,34 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
         return self.iter_edge_tuples()
 
     def iter_edge_tuples(self) -> Iterator[tuple[NodeIndex, NodeIndex]]:
-        return (es.tuple for es in self._underlying_digraph.es)
+        return iter(self._underlying_digraph.get_edgelist())
 
     @property
     def all_links(self) -> list[LinkT]:
+        if (column := self._lazy_column(LINK_ATTRIBUTE_KEY, of_vertices=False)) is not None:
+            return column.all()
         if self._underlying_digraph.ecount() == 0:
             return []
         return self._underlying_digraph.es[LINK_ATTRIBUTE_KEY]
 
     @property
     def all_nodes(self) -> list[NodeT]:
+        if (column := self._lazy_column(NODE_ATTRIBUTE_KEY, of_vertices=True)) is not None:
+            return column.all()
         if self._underlying_digraph.vcount() == 0:
             return []
         return self._underlying_digraph.vs[NODE_ATTRIBUTE_KEY]
 
     def node_index_by_id(self, node_id: NodeId) -> NodeIndex:
         """Return the index for the node with ``node_id``."""
-        return self._underlying_digraph.vs.find(node_id).index
+        return self._node_id_index.index_of(self._underlying_digraph, node_id)
+
+    def node_indices_by_ids(self, node_ids: Iterable[NodeId]) -> list[NodeIndex]:
+        """Return the indices for the nodes with ``node_ids`` (in the given order)."""
+        return self._node_id_index.indices_of(self._underlying_digraph, node_ids)
+
+    def has_node_id(self, node_id: NodeId) -> bool:
+        return self._node_id_index.contains(self._underlying_digraph, node_id)
 
     def node_index_by_name(self, node_name: NodeId) -> NodeIndex:
         warnings.warn(
@@ -123,7 +203,11 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
 
     def node_id_by_index(self, node_index: NodeIndex) -> NodeId:
         """Return the node id for ``node_index``."""
-        return self._underlying_digraph.vs[VERTEX_NAME_KEY][node_index]
+        return self._vertex_attribute(node_index, VERTEX_NAME_KEY)
+
+    def node_ids_by_indices(self, indices: Iterable[NodeIndex]) -> list[NodeId]:
+        """Return the node ids for ``indices`` (in the given order)."""
+        return self._vertex_attributes(indices, VERTEX_NAME_KEY)
 
     def node_name_by_index(self, node_index: NodeIndex) -> NodeId:
         warnings.warn(
@@ -132,7 +216,7 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
         return self.node_id_by_index(node_index)
 
     def node_by_index(self, node_index: NodeIndex) -> NodeT:
-        return self._underlying_digraph.vs[NODE_ATTRIBUTE_KEY][node_index]
+        return self._vertex_attribute(node_index, NODE_ATTRIBUTE_KEY)
 
     def node_by_id(self, n_id: NodeId) -> NodeT:
         return self.node_by_index(self.node_index_by_id(n_id))
@@ -153,7 +237,7 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
         return self._underlying_digraph.es.find(_from=source, _to=target)
 
     def link_by_index(self, idx: LinkIndex) -> LinkT:
-        return self._underlying_digraph.es[LINK_ATTRIBUTE_KEY][idx]
+        return self._edge_attribute(idx, LINK_ATTRIBUTE_KEY)
 
     def link_by_source_target(self, source_id: NodeId | NodeIndex, target_id: NodeId | NodeIndex) -> LinkT:
         return self.link_by_index(self.link_index_by_source_target(source_id, target_id))
@@ -185,7 +269,41 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
         return self.iter_links_with_tuples()
 
     def iter_links_with_tuples(self) -> Iterator[tuple[tuple[NodeIndex, NodeIndex], LinkT]]:
-        return zip((es.tuple for es in self._underlying_digraph.es), self.all_links, strict=True)
+        return zip(self._underlying_digraph.get_edgelist(), self.all_links, strict=True)
+
+    def node_type_column(self) -> array[int]:
+        """Return the node types (as ``int``) of all nodes in index order."""
+        return array("q", self._columns.node_types(self._attributed_graph(edges=False)))
+
+    def link_type_column(self) -> array[int]:
+        """Return the link types (as ``int``) of all links in index order."""
+        return array("q", self._columns.link_types(self._attributed_graph(vertices=False)))
+
+    def coordinate_column(self) -> array[float]:
+        """Return the coordinates of all nodes as a row-major (N, 3) array, i.e. ``x_0, y_0, z_0, x_1, ...``."""
+        return array("d", self._columns.coordinates(self._attributed_graph(edges=False)))
+
+    def node_indices_of_type(self, types: AbstractSet[NodeTypeT]) -> list[NodeIndex]:
+        """Return the ascending indices of all nodes with a type in ``types``."""
+        return self._columns.node_indices_with_types(self._attributed_graph(edges=False), types)
+
+    def nodes_of_type(self, types: AbstractSet[NodeTypeT]) -> list[NodeT]:
+        return self.nodes_by_indices(self.node_indices_of_type(types))
+
+    def link_indices_of_type(self, types: AbstractSet[LinkTypeT]) -> list[LinkIndex]:
+        """Return the ascending indices of all links with a type in ``types``."""
+        return self._columns.link_indices_with_types(self._attributed_graph(vertices=False), types)
+
+    def links_of_type(self, types: AbstractSet[LinkTypeT]) -> list[LinkT]:
+        return self.links_by_indices(self.link_indices_of_type(types))
+
+    def node_distances(self, index_pairs: Iterable[tuple[NodeIndex, NodeIndex]]) -> list[float]:
+        """Return ``node_distance`` for every pair of node indices, computed from the coordinate column."""
+        return self._columns.distances(self._attributed_graph(edges=False), index_pairs)
+
+    def link_lengths(self) -> list[float]:
+        """Return the distance between the end nodes of every link in index order."""
+        return self.node_distances(self._underlying_digraph.get_edgelist())
 
     def in_degrees(self) -> list[int]:
         return self._underlying_digraph.indegree()
@@ -196,12 +314,27 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
     def degrees(self) -> list[int]:
         return self._underlying_digraph.degree()
 
+    def is_dag(self) -> bool:
+        """Return whether the network has no directed cycle (memoised until nodes or links are added or removed)."""
+        graph = self._underlying_digraph
+        return self.cached(_IS_DAG_KEY, lambda _: graph.is_dag(), structural=True)
+
+    def is_simple(self) -> bool:
+        """Return whether the network has neither loops nor multiple links (memoised like ``is_dag``)."""
+        graph = self._underlying_digraph
+        return self.cached(_IS_SIMPLE_KEY, lambda _: graph.is_simple(), structural=True)
+
+    def topological_order(self) -> list[NodeIndex]:
+        """Return the node indices in topological order (memoised like ``is_dag``); raise if there is a cycle."""
+        if not self.is_dag():
+            raise ValueError(f"{self.__class__.__name__} contains a cycle and has no topological order")
+        graph = self._underlying_digraph
+        return list(self.cached(_TOPOLOGICAL_ORDER_KEY, lambda _: tuple(graph.topological_sorting()), structural=True))
+
     def incident_links_per_node(
         self, idx: NodeId | NodeIndex, mode: Literal["in", "out", "all"] = "all"
     ) -> list[LinkT]:
-        return [
-            self._underlying_digraph.es[i][LINK_ATTRIBUTE_KEY] for i in self._underlying_digraph.incident(idx, mode)
-        ]
+        return self._edge_attributes(self._underlying_digraph.incident(idx, mode), LINK_ATTRIBUTE_KEY)
 
     def incident_link_idx_per_node(
         self, idx: NodeId | NodeIndex, mode: Literal["in", "out", "all"] = "all"
@@ -209,9 +342,7 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
         return self._underlying_digraph.incident(vertex=idx, mode=mode)
 
     def neighbors(self, idx: NodeId | NodeIndex, mode: Literal["in", "out", "all"] = "all") -> list[NodeT]:
-        return self._underlying_digraph.vs[self._underlying_digraph.neighbors(vertex=idx, mode=mode)][
-            NODE_ATTRIBUTE_KEY
-        ]
+        return self._vertex_attributes(self._underlying_digraph.neighbors(vertex=idx, mode=mode), NODE_ATTRIBUTE_KEY)
 
     @classmethod
     def create_empty(cls: Type[Self]) -> Self:
@@ -220,8 +351,16 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
         return cls(g)
 
     def copy(self: Self) -> Self:
-        """Return a shallow copy of this network."""
-        return self.__class__(self._underlying_digraph.copy())
+        """Return a shallow copy of this network.
+
+        The copy is copy-on-write: it shares the graph (and the derived indices) with this network, so it is O(1).
+        Whichever of the sharing networks is mutated first (or hands out its graph via ``underlying_digraph``)
+        copies the graph physically before doing so.
+        """
+        copied = self.__class__(self._underlying_digraph)
+        copied._share_graph_of(self)  # pylint: disable=protected-access
+        object.__setattr__(copied, "_derived", self._derived.copy())
+        return copied
 
     @property
     def shallow_copy(self: Self) -> Self:
@@ -230,7 +369,7 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
         return self.copy()
 
     def nodes_by_indices(self, indices: Iterable[NodeIndex]) -> list[NodeT]:
-        return self._underlying_digraph.vs.select(indices)[NODE_ATTRIBUTE_KEY]
+        return self._vertex_attributes(indices, NODE_ATTRIBUTE_KEY)
 
     def nodes_by_indexes(self, indexes: Iterable[NodeIndex]) -> list[NodeT]:
         warnings.warn(
@@ -239,15 +378,18 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
         return self.nodes_by_indices(indexes)
 
     def nodes_by_ids(self, ids: Iterable[NodeId]) -> list[NodeT]:
-        """Return the nodes for the given ids."""
-        return self._underlying_digraph.vs.select(name_in=ids)[NODE_ATTRIBUTE_KEY]
+        """Return the nodes for the given ids (in index order, unknown ids are skipped)."""
+        mapping = self._node_id_index.mapping(self._underlying_digraph)
+        return self._vertex_attributes(
+            sorted({mapping[node_id] for node_id in ids if node_id in mapping}), NODE_ATTRIBUTE_KEY
+        )
 
     def nodes_by_names(self, names: Iterable[NodeId]) -> list[NodeT]:
         warnings.warn("nodes_by_names is deprecated, use nodes_by_ids() instead", DeprecationWarning, stacklevel=2)
         return self.nodes_by_ids(names)
 
     def links_by_indices(self, indices: Iterable[LinkIndex]) -> list[LinkT]:
-        return self._underlying_digraph.es.select(indices)[LINK_ATTRIBUTE_KEY]
+        return self._edge_attributes(indices, LINK_ATTRIBUTE_KEY)
 
     def links_by_indexes(self, indexes: Iterable[LinkIndex]) -> list[LinkT]:
         warnings.warn(
@@ -255,34 +397,266 @@ class ImmutableNetworkABC(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
         )
         return self.links_by_indices(indexes)
 
+    # Accessor layer: read single elements or batches of elements without materialising whole attribute columns
+    # (``vs[key]``/``es[key]`` copy the complete column into a new list on every call).
+
+    # Attributes loaded lazily (see ``read_binary(mapped=True)``) are decoded here on first access.
+
+    def _vertex_attribute(self, index: NodeIndex, key: str) -> Any:
+        if (column := self._lazy_column(key, of_vertices=True)) is not None:
+            return column.get(index)
+        return self._underlying_digraph.vs[index][key]
+
+    def _vertex_attributes(self, indices: Iterable[NodeIndex], key: str) -> list[Any]:
+        if (column := self._lazy_column(key, of_vertices=True)) is not None:
+            return column.get_many(indices)
+        selected = self._underlying_digraph.vs.select(indices)
+        return selected[key] if len(selected) > 0 else []
+
+    def _edge_attribute(self, index: LinkIndex, key: str) -> Any:
+        if (column := self._lazy_column(key, of_vertices=False)) is not None:
+            return column.get(index)
+        return self._underlying_digraph.es[index][key]
+
+    def _edge_attributes(self, indices: Iterable[LinkIndex], key: str) -> list[Any]:
+        if (column := self._lazy_column(key, of_vertices=False)) is not None:
+            return column.get_many(indices)
+        selected = self._underlying_digraph.es.select(indices)
+        return selected[key] if len(selected) > 0 else []
+
+    def materialise(self) -> None:
+        """Decode all nodes and links that are still loaded lazily (see ``read_json`` and ``read_binary``) now.
+
+        Lazily loaded networks are also materialised by everything that needs the objects stored in the graph, e.g.
+        mutations, ``underlying_digraph``, ``read_only_digraph``, subnetworks, pickling and writing the network.
+        """
+        self._attributed_graph()
+
+    def _lazy_column(self, key: str, of_vertices: bool) -> LazyColumn | None:
+        lazy = self._lazy
+        if lazy is None:
+            return None
+        if not lazy.pending:  # materialised by a network sharing the graph
+            object.__setattr__(self, "_lazy", None)
+            return None
+        return (lazy.vertex if of_vertices else lazy.edge).get(key)
+
+    def _attributed_graph(self, vertices: bool = True, edges: bool = True) -> igraph.Graph:
+        """Return the graph with the vertex and/or edge attributes stored in it, decoding the lazily loaded ones."""
+        lazy = self._lazy
+        if lazy is not None:
+            lazy.materialise(self._underlying_digraph, vertices, edges)
+            if not lazy.pending:
+                object.__setattr__(self, "_lazy", None)
+        return self._underlying_digraph
+
+    def view(
+        self, node_indices: Iterable[NodeIndex] | None = None, link_indices: Iterable[LinkIndex] | None = None
+    ) -> NetworkView[NodeT, LinkT, NodeTypeT, LinkTypeT]:
+        """Return a read-only view restricted to the given nodes and/or links, without copying the graph."""
+        return NetworkView.from_indices(self, node_indices, link_indices)
+
     def weak_components(self: Self) -> tuple[Self, ...]:
-        return tuple(self.__class__(graph) for graph in self._underlying_digraph.components(mode="weak").subgraphs())
+        """Return every weakly connected component as a new network, ordered by component id."""
+        return tuple(self.iter_weak_components())
+
+    def iter_weak_components(self: Self) -> Iterator[Self]:
+        """Yield the weakly connected components as new networks, building each one only when it is reached."""
+        graph = self._attributed_graph()
+        return (self.__class__(graph.subgraph(members)) for members in self._weak_components.component_members(graph))
+
+    def weak_component(self: Self, component_id: int) -> Self:
+        """Return the weakly connected component with the given id (see ``component_id_of``) as a new network."""
+        graph = self._attributed_graph()
+        return self.__class__(graph.subgraph(self._weak_components.members_of(graph, component_id)))
+
+    def component_id_of(self, node: NodeId | NodeIndex) -> int:
+        """Return the id of the weakly connected component of a node, which is the lowest node index it contains."""
+        index = node if isinstance(node, int) else self.node_index_by_id(node)
+        return self._weak_components.component_id_of(self._underlying_digraph, index)
+
+    def component_sizes(self) -> dict[int, int]:
+        """Return the number of nodes of every weakly connected component, by component id in ascending order."""
+        return self._weak_components.component_sizes(self._underlying_digraph)
+
+    def _share_graph_of(self, source: ImmutableNetworkABC) -> None:
+        """Replace the graph (and the derived indices) of this network by the ones of ``source``, sharing them."""
+        # pylint: disable=protected-access
+        if self._graph_sharers is not None:
+            self._graph_sharers.pop(id(self), None)
+        sharers = source._graph_sharers
+        if sharers is None:
+            sharers = weakref.WeakValueDictionary({id(source): source})
+            object.__setattr__(source, "_graph_sharers", sharers)
+        object.__setattr__(self, "_underlying_digraph", source._underlying_digraph)
+        object.__setattr__(self, "_lazy", source._lazy)
+        for name in _GRAPH_DERIVED_ATTRIBUTES:
+            object.__setattr__(self, name, getattr(source, name))
+        object.__setattr__(self, "_graph_sharers", sharers)
+        sharers[id(self)] = self
+
+    def _bump_version(self, structural: bool) -> None:
+        self._derived.bump(structural)
+
+    def _detach_shared_graph(self) -> None:
+        """Give this network its own graph if it currently shares it with copies (see ``copy``)."""
+        self._attributed_graph()  # mutations work on the attributes of the graph
+        sharers = self._graph_sharers
+        if sharers is None:
+            return
+        object.__setattr__(self, "_graph_sharers", None)
+        sharers.pop(id(self), None)
+        if len(sharers) == 0:
+            return  # all other sharers are gone, the graph is ours
+        object.__setattr__(self, "_underlying_digraph", self._underlying_digraph.copy())
+        for name in _GRAPH_DERIVED_ATTRIBUTES:
+            object.__setattr__(self, name, getattr(self, name).copy())
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        """Pickle the graph in the columnar binary format instead of as igraph's per-element attribute lists.
+
+        With protocol 5, the binary representation is a ``pickle.PickleBuffer`` that is sent out-of-band if the
+        pickler has a ``buffer_callback``. The unpickled network is loaded from the buffer without copying it: the
+        structure and the node ids immediately, the node and link objects on first access (see ``materialise``).
+        Networks with additional dataclass fields, or with values the binary format cannot encode or would not decode
+        to equal values (e.g. fields hinted as ``dict``, ``Any`` or a ``TypeVar``), are pickled as before (see
+        ``__getstate__``).
+        """
+        if [field.name for field in fields(self)] != ["_underlying_digraph"]:
+            return super().__reduce_ex__(protocol)
+        try:
+            data, lossless = self._binary()
+        except (TypeError, ValueError):
+            return super().__reduce_ex__(protocol)
+        if not lossless:
+            return super().__reduce_ex__(protocol)
+        buffer = pickle.PickleBuffer(data) if protocol >= 5 else data.tobytes()
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in _PICKLED_WITH_GRAPH and name not in _NOT_PICKLED
+        }
+        return self.__class__._from_buffer, (buffer,), state
+
+    def share(self: Self) -> SharedNetwork[Self]:
+        """Publish the network into shared memory once, such that worker processes can open it without pickling it.
+
+        Use the result as a context manager and send its ``SharedNetworkHandle`` to the workers, see ``SharedNetwork``.
+        Raises a ``ValueError`` if the workers would not decode equal nodes and links (see ``__reduce_ex__``). The block
+        is freed by ``SharedNetwork.close`` only, it is not freed when the process crashes before.
+        """
+        data, lossless = self._binary()
+        if not lossless:
+            raise ValueError(f"This {self.__class__.__name__} cannot be shared without losing data, pickle it instead")
+        return SharedNetwork(self.__class__, data)
+
+    def _binary(self) -> tuple[memoryview, bool]:
+        """Return the network in the binary format of ``write_binary``, and whether it is decoded to equal values."""
+        file = io.BytesIO()
+        header = write_graph(file, self._attributed_graph(), class_path(self.__class__), _encode_json)
+        return file.getbuffer().toreadonly(), is_lossless(header)
+
+    @classmethod
+    def _from_buffer(cls: Type[Self], buffer: Any) -> Self:
+        """Open the network in the binary format held by ``buffer`` without copying it, decoding elements lazily."""
+        _, graph, lazy = open_graph(memoryview(buffer).cast("B"), _decode_json)
+        network = cls(graph)
+        object.__setattr__(network, "_lazy", lazy)
+        return network
+
+    def __getstate__(self) -> dict[str, Any]:
+        self._attributed_graph()
+        state = dict(self.__dict__)
+        state["_graph_sharers"] = None
+        state.update((name, None) for name in _NOT_PICKLED if name in state)
+        if self._graph_sharers is not None and len(self._graph_sharers) > 1:
+            # networks pickled together must not end up sharing one graph without knowing about it
+            state["_underlying_digraph"] = self._underlying_digraph.copy()
+            state.update((name, getattr(self, name).copy()) for name in _GRAPH_DERIVED_ATTRIBUTES)
+        return state
 
     def debug_plot(self, file_name: Path | str | None = None, with_labels: bool = True, **kwargs: Any) -> None:
-        debug_plot(self._underlying_digraph, with_labels, file_name, **kwargs)
+        debug_plot(self._attributed_graph(), with_labels, file_name, **kwargs)
+
+    def write_json(self, path: Path | str, tag_unions: bool = False, compression: Compression | None = None) -> None:
+        """Write the network as JSON; see ``ImmutableNetworkEncoder`` for ``tag_unions``.
+
+        With ``compression`` (``"gzip"``, ``"lzma"`` or ``"bz2"``), every chunk is compressed as it is written, and the
+        file name must end with the extension of the codec (``.gz``, ``.xz`` or ``.bz2``) after ``.json``.
+        """
+        name = f"{self.__class__.__name__}.json{compression_suffix(compression)}"
+        assert str(path).endswith(name), f"File name must end with {name}"
+        with open_compressed(path, "w", compression) as file:
+            file.writelines(_iter_json_chunks(self, tag_unions=tag_unions))
 
-    def write_json(self, path: Path | str) -> None:
-        assert str(path).endswith(
-            f"{self.__class__.__name__}.json"
-        ), f"File name must end with {self.__class__.__name__}.json"
-        with open(path, "w") as file:
-            json.dump(self, file, cls=ImmutableNetworkEncoder)
+    @classmethod
+    def read_json(
+        cls: Type[Self], path: Path | str, lazy: bool = False, compression: Compression | None = None
+    ) -> Self:
+        """Read a network written by ``write_json`` (with the same ``compression``), decompressing while parsing.
+
+        With ``lazy``, the graph structure and the node ids are built immediately, but every node and link object is
+        only decoded from its record when it is first accessed (and then kept), see ``materialise``.
+        """
+        name = f"{cls.__name__}.json{compression_suffix(compression)}"
+        assert str(path).endswith(name), f"File name must end with {name}"
+        with open_compressed(path, "r", compression) as file:
+            if not lazy:
+                return json.load(file, cls=ImmutableNetworkDecoder)
+            data = json.load(file)
+        return _lazy_network_from_json(data)
+
+    def write_binary(self, path: Path | str, compression: Compression | None = None) -> None:
+        """Write the network in the columnar binary format, a compact and faster alternative to ``write_json``.
+
+        With ``compression``, every column is compressed as it is written, see ``write_json``.
+        """
+        name = f"{self.__class__.__name__}.bin{compression_suffix(compression)}"
+        assert str(path).endswith(name), f"File name must end with {name}"
+        with open_compressed(path, "wb", compression) as file:
+            write_graph(file, self._attributed_graph(), class_path(self.__class__), _encode_json)
 
     @classmethod
-    def read_json(cls: Type[Self], path: Path | str) -> Self:
-        assert str(path).endswith(f"{cls.__name__}.json"), f"File name must end with {cls.__name__}.json"
-        with open(path, "r") as file:
-            return json.load(file, cls=ImmutableNetworkDecoder)
+    def read_binary(
+        cls: Type[Self], path: Path | str, mapped: bool = False, compression: Compression | None = None
+    ) -> Self:
+        """Read a network written by ``write_binary`` (with the same ``compression``).
+
+        With ``mapped``, the file is memory-mapped (read-only) instead of read: the graph structure and the node ids
+        are loaded immediately, every node and link object is decoded from the mapped columns when it is first
+        accessed (and then kept). Processes mapping the same file share its pages. Anything that needs the attributes
+        inside the graph (mutations, ``read_only_digraph``, subnetworks, type/coordinate columns, serialisation, ...)
+        decodes the remaining objects first. Compressed files cannot be mapped.
+        """
+        name = f"{cls.__name__}.bin{compression_suffix(compression)}"
+        assert str(path).endswith(name), f"File name must end with {name}"
+        if mapped and compression is not None:
+            raise ValueError("Compressed files cannot be memory-mapped")
+        with open_compressed(path, "rb", compression) as file:
+            if not mapped:
+                network_class, graph = read_graph(file, _decode_json)
+                return class_by_path(network_class)(graph)
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        network_class, graph, lazy = open_graph(buffer, _decode_json)
+        network = class_by_path(network_class)(graph)
+        object.__setattr__(network, "_lazy", lazy)
+        return network
 
 
 class ImmutableNetworkEncoder(json.JSONEncoder):
+    def __init__(self, *args, tag_unions: bool = False, **kwargs) -> None:  # type: ignore
+        """With ``tag_unions``, values of union-typed fields of nodes and links are written together with the
+        alternative they belong to (see ``_union_tags``), such that decoding does not need to try the alternatives."""
+        super().__init__(*args, **kwargs)
+        self.tag_unions = tag_unions
+
     def default(self, o: Any) -> Any:
         if isinstance(o, igraph.Graph):
             igraph_dict = _serialize_igraph(o)
             igraph_dict["__class__"] = "igraph.Graph"
             return igraph_dict
         if isinstance(o, NodeABC | LinkABC):
-            data = asdict(o)
+            data = tagged_dataclass_dict(o) if self.tag_unions else asdict(o)
             data["__class__"] = f"{o.__class__.__module__}.{o.__class__.__name__}"
             return data
         if isinstance(o, ImmutableNetworkABC):
@@ -307,58 +681,109 @@ class ImmutableNetworkDecoder(json.JSONDecoder):
             if class_name == "igraph.Graph":
                 return _deserialize_igraph(dct)
 
-            module_name, class_name = class_name.rsplit(".", 1)
-            module = __import__(module_name, fromlist=[class_name])
-            cls = getattr(module, class_name)
-            return _dataclass_from_dict(cls, dct)
+            return converter_for(class_by_path(class_name))(dct)
 
         return dct
 
 
-def _dataclass_from_dict(cls: type, data: dict[str, Any | None] | Any) -> Any:
-    # handle type unions
-    if get_origin(cls) is Union or get_origin(cls) is UnionType:
-        for arg in get_args(cls):
-            try:
-                return _dataclass_from_dict(arg, data)
-            except Exception:  # pylint: disable=broad-except
-                pass
-        raise ValueError(f"Could not convert {data} to any of {get_args(cls)}")
-
-    # handle types defined with NewType
-    if hasattr(cls, "__supertype__"):
-        supertype = cls.__supertype__
-        return cls(_dataclass_from_dict(supertype, data))
-
-    # handle Literal types
-    if get_origin(cls) is Literal:
-        if data in get_args(cls):
-            return data  # Valid literal value
-        raise ValueError(f"Value {data} is not a valid Literal for {cls}")
-
-    # handle non dataclass types
-    if not is_dataclass(cls):
-        if isinstance(data, igraph.Graph) or data is None:
-            return data
-        return cls(data)
-
-    field_types = get_type_hints(cls)
-    result = {}
-    for _type in field_types:
-        if _type not in data:
+def _iter_json_chunks(
+    network: ImmutableNetworkABC, chunk_size: int = _JSON_CHUNK_SIZE, tag_unions: bool = False
+) -> Iterator[str]:
+    """Yield the text that ``json.dump(network, file, cls=ImmutableNetworkEncoder, tag_unions=...)`` writes, in chunks.
+
+    Only ``chunk_size`` nodes or links are converted to Python objects at a time, instead of the whole document.
+    """
+    if [field.name for field in fields(network)] != ["_underlying_digraph"]:
+        # networks with additional dataclass fields are encoded as a whole
+        yield json.dumps(network, cls=ImmutableNetworkEncoder, tag_unions=tag_unions)
+        return
+    encoder = ImmutableNetworkEncoder(tag_unions=tag_unions)
+    graph = network._attributed_graph()  # pylint: disable=protected-access
+    yield f'{{"_underlying_digraph": {{"node_count": {encoder.encode(graph.vcount())}, "edges": '
+    yield from _iter_json_list(
+        encoder, graph.ecount(), chunk_size, lambda chunk: [edge.tuple for edge in graph.es[chunk]]
+    )
+    yield f', "attributes": {encoder.encode({key: graph[key] for key in graph.attributes()})}, "vertex_attrs": '
+    yield from _iter_json_list(encoder, graph.vcount(), chunk_size, lambda chunk: _attribute_dicts(graph.vs[chunk]))
+    yield ', "edge_attrs": '
+    yield from _iter_json_list(encoder, graph.ecount(), chunk_size, lambda chunk: _attribute_dicts(graph.es[chunk]))
+    yield f', "is_directed": {encoder.encode(graph.is_directed())}, "__class__": "igraph.Graph"}}'
+    yield f', "__class__": {encoder.encode(class_path(network.__class__))}}}'
+
+
+def _iter_json_list(
+    encoder: json.JSONEncoder, count: int, chunk_size: int, items_of: Callable[[slice], list[Any]]
+) -> Iterator[str]:
+    yield "["
+    for start in range(0, count, chunk_size):
+        if start > 0:
+            yield ", "
+        yield encoder.encode(items_of(slice(start, start + chunk_size)))[1:-1]
+    yield "]"
+
+
+def _attribute_dicts(sequence: igraph.VertexSeq | igraph.EdgeSeq) -> list[dict[str, Any]]:
+    keys = sequence.attribute_names()
+    if not keys:
+        return [{} for _ in range(len(sequence))]
+    return [dict(zip(keys, values)) for values in zip(*(sequence[key] for key in keys))]
+
+
+def _lazy_network_from_json(data: dict[str, Any]) -> Any:
+    # data is the network as parsed without object hook
+    if set(data) != {"_underlying_digraph", "__class__"}:
+        return _decode_parsed(data)  # networks with additional dataclass fields are decoded as a whole
+    graph_data = data["_underlying_digraph"]
+    graph = igraph.Graph(
+        n=graph_data["node_count"],
+        edges=graph_data["edges"],
+        directed=graph_data["is_directed"],
+        graph_attrs=_decode_parsed(graph_data["attributes"]),
+    )
+    lazy = LazyAttributes(
+        _lazy_columns(graph.vs, graph_data["vertex_attrs"], eager_key=VERTEX_NAME_KEY),
+        _lazy_columns(graph.es, graph_data["edge_attrs"], eager_key=None),
+    )
+    network = class_by_path(data["__class__"])(graph)
+    object.__setattr__(network, "_lazy", lazy)
+    return network
+
+
+def _lazy_columns(
+    sequence: igraph.VertexSeq | igraph.EdgeSeq, records: list[dict[str, Any]], eager_key: str | None
+) -> dict[str, LazyColumn]:
+    """Store the attribute ``eager_key`` of the records in ``sequence`` and return the others as lazy columns."""
+    columns = {}
+    for key in records[0] if len(records) > 0 else ():
+        if key == eager_key:
+            sequence[key] = [_decode_parsed(record[key]) for record in records]
             continue
-        # catch ellipsis type hints
-        args = get_args(field_types[_type])
-        if len(args) > 0 and args[-1] is Ellipsis:
-            # This is a variadic tuple, convert each list item into the appropriate type
-            elem_type = args[0]  # The type of the tuple's elements
-            result[_type] = tuple(_dataclass_from_dict(elem_type, item) for item in data[_type])  # type: ignore
-        else:
-            # Handle non-ellipsis types normally
-            result[_type] = (
-                _dataclass_from_dict(field_types[_type], data[_type]) if _type in data else None  # type: ignore
-            )
-    return cls(**result)
+        columns[key] = LazyColumn(
+            len(records),
+            lambda index, key=key: _decode_parsed(records[index][key]),  # type: ignore[misc]
+            lambda key=key: [_decode_parsed(record[key]) for record in records],  # type: ignore[misc]
+        )
+    return columns
+
+
+def _decode_parsed(value: Any) -> Any:
+    """Decode a value parsed without object hook like ``ImmutableNetworkDecoder`` would have (bottom-up)."""
+    if isinstance(value, dict):
+        return ImmutableNetworkDecoder.object_hook({key: _decode_parsed(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return [_decode_parsed(item) for item in value]
+    return value
+
+
+def _encode_json(value: Any, hint: Any) -> str:
+    # the binary format always tags unions, it is decoded by ``_decode_json`` with the same hint
+    return json.dumps(value if hint is None else tag_value(hint, value), cls=ImmutableNetworkEncoder, tag_unions=True)
+
+
+def _decode_json(text: str, hint: Any) -> Any:
+    # values of dataclass fields are converted to the hinted type, as they are when decoding the whole network
+    data = json.loads(text, cls=ImmutableNetworkDecoder)
+    return data if hint is None else field_converter_for(hint)(data)
 
 
 def _serialize_igraph(graph: igraph.Graph) -> dict[str, Any]:
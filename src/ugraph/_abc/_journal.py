@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from types import TracebackType
+from typing import IO, TYPE_CHECKING, Any, TypeVar
+
+from ._binary import class_path
+from ._immutablenetwork import ImmutableNetworkDecoder, ImmutableNetworkEncoder
+
+if TYPE_CHECKING:
+    from ._mutablenetwork import MutableNetworkABC
+
+NetworkT = TypeVar("NetworkT", bound="MutableNetworkABC")
+
+JOURNAL_SUFFIX = ".journal"
+
+# number of bytes read at a time from the end of a journal when looking for its last complete line
+_TAIL_CHUNK_SIZE = 4096
+
+
+def journal_path(snapshot: Path | str) -> Path:
+    """Return the path of the journal kept next to ``snapshot``."""
+    return Path(f"{snapshot}{JOURNAL_SUFFIX}")
+
+
+class NetworkJournal:
+    """Append-only log of the mutations of a network, kept next to a snapshot of it (see ``MutableNetworkABC.journal``).
+
+    The journal is a JSON-lines file: a header with the class and the node and link counts of the snapshot, then one
+    line per ``add_*``, ``delete_*`` and ``replace_*`` call in the order they were applied, flushed immediately. So
+    saving after an edit costs time proportional to the edit, not to the network. Changes made directly on
+    ``underlying_digraph`` are not recorded.
+    """
+
+    __slots__ = ("snapshot", "path", "_network", "_file", "_pending")
+
+    def __init__(self, network: MutableNetworkABC, snapshot: Path | str) -> None:
+        self.snapshot = Path(snapshot)
+        self.path = journal_path(snapshot)
+        self._network = network
+        if not self.snapshot.exists():
+            write_snapshot(network, self.snapshot)
+            _write_header(self.path, network)
+        else:
+            if self.path.exists():
+                _drop_incomplete_line(self.path)
+            if not self.path.exists() or self.path.stat().st_size == 0:
+                _write_header(self.path, network)
+        self._file: IO[str] | None = open(self.path, "a")
+        self._pending: list[str] | None = None
+
+    def __enter__(self) -> NetworkJournal:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def record(self, operation: str, *arguments: Any) -> None:
+        line = json.dumps([operation, *arguments], cls=ImmutableNetworkEncoder, tag_unions=True) + "\n"
+        if self._pending is not None:
+            self._pending.append(line)
+            return
+        self._write(line)
+
+    @contextmanager
+    def deferred(self, rolled_back: bool = True) -> Iterator[None]:
+        """Hold back the entries recorded inside the ``with`` block and write them all at once when it exits.
+
+        If the block raises, the entries are dropped if its changes are ``rolled_back``. Otherwise they are written, as
+        the network keeps the changes made before the error.
+        """
+        if self._pending is not None:
+            yield
+            return
+        self._pending = []
+        try:
+            yield
+        except BaseException:
+            if not rolled_back:
+                self._write("".join(self._pending))
+            raise
+        else:
+            self._write("".join(self._pending))
+        finally:
+            self._pending = None
+
+    def compact(self) -> None:
+        """Replace the snapshot by the current network and empty the journal.
+
+        Both files are written next to their targets first and then moved over them.
+        """
+        compacting = self.snapshot.with_name(f"compacting-{self.snapshot.name}")
+        write_snapshot(self._network, compacting)
+        _write_header(journal_path(compacting), self._network)
+        self._close_file()
+        os.replace(compacting, self.snapshot)
+        os.replace(journal_path(compacting), self.path)
+        self._file = open(self.path, "a")
+
+    def close(self) -> None:
+        self._close_file()
+        if self._network._journal is self:  # pylint: disable=protected-access
+            object.__setattr__(self._network, "_journal", None)
+
+    def _write(self, text: str) -> None:
+        if self._file is None:
+            raise ValueError(f"The journal {self.path} is closed")
+        self._file.write(text)
+        self._file.flush()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def replay(network: MutableNetworkABC, path: Path | str) -> int:
+    """Apply the mutations recorded in the journal at ``path`` to ``network`` and return their number.
+
+    ``network`` must be the snapshot the journal was started from. A last line that was not written completely (e.g.
+    because the writing process died) is ignored.
+    """
+    with open(path, "r") as file:
+        lines = file.read().split("\n")
+    header, entries = json.loads(lines[0]), lines[1:-1]  # the part after the last newline is incomplete
+    expected = [class_path(network.__class__), network.n_count, network.l_count]
+    if header != ["ugraph.journal", *expected]:
+        raise ValueError(f"The journal {path} does not belong to this {network.__class__.__name__}: {header}")
+    for entry in entries:
+        operation, *arguments = json.loads(entry, cls=ImmutableNetworkDecoder)
+        _REPLAYED[operation](network, *arguments)
+    return len(entries)
+
+
+def write_snapshot(network: MutableNetworkABC, path: Path) -> None:
+    if path.name.endswith(".bin"):
+        network.write_binary(path)
+    else:
+        network.write_json(path)
+
+
+def read_snapshot(network_class: type[NetworkT], path: Path) -> NetworkT:
+    if path.name.endswith(".bin"):
+        return network_class.read_binary(path)
+    return network_class.read_json(path)
+
+
+def _write_header(path: Path, network: MutableNetworkABC) -> None:
+    with open(path, "w") as file:
+        file.write(json.dumps(["ugraph.journal", class_path(network.__class__), network.n_count, network.l_count]))
+        file.write("\n")
+
+
+def _drop_incomplete_line(path: Path) -> None:
+    """Cut off a last line that was not written completely, so that the next entry starts on a line of its own."""
+    with open(path, "rb+") as file:
+        end = position = file.seek(0, os.SEEK_END)
+        while position > 0:
+            start = max(0, position - _TAIL_CHUNK_SIZE)
+            file.seek(start)
+            newline = file.read(position - start).rfind(b"\n")
+            if newline >= 0:
+                if start + newline + 1 < end:
+                    file.truncate(start + newline + 1)
+                return
+            position = start
+        file.truncate(0)  # not even the header is complete
+
+
+def _add_nodes(network: MutableNetworkABC, node_ids: Sequence[Any], nodes: Sequence[Any]) -> None:
+    # the recorded ids and nodes are added as they are, e.g. including duplicated ids
+    network._add_vertices(node_ids, nodes)  # pylint: disable=protected-access
+
+
+def _add_links(network: MutableNetworkABC, end_nodes: Sequence[Sequence[Any]], links: Sequence[Any]) -> None:
+    network.add_links([(tuple(pair), link) for pair, link in zip(end_nodes, links)])  # type: ignore[misc]
+
+
+_REPLAYED = {
+    "add_nodes": _add_nodes,
+    "add_links": _add_links,
+    "replace_node": lambda network, index, node, renamed: network.replace_node(index, node, renamed),
+    "replace_link": lambda network, index, link: network.replace_link(index, link),
+    "delete_nodes": lambda network, indices: network.delete_nodes(indices),
+    "delete_links": lambda network, indices: network.delete_links(indices),
+}
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import igraph
+
+_MISSING = object()
+
+
+class LazyColumn:
+    """Values of one graph attribute that are decoded from their stored records on first access and then cached."""
+
+    __slots__ = ("_values", "_missing", "_decode_one", "_decode_all")
+
+    def __init__(self, count: int, decode_one: Callable[[int], Any], decode_all: Callable[[], list[Any]]) -> None:
+        self._values: list[Any] = [_MISSING] * count
+        self._missing = count
+        self._decode_one = decode_one
+        self._decode_all = decode_all
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def decoded_count(self) -> int:
+        return len(self._values) - self._missing
+
+    def get(self, index: int) -> Any:
+        value = self._values[index]
+        if value is _MISSING:
+            if index < 0:
+                index += len(self._values)
+            value = self._values[index] = self._decode_one(index)
+            self._missing -= 1
+        return value
+
+    def get_many(self, indices: Iterable[int]) -> list[Any]:
+        return [self.get(index) for index in indices]
+
+    def all(self) -> list[Any]:
+        if self._missing == len(self._values):
+            # nothing decoded yet, decode the whole column at once (which is faster than element by element)
+            self._values = self._decode_all()
+            self._missing = 0
+        elif self._missing > 0:
+            self.get_many(range(len(self._values)))
+        return list(self._values)
+
+
+class LazyAttributes:
+    """Vertex and edge attributes of a graph that are decoded on first access instead of being stored in it.
+
+    Networks holding lazy attributes read them through their accessor layer; everything that works on the attributes
+    of the graph itself (mutations, subgraphs, columns, serialisation, ...) first calls ``materialise``, which decodes
+    all remaining values (of the vertices and/or the edges) and stores the columns in the graph. The object is shared
+    by all copies sharing the graph.
+    """
+
+    __slots__ = ("vertex", "edge")
+
+    def __init__(self, vertex: dict[str, LazyColumn], edge: dict[str, LazyColumn]) -> None:
+        self.vertex = vertex
+        self.edge = edge
+
+    @property
+    def pending(self) -> bool:
+        return len(self.vertex) > 0 or len(self.edge) > 0
+
+    def materialise(self, graph: igraph.Graph, vertices: bool = True, edges: bool = True) -> None:
+        if vertices:
+            for key, column in self.vertex.items():
+                graph.vs[key] = column.all()
+            self.vertex = {}
+        if edges:
+            for key, column in self.edge.items():
+                graph.es[key] = column.all()
+            self.edge = {}
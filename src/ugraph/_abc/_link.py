@@ -6,6 +6,7 @@ from typing import Generic, NewType, TypeVar
 from ._node import NodeId
 
 EndNodeIdPair = NewType("EndNodeIdPair", tuple[NodeId, NodeId])
+LinkIndex = NewType("LinkIndex", int)
 
 
 @unique
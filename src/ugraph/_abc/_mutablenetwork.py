@@ -1,10 +1,14 @@
 from abc import ABC
-from collections.abc import Collection, Mapping
+from collections.abc import Callable, Collection, Iterator, Mapping, Sequence
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
-from typing import AbstractSet, TypeVar
+from itertools import chain
+from pathlib import Path
+from typing import AbstractSet, Any, TypeVar, cast
 
 import igraph
 
+from ._batch import NetworkBatch
 from ._immutablenetwork import (
     LINK_ATTRIBUTE_KEY,
     NODE_ATTRIBUTE_KEY,
@@ -15,6 +19,7 @@ from ._immutablenetwork import (
     NodeT,
     NodeTypeT,
 )
+from ._journal import NetworkJournal, journal_path, read_snapshot, replay
 from ._link import EndNodeIdPair, LinkTypeT
 from ._node import NodeId, NodeIndex
 
@@ -23,56 +28,235 @@ Self = TypeVar("Self", bound="MutableNetworkABC")
 
 @dataclass(init=False, frozen=True)
 class MutableNetworkABC(ImmutableNetworkABC[NodeT, LinkT, NodeTypeT, LinkTypeT], ABC):
+    def __init__(self, _underlying_digraph: igraph.Graph) -> None:
+        super().__init__(_underlying_digraph)
+        self._batch: NetworkBatch[NodeT, LinkT] | None
+        object.__setattr__(self, "_batch", None)
+        self._journal: NetworkJournal | None
+        object.__setattr__(self, "_journal", None)
+
     @property
     def underlying_digraph(self) -> igraph.Graph:
+        """Return the graph itself for modifying it directly, copying it first if it is shared with copies.
+
+        As the network cannot tell what is changed, this drops all derived indices and bumps both versions; use
+        ``read_only_digraph`` to only read the graph.
+        """
+        self._detach_shared_graph()
+        self._bump_version(structural=True)  # the graph may be changed directly
+        # e.g. a vertex may be renamed or its node replaced without changing the element counts
+        self._node_id_index.invalidate()
+        self._columns.invalidate_nodes()
+        self._columns.invalidate_links()
+        self._weak_components.invalidate()
         return self._underlying_digraph
 
     def isomorphic(self, other: Self) -> bool:
-        return self._underlying_digraph.isomorphic(other.underlying_digraph)
+        return self._underlying_digraph.isomorphic(other._underlying_digraph)  # pylint: disable=protected-access
+
+    @contextmanager
+    def batch(self: Self, validate: Callable[[Self], Any] | None = None) -> Iterator[NetworkBatch[NodeT, LinkT]]:
+        """Queue the mutations made inside the ``with`` block and apply them in one pass when the block exits.
+
+        Inside the block, ``add_*``, ``delete_*`` and ``replace_*`` (and the methods built on them) only queue their
+        changes: reads still see the network as it was before the block, and all indices passed to the mutators refer
+        to that state. On exit, replacements are applied first, then all nodes and all links are added with one call
+        each (resolving the end node ids once), and finally all deletions are merged into one call for links and one
+        for nodes, so igraph renumbers the graph at most twice. If the block raises, the queued changes are discarded.
+        If ``validate`` is given, the network is rolled back to its state before the block when applying the changes
+        fails, or when ``validate`` (called with the updated network) raises or returns a falsy value, e.g. a failed
+        ``Result``. Without ``validate``, the changes applied before a failure stay (and are journaled).
+        """
+        if self._batch is not None:
+            raise RuntimeError("A batch is already active on this network")
+        queued: NetworkBatch[NodeT, LinkT] = NetworkBatch()
+        object.__setattr__(self, "_batch", queued)
+        try:
+            yield queued
+        finally:
+            object.__setattr__(self, "_batch", None)
+        snapshot = self.copy() if validate is not None else None
+        try:
+            journal = self._journal
+            with journal.deferred(rolled_back=snapshot is not None) if journal is not None else nullcontext():
+                self._apply_batch(queued)
+                if validate is not None and not (outcome := validate(self)):
+                    raise ValueError(f"Validation failed, the batch was rolled back: {outcome}")
+        except Exception:
+            if snapshot is not None:
+                self._share_graph_of(snapshot)
+                self._bump_version(structural=True)
+            raise
+
+    def journal(self, snapshot: Path | str) -> NetworkJournal:
+        """Record every mutation of this network in an append-only journal next to ``snapshot`` (``NetworkJournal``).
+
+        ``snapshot`` is a file of ``write_json`` or (ending with ``.bin``) of ``write_binary``; it is written first if
+        it does not exist. Otherwise the network must be the snapshot with the journal replayed (see
+        ``read_journaled``), as the new entries are appended to it. Use the result as a context manager, or ``close``
+        it, to stop recording.
+        """
+        if self._journal is not None:
+            raise RuntimeError("A journal is already active on this network")
+        journal = NetworkJournal(self, snapshot)
+        object.__setattr__(self, "_journal", journal)
+        return journal
+
+    def replay_journal(self, path: Path | str) -> int:
+        """Apply the mutations recorded in the journal at ``path`` to this network, which must be its snapshot.
+
+        Return the number of replayed mutations.
+        """
+        return replay(self, path)
+
+    @classmethod
+    def read_journaled(cls: type[Self], snapshot: Path | str) -> Self:
+        """Read ``snapshot`` (see ``journal``) and replay the journal next to it, if there is one."""
+        network = read_snapshot(cls, Path(snapshot))
+        if journal_path(snapshot).exists():
+            network.replay_journal(journal_path(snapshot))
+        return network
+
+    @classmethod
+    def compact_journal(cls: type[Self], snapshot: Path | str) -> Self:
+        """Replace ``snapshot`` by the network with its journal replayed, empty the journal and return the network."""
+        network = cls.read_journaled(snapshot)
+        with network.journal(snapshot) as journal:
+            journal.compact()
+        return network
 
     def add_nodes(self, nodes_to_add: Mapping[NodeId, NodeT] | Collection[NodeT]) -> None:
-        _add_nodes(self, nodes_to_add)
+        node_ids, nodes = _split_nodes(nodes_to_add)
+        if self._batch is not None:
+            self._batch.add_nodes(node_ids, nodes)
+            return
+        self._add_vertices(node_ids, nodes)
 
     def add_links(self, links_to_add: Collection[tuple[EndNodeIdPair, LinkT]] | Mapping[EndNodeIdPair, LinkT]) -> None:
-        if isinstance(links_to_add, dict):
-            return _add_links(self, links_to_add.items())  # type: ignore
-        return _add_links(self, links_to_add)  # type: ignore
+        links_with_end_nodes = links_to_add.items() if isinstance(links_to_add, Mapping) else links_to_add
+        if self._batch is not None:
+            self._batch.add_links(links_with_end_nodes)
+            return
+        self._detach_shared_graph()
+        e_count_before = self._underlying_digraph.ecount()
+        edges, links = _add_links(self, self._underlying_digraph, links_with_end_nodes)
+        self._columns.extend_links(e_count_before, links)
+        self._weak_components.extend_links(self._underlying_digraph, e_count_before, edges)
+        self._bump_version(structural=True)
+        if self._journal is not None:
+            self._journal.record("add_links", edges, links)
 
     def append_(self, network_to_append: ImmutableNetworkABC[NodeT, LinkT, NodeTypeT, LinkTypeT]) -> None:
         _append_to_network(self, network_to_append)
 
     def replace_node(self, index: NodeIndex, updated: NodeT, renamed: bool = False) -> None:
-        _replace_node(self, index, updated, renamed)
+        if self._batch is not None:
+            self._batch.replace_node(index, updated, renamed)
+            return
+        self._detach_shared_graph()
+        old_id = self.node_id_by_index(index)
+        _replace_node(self, self._underlying_digraph, index, updated, renamed)
+        if old_id != updated.node_id:
+            self._node_id_index.rename(index, old_id, updated.node_id)
+        self._columns.replace_node(index, updated)
+        self._bump_version(structural=False)
+        if self._journal is not None:
+            self._journal.record("replace_node", index, updated, renamed)
 
     def replace_link(self, index: LinkIndex, new_link: LinkT) -> None:
+        if self._batch is not None:
+            self._batch.replace_link(index, new_link)
+            return
+        self._detach_shared_graph()
         self._underlying_digraph.es[index][LINK_ATTRIBUTE_KEY] = new_link
+        self._columns.replace_link(index, new_link)
+        self._bump_version(structural=False)
+        if self._journal is not None:
+            self._journal.record("replace_link", index, new_link)
 
     def remove_isolated_nodes(self) -> None:
-        self._underlying_digraph.delete_vertices(self._underlying_digraph.vs.select(_degree=0))
+        self.delete_nodes(self._underlying_digraph.vs.select(_degree=0).indices)
 
     def __add__(self: Self, other: Self) -> Self:
-        return self.__class__(self._underlying_digraph.union(other.underlying_digraph, byname=True))
+        other_graph = other._attributed_graph()  # pylint: disable=protected-access
+        return self.__class__(self._attributed_graph().union(other_graph, byname=True))
 
     def sub_network(self: Self, selected: Collection[NodeIndex] | Collection[NodeId]) -> Self:
-        return self.__class__(self._underlying_digraph.subgraph(selected))
+        return self.__class__(self._attributed_graph().subgraph(selected))
 
     def delete_nodes_with_type(self, types: AbstractSet[NodeTypeT]) -> None:
-        self._underlying_digraph.delete_vertices([i for i, n in enumerate(self.all_nodes) if n.node_type in types])
+        self.delete_nodes(self._columns.node_indices_with_types(self._attributed_graph(edges=False), types))
 
     def delete_nodes_without_type(self, types: AbstractSet[NodeTypeT]) -> None:
-        self._underlying_digraph.delete_vertices([i for i, n in enumerate(self.all_nodes) if n.node_type not in types])
+        self.delete_nodes(
+            self._columns.node_indices_with_types(self._attributed_graph(edges=False), types, negate=True)
+        )
 
     def delete_links_without_type(self, types: AbstractSet[LinkTypeT]) -> None:
-        self.delete_links([LinkIndex(i) for i, link in enumerate(self.all_links) if link.link_type not in types])
+        self.delete_links(
+            self._columns.link_indices_with_types(self._attributed_graph(vertices=False), types, negate=True)
+        )
 
     def delete_links_with_type(self, types: AbstractSet[LinkTypeT]) -> None:
-        self.delete_links([LinkIndex(i) for i, link in enumerate(self.all_links) if link.link_type in types])
+        self.delete_links(self._columns.link_indices_with_types(self._attributed_graph(vertices=False), types))
 
     def delete_nodes(self, to_remove: Collection[NodeIndex] | Collection[NodeId]) -> None:
-        self._underlying_digraph.delete_vertices(to_remove)
+        indices = [i if isinstance(i, int) else self.node_index_by_id(i) for i in to_remove]
+        if self._batch is not None:
+            self._batch.delete_nodes(indices)
+            return
+        self._detach_shared_graph()
+        self._underlying_digraph.delete_vertices(indices)
+        self._node_id_index.invalidate()
+        self._columns.delete_nodes(indices)
+        self._weak_components.invalidate()
+        self._bump_version(structural=True)
+        if self._journal is not None:
+            self._journal.record("delete_nodes", indices)
 
     def delete_links(self, to_remove: Collection[LinkIndex]) -> None:
-        self._underlying_digraph.delete_edges(to_remove)
+        if self._batch is not None:
+            self._batch.delete_links(to_remove)
+            return
+        self._detach_shared_graph()
+        graph = self._underlying_digraph
+        e_count_before, affected = graph.ecount(), self._weak_components.labels_of_links(graph, to_remove)
+        graph.delete_edges(to_remove)
+        self._columns.delete_links(to_remove)
+        self._weak_components.delete_links(graph, affected, e_count_before)
+        self._bump_version(structural=True)
+        if self._journal is not None:
+            self._journal.record("delete_links", list(to_remove))
+
+    def _add_vertices(self, node_ids: Sequence[NodeId], nodes: Sequence[NodeT]) -> None:
+        self._detach_shared_graph()
+        v_count_before = self._underlying_digraph.vcount()
+        if len(node_ids) > 0:
+            self._underlying_digraph.add_vertices(
+                len(node_ids), attributes={VERTEX_NAME_KEY: node_ids, NODE_ATTRIBUTE_KEY: nodes}
+            )
+        self._node_id_index.extend(v_count_before, node_ids)
+        self._columns.extend_nodes(v_count_before, nodes)
+        self._weak_components.extend_nodes(self._underlying_digraph, v_count_before, len(node_ids))
+        self._bump_version(structural=True)
+        if self._journal is not None:
+            self._journal.record("add_nodes", node_ids, nodes)
+
+    def _apply_batch(self, queued: NetworkBatch[NodeT, LinkT]) -> None:
+        for node_index, (node, renamed) in queued.node_replacements.items():
+            self.replace_node(node_index, node, renamed)
+        for link_index, link in queued.link_replacements.items():
+            self.replace_link(link_index, link)
+        # appending keeps the indices of the existing elements, so the queued deletions stay valid
+        if len(queued.nodes) > 0:
+            self._add_vertices(queued.node_ids, queued.nodes)
+        if len(queued.links) > 0:
+            self.add_links(queued.links)
+        # deleting links first keeps the node indices valid; deleting nodes also drops their (new) links
+        if len(queued.deleted_links) > 0:
+            self.delete_links(sorted(queued.deleted_links))
+        if len(queued.deleted_nodes) > 0:
+            self.delete_nodes(sorted(queued.deleted_nodes))
 
     @classmethod
     def create_new(cls: type[Self], nodes: Collection[NodeT], links: Collection[tuple[EndNodeIdPair, LinkT]]) -> Self:
@@ -82,37 +266,51 @@ class MutableNetworkABC(ImmutableNetworkABC[NodeT, LinkT, NodeTypeT, LinkTypeT],
         return new
 
 
-def _add_nodes(network: MutableNetworkABC, nodes: Mapping[NodeId, NodeT] | Collection[NodeT]) -> None:
-    v_count_before = network.underlying_digraph.vcount()
-    network.underlying_digraph.add_vertices(len(nodes))
-    node_pairs = ((node.node_id, node) for node in nodes)  # type: ignore
-    iterator_ = nodes.items() if isinstance(nodes, Mapping) else node_pairs  # type: ignore
-    for i, (node_id, node) in enumerate(iterator_, start=v_count_before):
-        network.underlying_digraph.vs[i][NODE_ATTRIBUTE_KEY] = node
-        network.underlying_digraph.vs[i][VERTEX_NAME_KEY] = node_id
+def _split_nodes(nodes: Mapping[NodeId, NodeT] | Collection[NodeT]) -> tuple[list[NodeId], list[NodeT]]:
+    if isinstance(nodes, Mapping):
+        return list(nodes.keys()), list(nodes.values())
+    node_objects = list(nodes)
+    return [node.node_id for node in node_objects], node_objects
 
 
-def _add_links(mutable_network: MutableNetworkABC, links_to_add: Collection[tuple[EndNodeIdPair, LinkT]]) -> None:
+def _add_links(
+    mutable_network: MutableNetworkABC, graph: igraph.Graph, links_to_add: Collection[tuple[EndNodeIdPair, LinkT]]
+) -> tuple[Sequence[tuple[NodeIndex, NodeIndex]], list[LinkT]]:
     if len(links_to_add) == 0:
-        return
-    end_nodes, links = zip(*links_to_add)
-    e_count_before = mutable_network.underlying_digraph.ecount()
-    mutable_network.underlying_digraph.add_edges(end_nodes)
-    for i, link in enumerate(links, start=e_count_before):
-        mutable_network.underlying_digraph.es[i][LINK_ATTRIBUTE_KEY] = link
+        return [], []
+    end_nodes = [end_node_pair for end_node_pair, _ in links_to_add]
+    links = [link for _, link in links_to_add]
+    edges = _resolve_end_nodes(mutable_network, end_nodes)
+    graph.add_edges(edges, attributes={LINK_ATTRIBUTE_KEY: links})
+    # igraph only accepts the unresolved end nodes if they are given as indices
+    return cast(Sequence[tuple[NodeIndex, NodeIndex]], edges), links
+
+
+def _resolve_end_nodes(
+    network: MutableNetworkABC, end_nodes: Sequence[EndNodeIdPair]
+) -> Sequence[tuple[NodeIndex, NodeIndex]] | Sequence[EndNodeIdPair]:
+    try:
+        flat = network.node_indices_by_ids(chain.from_iterable(end_nodes))
+    except ValueError:
+        # unknown ids (or end nodes given as indices): let igraph resolve them and raise its usual error
+        return end_nodes
+    return list(zip(flat[::2], flat[1::2]))
 
 
 def _append_to_network(
     network_to_extend: MutableNetworkABC, network_to_append: ImmutableNetworkABC, skip_duplicate_nodes: bool = True
 ) -> None:
     if skip_duplicate_nodes:
-        existing_node_ids = set(network_to_extend.node_ids)
         nodes_to_add = {
-            node.node_id: node for node in network_to_append.all_nodes if node.node_id not in existing_node_ids
+            node.node_id: node
+            for node in network_to_append.all_nodes
+            if not network_to_extend.has_node_id(node.node_id)
         }
         network_to_extend.add_nodes(nodes_to_add)
     else:
-        assert not (overlap := set(network_to_extend.node_ids).intersection(network_to_append.node_ids)), f"{overlap=}"
+        assert not (
+            overlap := {node_id for node_id in network_to_append.node_ids if network_to_extend.has_node_id(node_id)}
+        ), f"{overlap=}"
 
         network_to_extend.add_nodes({node.node_id: node for node in network_to_append.all_nodes})
     links_to_add = tuple(network_to_append.iter_links_with_end_nodes())
@@ -120,14 +318,13 @@ def _append_to_network(
         network_to_extend.add_links(links_to_add)
 
 
-def _replace_node(network: MutableNetworkABC, index: NodeIndex, new_node: NodeT, renamed: bool) -> None:
-    if network.underlying_digraph.vs[index][VERTEX_NAME_KEY] != new_node.node_id:
+def _replace_node(
+    network: MutableNetworkABC, graph: igraph.Graph, index: NodeIndex, new_node: NodeT, renamed: bool
+) -> None:
+    vertex = graph.vs[index]
+    if vertex[VERTEX_NAME_KEY] != new_node.node_id:
         if not renamed:
-            raise ValueError(
-                f"Node id mismatch: {network.underlying_digraph.vs[index][VERTEX_NAME_KEY]} != {new_node.node_id}"
-            )
-        assert new_node.node_id not in set(
-            network.underlying_digraph.vs[VERTEX_NAME_KEY]
-        ), f"{new_node.node_id=} not unique"
-        network.underlying_digraph.vs[index][VERTEX_NAME_KEY] = new_node.node_id
-    network.underlying_digraph.vs[index][NODE_ATTRIBUTE_KEY] = new_node
+            raise ValueError(f"Node id mismatch: {vertex[VERTEX_NAME_KEY]} != {new_node.node_id}")
+        assert not network.has_node_id(new_node.node_id), f"{new_node.node_id=} not unique"
+        vertex[VERTEX_NAME_KEY] = new_node.node_id
+    vertex[NODE_ATTRIBUTE_KEY] = new_node
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain, compress
+from typing import TYPE_CHECKING, Generic, Literal, TypeVar, cast
+
+import igraph
+
+from ._link import BaseLinkType, EndNodeIdPair, LinkABC, LinkIndex
+from ._node import BaseNodeType, NodeABC, NodeId, NodeIndex
+
+if TYPE_CHECKING:
+    from ._immutablenetwork import ImmutableNetworkABC
+
+NodeT = TypeVar("NodeT", bound=NodeABC)
+LinkT = TypeVar("LinkT", bound=LinkABC)
+NodeTypeT = TypeVar("NodeTypeT", bound=BaseNodeType)
+LinkTypeT = TypeVar("LinkTypeT", bound=BaseLinkType)
+
+# edge attribute of the structure of a view that holds the index of every link in the underlying network
+_LINK_INDEX_KEY = "link_index"
+# views of at most this share of the nodes (or, without a node mask, of the links) build their structure from the
+# selected links; igraph thins a copy of the whole graph faster than Python selects the links of larger views
+_SMALL_VIEW_SHARE = 1 / 32
+
+
+class NetworkView(Generic[NodeT, LinkT, NodeTypeT, LinkTypeT]):
+    """Read-only view of a network restricted by a node mask and/or a link mask, without copying its nodes and links.
+
+    A link is part of the view if it is selected by the link mask and both of its end nodes are selected by the node
+    mask (i.e. the view is the subgraph induced by the selected nodes, restricted to the selected links). Nodes and
+    links keep the indices they have in the underlying network. The view is only valid as long as the underlying
+    network is not structurally mutated (see ``structural_version``); use ``materialise`` to obtain an independent
+    network. Links, degrees, components and the DAG and simplicity checks are computed by igraph on the structure of
+    the view, a graph without attributes that is built on first use: from the selected links only for views of a
+    small share of the network (``_SMALL_VIEW_SHARE``), otherwise from a copy of the graph's structure.
+    """
+
+    __slots__ = ("_network", "_node_mask", "_link_mask", "_stamp", "_node_indices", "_structure")
+
+    def __init__(
+        self,
+        network: ImmutableNetworkABC[NodeT, LinkT, NodeTypeT, LinkTypeT],
+        node_mask: Sequence[int] | None = None,
+        link_mask: Sequence[int] | None = None,
+    ) -> None:
+        if node_mask is not None and len(node_mask) != network.n_count:
+            raise ValueError(f"node_mask has {len(node_mask)} entries but the network has {network.n_count} nodes")
+        if link_mask is not None and len(link_mask) != network.l_count:
+            raise ValueError(f"link_mask has {len(link_mask)} entries but the network has {network.l_count} links")
+        self._network = network
+        self._node_mask = bytes(map(bool, node_mask)) if node_mask is not None else None
+        self._link_mask = bytes(map(bool, link_mask)) if link_mask is not None else None
+        self._stamp = (network.n_count, network.l_count, network.structural_version)
+        self._node_indices: list[NodeIndex] | None = None
+        self._structure: igraph.Graph | None = None
+
+    @classmethod
+    def from_indices(
+        cls,
+        network: ImmutableNetworkABC[NodeT, LinkT, NodeTypeT, LinkTypeT],
+        node_indices: Iterable[NodeIndex] | None = None,
+        link_indices: Iterable[LinkIndex] | None = None,
+    ) -> NetworkView[NodeT, LinkT, NodeTypeT, LinkTypeT]:
+        return cls(
+            network,
+            _mask_from_indices(network.n_count, node_indices) if node_indices is not None else None,
+            _mask_from_indices(network.l_count, link_indices) if link_indices is not None else None,
+        )
+
+    @property
+    def network(self) -> ImmutableNetworkABC[NodeT, LinkT, NodeTypeT, LinkTypeT]:
+        return self._network
+
+    @property
+    def n_count(self) -> int:
+        return len(self.node_indices)
+
+    @property
+    def l_count(self) -> int:
+        return len(self.link_indices)
+
+    @property
+    def node_indices(self) -> list[NodeIndex]:
+        """Return the indices (in the underlying network) of the nodes in this view, in ascending order."""
+        self._check_unchanged()
+        if self._node_indices is None:
+            all_indices = cast(Iterable[NodeIndex], range(self._stamp[0]))
+            self._node_indices = list(
+                compress(all_indices, self._node_mask) if self._node_mask is not None else all_indices
+            )
+        return self._node_indices
+
+    @property
+    def link_indices(self) -> list[LinkIndex]:
+        """Return the indices (in the underlying network) of the links in this view, in ascending order."""
+        structure = self._graph()
+        return structure.es[_LINK_INDEX_KEY] if structure.ecount() > 0 else []
+
+    @property
+    def node_ids(self) -> list[NodeId]:
+        return self._network.node_ids_by_indices(self.node_indices)
+
+    @property
+    def all_nodes(self) -> list[NodeT]:
+        return self._network.nodes_by_indices(self.node_indices)
+
+    @property
+    def all_links(self) -> list[LinkT]:
+        return self._network.links_by_indices(self.link_indices)
+
+    def contains_node(self, index: NodeIndex) -> bool:
+        return 0 <= index < self._stamp[0] and (self._node_mask is None or bool(self._node_mask[index]))
+
+    def contains_link(self, index: LinkIndex) -> bool:
+        if not 0 <= index < self._stamp[1] or (self._link_mask is not None and not self._link_mask[index]):
+            return False
+        source, target = self._network.link_source_target_by_index(index)
+        return self.contains_node(source) and self.contains_node(target)
+
+    def iter_edge_tuples(self) -> Iterator[tuple[NodeIndex, NodeIndex]]:
+        nodes = self.node_indices
+        return ((nodes[source], nodes[target]) for source, target in self._graph().get_edgelist())
+
+    def iter_end_node_id_pairs(self) -> Iterator[EndNodeIdPair]:
+        names = self._network.node_ids
+        return (EndNodeIdPair((names[s], names[t])) for s, t in self.iter_edge_tuples())
+
+    def iter_links_with_end_nodes(self) -> Iterator[tuple[EndNodeIdPair, LinkT]]:
+        return zip(self.iter_end_node_id_pairs(), self.all_links, strict=True)
+
+    def iter_links_with_tuples(self) -> Iterator[tuple[tuple[NodeIndex, NodeIndex], LinkT]]:
+        return zip(self.iter_edge_tuples(), self.all_links, strict=True)
+
+    def in_degrees(self) -> list[int]:
+        """Return the in-degree within this view for every node in ``node_indices``."""
+        return self._graph().indegree()
+
+    def out_degrees(self) -> list[int]:
+        """Return the out-degree within this view for every node in ``node_indices``."""
+        return self._graph().outdegree()
+
+    def degrees(self) -> list[int]:
+        """Return the degree within this view for every node in ``node_indices``."""
+        return self._graph().degree()
+
+    def incident_link_idx_per_node(
+        self, idx: NodeId | NodeIndex, mode: Literal["in", "out", "all"] = "all"
+    ) -> list[LinkIndex]:
+        index = self._node_index(idx)
+        return [i for i in self._network.incident_link_idx_per_node(index, mode) if self.contains_link(i)]
+
+    def incident_links_per_node(
+        self, idx: NodeId | NodeIndex, mode: Literal["in", "out", "all"] = "all"
+    ) -> list[LinkT]:
+        return self._network.links_by_indices(self.incident_link_idx_per_node(idx, mode))
+
+    def neighbor_indices(self, idx: NodeId | NodeIndex, mode: Literal["in", "out", "all"] = "all") -> list[NodeIndex]:
+        index = self._node_index(idx)
+        end_nodes = map(self._network.link_source_target_by_index, self.incident_link_idx_per_node(index, mode))
+        return [t if s == index else s for s, t in end_nodes]
+
+    def neighbors(self, idx: NodeId | NodeIndex, mode: Literal["in", "out", "all"] = "all") -> list[NodeT]:
+        return self._network.nodes_by_indices(self.neighbor_indices(idx, mode))
+
+    def weak_components(self) -> tuple[NetworkView[NodeT, LinkT, NodeTypeT, LinkTypeT], ...]:
+        """Return one view per weakly connected component, ordered by their lowest node index."""
+        return tuple(
+            NetworkView.from_indices(self._network, members, self.link_indices if self._link_mask is not None else None)
+            for members in self.weak_component_node_indices()
+        )
+
+    def weak_component_node_indices(self) -> list[list[NodeIndex]]:
+        nodes = self.node_indices
+        return [[nodes[member] for member in members] for members in self._graph().connected_components(mode="weak")]
+
+    def is_dag(self) -> bool:
+        return self._graph().is_dag()
+
+    def is_simple(self) -> bool:
+        return self._graph().is_simple()
+
+    def materialise(self) -> ImmutableNetworkABC[NodeT, LinkT, NodeTypeT, LinkTypeT]:
+        """Return a new network (of the class of the underlying network) containing only this view."""
+        graph = self._network._attributed_graph()  # pylint: disable=protected-access
+        if self._link_mask is not None:
+            graph = graph.subgraph_edges(self.link_indices, delete_vertices=False)
+        return self._network.__class__(graph.subgraph(self.node_indices))
+
+    def _node_index(self, idx: NodeId | NodeIndex) -> NodeIndex:
+        index = idx if isinstance(idx, int) else self._network.node_index_by_id(idx)
+        if not self.contains_node(index):
+            raise ValueError(f"node {idx!r} is not part of this view")
+        return index
+
+    def _graph(self) -> igraph.Graph:
+        """Return the structure of this view: vertex ``i`` is ``node_indices[i]``, edges in ascending link index."""
+        self._check_unchanged()
+        if self._structure is None:
+            graph = self._network._underlying_digraph  # pylint: disable=protected-access
+            if self._node_mask is not None:
+                small = len(self.node_indices) <= _SMALL_VIEW_SHARE * graph.vcount()
+            else:
+                small = self._link_mask is not None and self._link_mask.count(1) <= _SMALL_VIEW_SHARE * graph.ecount()
+            self._structure = self._selected_structure(graph) if small else self._thinned_structure(graph)
+        return self._structure
+
+    def _selected_structure(self, graph: igraph.Graph) -> igraph.Graph:
+        """Build the structure from the selected links, without touching the other nodes and links of ``graph``."""
+        if self._node_mask is not None:
+            # the links between the selected nodes are among their outgoing links
+            candidates: Iterable[int] = sorted(
+                chain.from_iterable(graph.incident(node, mode="out") for node in self.node_indices)
+            )
+            positions = {node: position for position, node in enumerate(self.node_indices)}
+        else:
+            candidates = compress(range(graph.ecount()), cast(bytes, self._link_mask))
+            positions = None
+        links, edges = [], []
+        for link in candidates:
+            if self._link_mask is not None and not self._link_mask[link]:
+                continue
+            source, target = graph.es[link].tuple
+            if positions is not None:
+                if target not in positions:
+                    continue
+                source, target = positions[source], positions[target]
+            links.append(link)
+            edges.append((source, target))
+        structure = igraph.Graph(n=len(self.node_indices), edges=edges, directed=True)
+        structure.es[_LINK_INDEX_KEY] = links
+        return structure
+
+    def _thinned_structure(self, graph: igraph.Graph) -> igraph.Graph:
+        """Build the structure from a copy of ``graph`` without attributes, deleting what is not selected in C."""
+        structure = graph.copy()
+        for sequence in (structure, structure.vs, structure.es):
+            for name in sequence.attributes():
+                del sequence[name]
+        structure.es[_LINK_INDEX_KEY] = range(structure.ecount())
+        if self._link_mask is not None:
+            links = compress(range(structure.ecount()), self._link_mask)
+            structure = structure.subgraph_edges(list(links), delete_vertices=False)
+        if self._node_mask is not None:
+            # copying and deleting keeps the order of the remaining vertices and edges
+            structure = structure.induced_subgraph(self.node_indices, implementation="copy_and_delete")
+        return structure
+
+    def _check_unchanged(self) -> None:
+        network = self._network
+        if self._stamp != (network.n_count, network.l_count, network.structural_version):
+            raise RuntimeError("The underlying network was mutated after this view was created")
+
+
+def _mask_from_indices(count: int, indices: Iterable[int]) -> bytearray:
+    mask = bytearray(count)
+    for index in indices:
+        mask[index] = 1
+    return mask
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import cast
+
+import igraph
+
+from ._node import NodeId, NodeIndex
+
+_VERTEX_NAME_KEY = "name"  # is given by igraph library
+
+
+class NodeIdIndex:
+    """``NodeId -> NodeIndex`` mapping kept alongside the vertex names of an ``igraph.Graph``.
+
+    The mapping is built lazily from the vertex names and afterwards maintained incrementally by the mutating
+    methods of the owning network. Operations that renumber vertices (deletions) and handing out the graph for direct
+    modification invalidate it; it is also rebuilt whenever the vertex count of the graph no longer matches.
+    If several vertices share a name, the one with the lowest index wins (as with ``igraph.VertexSeq.find``), and,
+    as with ``find``, an ``int`` is taken as the index of the vertex.
+    """
+
+    __slots__ = ("_mapping", "_vertex_count")
+
+    def __init__(self) -> None:
+        self._mapping: dict[NodeId, NodeIndex] | None = None
+        self._vertex_count = -1
+
+    def mapping(self, graph: igraph.Graph) -> dict[NodeId, NodeIndex]:
+        if self._mapping is None or self._vertex_count != graph.vcount():
+            self._rebuild(graph)
+        assert self._mapping is not None
+        return self._mapping
+
+    def index_of(self, graph: igraph.Graph, node_id: NodeId | int) -> NodeIndex:
+        if isinstance(node_id, int):
+            return graph.vs[node_id].index
+        try:
+            return self.mapping(graph)[node_id]
+        except KeyError:
+            raise ValueError(f"no such vertex: {node_id!r}") from None
+
+    def indices_of(self, graph: igraph.Graph, node_ids: Iterable[NodeId | int]) -> list[NodeIndex]:
+        node_ids = list(node_ids)
+        try:
+            return list(map(self.mapping(graph).__getitem__, node_ids))
+        except KeyError:
+            return [self.index_of(graph, node_id) for node_id in node_ids]
+
+    def contains(self, graph: igraph.Graph, node_id: NodeId) -> bool:
+        return node_id in self.mapping(graph)
+
+    def extend(self, first_index: int, node_ids: Sequence[NodeId]) -> None:
+        """Register ``node_ids`` as appended to the graph starting at ``first_index``."""
+        if first_index == 0:
+            self._mapping = {}
+        elif self._mapping is None or self._vertex_count != first_index:
+            self.invalidate()
+            return
+        assert self._mapping is not None
+        added = _build_mapping(node_ids, first_index)
+        for node_id in added.keys() & self._mapping.keys():
+            del added[node_id]
+        self._mapping.update(added)
+        self._vertex_count = first_index + len(node_ids)
+
+    def rename(self, index: NodeIndex, old_id: NodeId, new_id: NodeId) -> None:
+        if self._mapping is None:
+            return
+        if self._mapping.get(old_id) == index:
+            del self._mapping[old_id]
+        self._mapping.setdefault(new_id, index)
+
+    def copy(self) -> NodeIdIndex:
+        # pylint: disable=protected-access
+        copied = NodeIdIndex()
+        copied._mapping = dict(self._mapping) if self._mapping is not None else None
+        copied._vertex_count = self._vertex_count
+        return copied
+
+    def invalidate(self) -> None:
+        self._mapping = None
+        self._vertex_count = -1
+
+    def _rebuild(self, graph: igraph.Graph) -> None:
+        n_count = graph.vcount()
+        self._mapping = _build_mapping(graph.vs[_VERTEX_NAME_KEY] if n_count > 0 else [], 0)
+        self._vertex_count = n_count
+
+
+def _build_mapping(node_ids: Sequence[NodeId], first_index: int) -> dict[NodeId, NodeIndex]:
+    # iterate backwards such that the lowest index wins for duplicated ids
+    last_index = first_index + len(node_ids) - 1
+    return dict(zip(reversed(node_ids), cast(Iterable[NodeIndex], range(last_index, first_index - 1, -1))))
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import os
+import sys
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from ._immutablenetwork import ImmutableNetworkABC
+
+NetworkT = TypeVar("NetworkT", bound="ImmutableNetworkABC")
+
+# shared memory blocks this process attached to, with the network opened on them (see ``SharedNetworkHandle.open``)
+_attached: dict[str, tuple[SharedMemory, Any]] = {}
+
+
+class _AttachedMemory(SharedMemory):
+    """A shared memory block attached to by ``SharedNetworkHandle.open``.
+
+    Networks opened on the block read from views of its mapping, which keep the mapping alive (it is unmapped when the
+    last view is released), so the block may be garbage collected before them without being closed. Only the creating
+    ``SharedNetwork`` unlinks the block, so attaching does not leave it registered with the resource tracker.
+    """
+
+    def __init__(self, name: str) -> None:
+        if sys.version_info >= (3, 13):
+            super().__init__(name, track=False)  # pylint: disable=unexpected-keyword-arg
+            return
+        super().__init__(name)
+        # before Python 3.13, attaching (on POSIX) registers the block, and the tracker of a worker would unlink it on
+        # exit; it is unregistered again right away, which (unlike suppressing the registration) is thread-safe
+        if os.name == "posix":
+            resource_tracker.unregister(self._name, "shared_memory")  # type: ignore[attr-defined]
+
+    def __del__(self) -> None:
+        self.close_unless_viewed()
+
+    def close_unless_viewed(self) -> None:
+        """Close the block, unless networks still read from views of it (the mapping then lives as long as they do)."""
+        try:
+            self.close()
+        except BufferError:
+            pass
+
+
+@dataclass(frozen=True, slots=True)
+class SharedNetworkHandle(Generic[NetworkT]):
+    """Reference to a network published into shared memory by ``SharedNetwork``; it pickles to a few bytes.
+
+    Send the handle to worker processes instead of the network and call ``open`` there, and ``detach`` once the
+    process no longer opens it.
+    """
+
+    name: str
+    size: int
+    network_class: type[NetworkT]
+
+    def open(self) -> NetworkT:
+        """Return the shared network as a copy-on-write copy, which can be mutated without affecting the others.
+
+        The first call in a process attaches the shared memory block and opens the network on it without copying it;
+        its nodes and links are decoded on first access, and are shared by all copies returned in this process.
+        """
+        attached = _attached.get(self.name)
+        if attached is None:
+            memory = _AttachedMemory(self.name)
+            assert memory.buf is not None
+            # pylint: disable-next=protected-access
+            network = self.network_class._from_buffer(memory.buf[: self.size])
+            attached = _attached[self.name] = (memory, network)
+        return attached[1].copy()
+
+    def detach(self) -> None:
+        """Release the attachment of this process to the shared memory block, which ``open`` keeps for reuse.
+
+        Networks opened before keep working, the block stays mapped until the last of them is gone. Opening the handle
+        again attaches the block anew (as long as the ``SharedNetwork`` has not freed it).
+        """
+        attached = _attached.pop(self.name, None)
+        if attached is not None:
+            attached[0].close_unless_viewed()
+
+
+class SharedNetwork(Generic[NetworkT]):
+    """A network published once into a ``multiprocessing.shared_memory`` block, in the binary format.
+
+    Create it with ``network.share()`` and use it as a context manager, which returns the ``handle`` to send to the
+    workers and frees the block on exit. Handles must not be opened after that, networks opened before keep working.
+
+    Only ``close`` frees the block. Before Python 3.13, processes attaching to the block unregister it from the
+    resource tracker shared with this process (see ``_AttachedMemory``), so the tracker no longer frees it when this
+    process dies: if it crashes (or is killed) before ``close`` after a worker opened the handle, the block is left in
+    ``/dev/shm`` until it is unlinked by name or the machine restarts.
+    """
+
+    __slots__ = ("handle", "_memory")
+
+    def __init__(self, network_class: type[NetworkT], data: memoryview) -> None:
+        memory = SharedMemory(create=True, size=max(len(data), 1))
+        assert memory.buf is not None
+        memory.buf[: len(data)] = data
+        self._memory: SharedMemory | None = memory
+        self.handle: SharedNetworkHandle[NetworkT] = SharedNetworkHandle(memory.name, len(data), network_class)
+
+    def __enter__(self) -> SharedNetworkHandle[NetworkT]:
+        return self.handle
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Free the shared memory block (if it is not freed yet).
+
+        Call it in a ``finally`` block (or use the context manager): the block may outlive a process that does not.
+        """
+        if self._memory is None:
+            return
+        self.handle.detach()
+        self._memory.close()
+        if sys.version_info < (3, 13) and os.name == "posix":
+            # processes started by multiprocessing share the resource tracker of this one, so attaching to the block
+            # there (or here) unregistered it; registering is idempotent, and ``unlink`` unregisters it again
+            resource_tracker.register(self._memory._name, "shared_memory")  # type: ignore[attr-defined]
+        self._memory.unlink()
+        self._memory = None
@@ -0,0 +1,97 @@
+"""Discriminator tags for the values of union-typed dataclass fields.
+
+With ``ImmutableNetworkEncoder(tag_unions=True)``, the value of a field typed as ``A | B`` is written as
+``{"__union__": tag, "value": value}``, where ``tag`` names the alternative the value is an instance of (the name of
+the alternative, or its position in the union if the names are ambiguous). The decoder converts tagged values with
+that alternative directly instead of trying one alternative after the other. ``None`` and the values of fields typed
+as ``X | None`` are not tagged, as they are decoded unambiguously anyway.
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields, is_dataclass
+from types import NoneType, UnionType
+from typing import Any, Literal, Union, get_args, get_origin, get_type_hints
+
+UNION_TAG_KEY = "__union__"
+UNION_VALUE_KEY = "value"
+
+_hints: dict[type, dict[str, Any]] = {}
+
+
+def is_union(hint: Any) -> bool:
+    origin = get_origin(hint)
+    return origin is Union or origin is UnionType
+
+
+def alternative_tags(hint: Any) -> tuple[str, ...]:
+    """Return the tag of every alternative of the union ``hint``, in the order of ``get_args(hint)``."""
+    alternatives = get_args(hint)
+    names = tuple(getattr(alternative, "__name__", None) or repr(alternative) for alternative in alternatives)
+    return names if len(set(names)) == len(names) else tuple(map(str, range(len(alternatives))))
+
+
+def tagged_dataclass_dict(obj: Any) -> dict[str, Any]:
+    """Return ``asdict(obj)``, with the values of union-typed fields (also of nested dataclasses) tagged."""
+    cls = type(obj)
+    hints = _hints.get(cls)
+    if hints is None:
+        hints = _hints[cls] = get_type_hints(cls)
+    return {field.name: tag_value(hints.get(field.name), getattr(obj, field.name)) for field in fields(obj)}
+
+
+def tag_value(hint: Any, value: Any) -> Any:
+    """Return ``value`` of a field typed as ``hint`` as it is encoded, tagged if ``hint`` is a union."""
+    if is_union(hint) and value is not None:
+        alternatives = get_args(hint)
+        if len(alternatives) - (NoneType in alternatives) > 1:
+            index = _matching_alternative(alternatives, value)
+            if index is not None:
+                return {
+                    UNION_TAG_KEY: alternative_tags(hint)[index],
+                    UNION_VALUE_KEY: tag_value(alternatives[index], value),
+                }
+    if is_dataclass(value) and not isinstance(value, type):
+        return tagged_dataclass_dict(value)
+    args = get_args(hint)
+    if len(args) > 0 and args[-1] is Ellipsis and isinstance(value, list | tuple):
+        return [tag_value(args[0], item) for item in value]
+    return _plain(value)
+
+
+def _matching_alternative(alternatives: tuple[Any, ...], value: Any) -> int | None:
+    # prefer the alternative of exactly the type of value (e.g. bool over int for True)
+    bases = [_unwrap_new_type(alternative) for alternative in alternatives]
+    for exact in (True, False):
+        for index, base in enumerate(bases):
+            if _accepts(base, value, exact):
+                return index
+    return None
+
+
+def _accepts(base: Any, value: Any, exact: bool) -> bool:
+    origin = get_origin(base)
+    if origin is Literal:
+        return value in get_args(base)
+    if origin is not None:
+        return isinstance(origin, type) and isinstance(value, origin)
+    if isinstance(base, type):
+        return type(value) is base if exact else isinstance(value, base)  # pylint: disable=unidiomatic-typecheck
+    return False
+
+
+def _unwrap_new_type(hint: Any) -> Any:
+    while hasattr(hint, "__supertype__"):
+        hint = hint.__supertype__
+    return hint
+
+
+def _plain(value: Any) -> Any:
+    # the conversion of dataclasses.asdict for values that are not tagged
+    if is_dataclass(value) and not isinstance(value, type):
+        return {field.name: _plain(getattr(value, field.name)) for field in fields(value)}
+    if isinstance(value, list | tuple):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
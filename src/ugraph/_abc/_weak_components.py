@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable
+from operator import itemgetter
+
+import igraph
+
+
+class WeakComponentIndex:
+    """Weakly connected component membership kept alongside an ``igraph.Graph``.
+
+    Every component is identified by the lowest node index it contains, which also orders the components the same
+    way as ``igraph.Graph.connected_components``. Membership is built lazily and afterwards maintained by the
+    mutating methods of the owning network: added nodes start as singletons, added links merge components
+    (union-find with the smaller component relabelled into the larger one), and deleted links only recompute the
+    components they belonged to. Deleting nodes renumbers all vertices and handing out the graph for direct
+    modification may rewire it, so both invalidate the index; it is also rebuilt whenever the element counts of the
+    graph no longer match.
+    """
+
+    __slots__ = ("_labels", "_members", "_lowest", "_counts")
+
+    def __init__(self) -> None:
+        # every node is labelled with a member of its component (the label is a key of the two dictionaries)
+        self._labels: list[int] = []
+        self._members: dict[int, list[int]] = {}
+        self._lowest: dict[int, int] = {}
+        self._counts = (-1, -1)
+
+    def component_id_of(self, graph: igraph.Graph, index: int) -> int:
+        self._ensure(graph)
+        return self._lowest[self._labels[index]]
+
+    def component_sizes(self, graph: igraph.Graph) -> dict[int, int]:
+        """Return ``component id -> number of nodes``, ordered by component id."""
+        self._ensure(graph)
+        return {component_id: len(members) for component_id, members in self._sorted_items()}
+
+    def component_members(self, graph: igraph.Graph) -> list[list[int]]:
+        """Return the ascending node indices of every component, ordered by component id."""
+        self._ensure(graph)
+        return [sorted(members) for _, members in self._sorted_items()]
+
+    def members_of(self, graph: igraph.Graph, component_id: int) -> list[int]:
+        self._ensure(graph)
+        if not 0 <= component_id < len(self._labels) or self._lowest[self._labels[component_id]] != component_id:
+            raise ValueError(f"no such component: {component_id!r}")
+        return sorted(self._members[self._labels[component_id]])
+
+    def extend_nodes(self, graph: igraph.Graph, first_index: int, count: int) -> None:
+        if self._counts != (first_index, graph.ecount()):
+            self.invalidate()
+            return
+        for index in range(first_index, first_index + count):
+            self._labels.append(index)
+            self._members[index] = [index]
+            self._lowest[index] = index
+        self._counts = (first_index + count, graph.ecount())
+
+    def extend_links(self, graph: igraph.Graph, first_index: int, edges: Iterable[tuple[int, int]]) -> None:
+        if self._counts != (graph.vcount(), first_index):
+            self.invalidate()
+            return
+        for source, target in edges:
+            self._union(source, target)
+        self._counts = (graph.vcount(), graph.ecount())
+
+    def labels_of_links(self, graph: igraph.Graph, indices: Collection[int]) -> set[int]:
+        """Return the labels of the components containing the given links (call before deleting them)."""
+        if self._counts != (graph.vcount(), graph.ecount()):
+            return set()
+        edges = graph.es
+        return {self._labels[edges[index].source] for index in indices}
+
+    def delete_links(self, graph: igraph.Graph, labels: set[int], edge_count_before: int) -> None:
+        """Recompute the components with the given labels (see ``labels_of_links``) after links were deleted."""
+        if self._counts != (graph.vcount(), edge_count_before):
+            self.invalidate()
+            return
+        for label in labels:
+            remaining = set(self._members.pop(label))
+            del self._lowest[label]
+            while remaining:
+                members = graph.subcomponent(remaining.pop(), mode="all")
+                remaining.difference_update(members)
+                for member in members:
+                    self._labels[member] = members[0]
+                self._members[members[0]] = members
+                self._lowest[members[0]] = min(members)
+        self._counts = (graph.vcount(), graph.ecount())
+
+    def invalidate(self) -> None:
+        self._labels, self._members, self._lowest = [], {}, {}
+        self._counts = (-1, -1)
+
+    def copy(self) -> WeakComponentIndex:
+        # pylint: disable=protected-access
+        copied = WeakComponentIndex()
+        copied._labels = self._labels[:]
+        copied._members = {label: members[:] for label, members in self._members.items()}
+        copied._lowest = dict(self._lowest)
+        copied._counts = self._counts
+        return copied
+
+    def _sorted_items(self) -> list[tuple[int, list[int]]]:
+        # (component id, members) pairs ordered by component id
+        return sorted(((self._lowest[label], members) for label, members in self._members.items()), key=itemgetter(0))
+
+    def _union(self, source: int, target: int) -> None:
+        label_s, label_t = self._labels[source], self._labels[target]
+        if label_s == label_t:
+            return
+        if len(self._members[label_s]) < len(self._members[label_t]):
+            label_s, label_t = label_t, label_s
+        moved = self._members.pop(label_t)
+        for member in moved:
+            self._labels[member] = label_s
+        self._members[label_s].extend(moved)
+        self._lowest[label_s] = min(self._lowest[label_s], self._lowest.pop(label_t))
+
+    def _ensure(self, graph: igraph.Graph) -> None:
+        if self._counts == (graph.vcount(), graph.ecount()):
+            return
+        self.invalidate()
+        membership = graph.connected_components(mode="weak").membership if graph.vcount() > 0 else []
+        first_of_component: dict[int, int] = {}
+        for index, component in enumerate(membership):
+            label = first_of_component.setdefault(component, index)
+            self._labels.append(label)
+            if label == index:
+                self._members[label] = [index]
+                self._lowest[label] = index
+            else:
+                self._members[label].append(index)
+        self._counts = (graph.vcount(), graph.ecount())
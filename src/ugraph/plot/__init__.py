@@ -1,4 +1,4 @@
-from ._compose_sequence import compose_collection_of_figures_with_slider, compose_with_dropdown
+from ._compose_sequence import compose_collection_of_figures_with_slider, compose_with_dropdown, frames_of_figures
 from ._options import ColorMap, PlotOptions
 from ._plot_2d import add_2d_ugraph_to_figure
 from ._plot_3d import add_3d_ugraph_to_figure
@@ -10,6 +10,7 @@ __all__ = [
     "ColorMap",
     "compose_collection_of_figures_with_slider",
     "compose_with_dropdown",
+    "frames_of_figures",
 ]
 
 try:
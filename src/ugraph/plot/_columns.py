@@ -0,0 +1,115 @@
+"""Per-type coordinate columns of nodes and links, gathered from the typed columns and the edge list of a network.
+
+If numpy is installed (``pip install ugraph[plotting]``), every column is a numpy array, which plotly takes over
+without validating and copying it element by element. Otherwise the columns are lists, and the lines of ``polyline``
+are separated by ``None`` instead of ``nan``.
+"""
+
+from collections.abc import Sequence
+from operator import itemgetter
+from typing import Any
+
+from .._abc import BaseLinkType, BaseNodeType, ImmutableNetworkABC, LinkIndex, NodeIndex
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# a column of values, a numpy array if numpy is installed and a list otherwise
+Column = Any
+# the x, y and z coordinate of every node, in index order
+Axes = tuple[Column, Column, Column]
+# the source and the target node index of every link of one type
+EndNodes = tuple[Column, Column]
+
+
+def coordinate_axes(network: ImmutableNetworkABC) -> Axes:
+    """Split the (N, 3) coordinate column of ``network`` into one column per axis."""
+    coordinates = network.coordinate_column()
+    if np is not None:
+        matrix = np.frombuffer(coordinates, dtype=np.float64).reshape(-1, 3)
+        return matrix[:, 0], matrix[:, 1], matrix[:, 2]
+    return coordinates[0::3].tolist(), coordinates[1::3].tolist(), coordinates[2::3].tolist()
+
+
+def node_id_column(network: ImmutableNetworkABC) -> Column:
+    return np.array(network.node_ids, dtype=object) if np is not None else network.node_ids
+
+
+def node_indices_by_type(network: ImmutableNetworkABC) -> dict[BaseNodeType, list[NodeIndex]]:
+    """Return the ascending indices of the nodes of every node type, the types in the order of their first node."""
+    node_types = network.node_type_column()
+    # the enum member of every type is taken from its first node, the column only holds the values
+    first_nodes = [network.node_by_index(NodeIndex(node_types.index(value))) for value in dict.fromkeys(node_types)]
+    return {node.node_type: network.node_indices_of_type({node.node_type}) for node in first_nodes}
+
+
+def link_end_nodes_by_type(network: ImmutableNetworkABC) -> dict[BaseLinkType, EndNodes]:
+    """Return the end node indices of the links of every link type, the types in the order of their first link."""
+    link_types = network.link_type_column()
+    # the enum member of every type is taken from its first link, the column only holds the values
+    first_links = [network.link_by_index(LinkIndex(link_types.index(value))) for value in dict.fromkeys(link_types)]
+    edges = list(network.iter_edge_tuples())
+    if np is not None:
+        edge_matrix = np.array(edges, dtype=np.int64).reshape(-1, 2)
+        end_node_matrices = {
+            link.link_type: edge_matrix[np.asarray(network.link_indices_of_type({link.link_type}), dtype=np.int64)]
+            for link in first_links
+        }
+        return {link_type: (matrix[:, 0], matrix[:, 1]) for link_type, matrix in end_node_matrices.items()}
+    end_nodes = {}
+    for link in first_links:
+        link_edges = gather(edges, network.link_indices_of_type({link.link_type}))
+        end_nodes[link.link_type] = [s for s, _ in link_edges], [t for _, t in link_edges]
+    return end_nodes
+
+
+def gather(values: Column, indices: Sequence[int]) -> Column:
+    """Return the values at ``indices``."""
+    if np is not None and isinstance(values, np.ndarray):
+        return values[np.asarray(indices, dtype=np.int64)]
+    if len(indices) == 0:
+        return []
+    gathered = itemgetter(*indices)(values)
+    return list(gathered) if len(indices) > 1 else [gathered]
+
+
+def midpoints_and_vectors(axis: Column, end_nodes: EndNodes) -> tuple[Column, Column]:
+    """Return the midpoint and the source-to-target difference of every link along one coordinate ``axis``."""
+    source_values, target_values = gather(axis, end_nodes[0]), gather(axis, end_nodes[1])
+    if np is not None:
+        return (source_values + target_values) * 0.5, target_values - source_values
+    return (
+        [(s + t) * 0.5 for s, t in zip(source_values, target_values)],
+        [t - s for s, t in zip(source_values, target_values)],
+    )
+
+
+def polyline(axis: Column, end_nodes: EndNodes) -> Column:
+    """Return ``source, midpoint, target, gap`` of every link along one ``axis``, i.e. one line per link."""
+    source_values, target_values = gather(axis, end_nodes[0]), gather(axis, end_nodes[1])
+    if np is not None:
+        line = np.full(4 * len(source_values), np.nan)
+        line[0::4], line[1::4], line[2::4] = source_values, (source_values + target_values) * 0.5, target_values
+        return line
+    points: list[float | None] = [None] * (4 * len(source_values))
+    points[0::4] = source_values
+    points[1::4] = [(s + t) * 0.5 for s, t in zip(source_values, target_values)]
+    points[2::4] = target_values
+    return points
+
+
+def polyline_end_node_ids(node_ids: Column, end_nodes: EndNodes) -> tuple[Column, Column]:
+    """Return the source id and the target id of the link every point of ``polyline`` belongs to.
+
+    They are two flat columns (e.g. for ``customdata`` and ``text``), which plotly handles much faster than pairs.
+    """
+    return _repeat_per_point(gather(node_ids, end_nodes[0])), _repeat_per_point(gather(node_ids, end_nodes[1]))
+
+
+def _repeat_per_point(values: Column) -> Column:
+    # the value of every link for its source, midpoint and target, and None for the gap
+    points = np.full(4 * len(values), None, dtype=object) if np is not None else [None] * (4 * len(values))
+    points[0::4] = points[1::4] = points[2::4] = values
+    return points
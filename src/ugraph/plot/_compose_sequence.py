@@ -1,10 +1,13 @@
+import hashlib
 from collections.abc import Sequence
 
 import plotly.graph_objects as go
+from plotly.basedatatypes import BasePlotlyType, BaseTraceType
+from plotly.io.json import to_json_plotly
 
 
 def compose_collection_of_figures_with_slider(
-    figures: Sequence[go.Figure], titles: Sequence[str] | None = None
+    figures: Sequence[go.Figure], titles: Sequence[str] | None = None, delta_frames: bool = False
 ) -> go.Figure:
     """
     Combines multiple figures, including those with subplots, into one figure with a slider for navigation.
@@ -12,6 +15,8 @@ def compose_collection_of_figures_with_slider(
     Args:
         figures (Collection[go.Figure]): A collection of Plotly figures to combine.
         titles (Collection[str] | None): Optional titles for the figures.
+        delta_frames (bool): Emit the traces that are equal in all figures once, and only the others per frame
+            (see ``frames_of_figures``).
 
     Returns:
         go.Figure: A combined figure with a slider for navigation.
@@ -22,11 +27,11 @@ def compose_collection_of_figures_with_slider(
     if titles and len(titles) != len(figures):
         raise ValueError("The length of `titles` must match the length of `figures`.")
 
-        # Initialize the list of frames
-    frames = [go.Frame(data=fig.data, layout=fig.layout, name=f"{i}") for i, fig in enumerate(figures)]
+    # Initialize the list of frames
+    traces, frames = frames_of_figures(figures, with_layout=True, delta=delta_frames)
 
     # Create the combined figure
-    combined_figure = go.Figure(data=figures[0].data, layout=figures[0].layout)  # Start with the first figure's traces
+    combined_figure = go.Figure(data=traces, layout=figures[0].layout)  # Start with the first figure's traces
 
     # Set frames via `update` instead of appending
     combined_figure.update(frames=frames)
@@ -83,6 +88,66 @@ def compose_collection_of_figures_with_slider(
     return combined_figure
 
 
+def frames_of_figures(
+    figures: Sequence[go.Figure], with_layout: bool = False, delta: bool = False
+) -> tuple[list[BaseTraceType], list[go.Frame]]:
+    """
+    Returns the initial traces of an animation over ``figures`` and one frame per figure, named by its position.
+
+    Without ``delta``, the initial traces are those of the first figure and every frame carries all traces of its
+    figure. With ``delta``, the traces at the same position are compared across all figures, by identity or else by
+    a hash of their content. The traces that are equal in all figures are only part of the initial traces; every
+    frame carries just the others and addresses them by their position via ``traces``. A figure with fewer traces
+    hides the missing ones. The layout is added to the frames with ``with_layout``, and with ``delta`` only if it
+    differs between the figures.
+    """
+    if not delta:
+        return list(figures[0].data), [
+            go.Frame(data=fig.data, layout=fig.layout if with_layout else None, name=str(i))
+            for i, fig in enumerate(figures)
+        ]
+
+    n_traces = max(len(fig.data) for fig in figures)
+    initial_traces: list[BaseTraceType] = []
+    changing = []
+    for position in range(n_traces):
+        traces = [fig.data[position] if position < len(fig.data) else None for fig in figures]
+        initial_traces.append(traces[0] if traces[0] is not None else _hidden(next(t for t in traces if t is not None)))
+        if not _all_equal(traces):
+            changing.append(position)
+    with_layout = with_layout and not _all_equal([fig.layout for fig in figures])
+    frames = [
+        go.Frame(
+            data=[
+                fig.data[position] if position < len(fig.data) else _hidden(initial_traces[position])
+                for position in changing
+            ],
+            traces=changing,
+            layout=fig.layout if with_layout else None,
+            name=str(i),
+        )
+        for i, fig in enumerate(figures)
+    ]
+    return initial_traces, frames
+
+
+def _all_equal(objects: Sequence[BasePlotlyType | None]) -> bool:
+    if all(other is objects[0] for other in objects[1:]):
+        return True
+    hashes = {_content_hash(obj) if obj is not None else None for obj in objects}
+    return len(hashes) == 1
+
+
+def _content_hash(plotly_object: BasePlotlyType) -> str:
+    return hashlib.blake2b(to_json_plotly(plotly_object.to_plotly_json()).encode(), digest_size=16).hexdigest()
+
+
+def _hidden(trace: BaseTraceType) -> BaseTraceType:
+    hidden = type(trace)(trace)
+    hidden.visible = False
+    return hidden
+
+
 def compose_with_dropdown(figures: Sequence[go.Figure], titles: Sequence[str] | None = None) -> go.Figure:
     base_layout = figures[0].layout
     all_traces = []
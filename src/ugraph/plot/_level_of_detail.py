@@ -0,0 +1,124 @@
+"""Level of detail of large networks: the nodes and links beyond a budget are thinned on a grid.
+
+The plane spanned by all nodes is split into about ``budget`` cells. Outside the focus box, only the first node of
+every occupied cell is drawn, and only the first link between every pair of distinct cells; links within a single
+cell are shorter than a cell and dropped. If that still exceeds the budget, every k-th of the remaining elements is
+drawn (none for a budget of 0). Nodes inside the focus box, and links with an end node inside it, are always drawn.
+"""
+
+import math
+from collections.abc import Sequence
+
+from .._abc import BaseLinkType, BaseNodeType
+from ._columns import Axes, Column, EndNodes, gather, np
+from ._options import PlotOptions
+
+# x_min, y_min, x_max, y_max
+BoundingBox = tuple[float, float, float, float]
+
+
+def level_of_detail(
+    axes: Axes,
+    node_indices_by_type: dict[BaseNodeType, Column],
+    end_nodes_by_type: dict[BaseLinkType, EndNodes],
+    options: PlotOptions,
+) -> tuple[dict[BaseNodeType, Column], dict[BaseLinkType, EndNodes]]:
+    """Return the nodes and links of every type that are drawn with ``options.max_nodes`` and ``max_links``."""
+    if options.max_nodes is not None:
+        node_indices_by_type = {
+            node_type: _thin_nodes(axes, indices, options.max_nodes, options.focus_box)
+            for node_type, indices in node_indices_by_type.items()
+        }
+    if options.max_links is not None:
+        end_nodes_by_type = {
+            link_type: _thin_links(axes, end_nodes, options.max_links, options.focus_box)
+            for link_type, end_nodes in end_nodes_by_type.items()
+        }
+    return node_indices_by_type, end_nodes_by_type
+
+
+def _thin_nodes(axes: Axes, indices: Column, budget: int, focus_box: BoundingBox | None) -> Column:
+    if len(indices) <= budget:
+        return indices
+    cells_per_side = _cells_per_side(budget)
+    cells = _cell_ids(axes, indices, cells_per_side)
+    inside = _inside(axes, indices, focus_box)
+    if np is not None:
+        first_of_cell = np.zeros(len(indices), dtype=bool)
+        first_of_cell[np.unique(cells, return_index=True)[1]] = True
+        outside = np.flatnonzero(first_of_cell & ~inside)
+        keep = np.sort(np.concatenate((np.flatnonzero(inside), _stride(outside, budget))))
+        return gather(np.asarray(indices), keep)
+    occupied: set[int] = set()
+    outside = []
+    for position, cell in enumerate(cells):
+        if not inside[position] and cell not in occupied:
+            occupied.add(cell)
+            outside.append(position)
+    keep = sorted([position for position, is_inside in enumerate(inside) if is_inside] + _stride(outside, budget))
+    return gather(indices, keep)
+
+
+def _thin_links(axes: Axes, end_nodes: EndNodes, budget: int, focus_box: BoundingBox | None) -> EndNodes:
+    sources, targets = end_nodes
+    if len(sources) <= budget:
+        return end_nodes
+    cells_per_side = _cells_per_side(budget)
+    source_cells, target_cells = _cell_ids(axes, sources, cells_per_side), _cell_ids(axes, targets, cells_per_side)
+    source_inside, target_inside = _inside(axes, sources, focus_box), _inside(axes, targets, focus_box)
+    if np is not None:
+        inside = source_inside | target_inside
+        cell_pairs = source_cells * cells_per_side**2 + target_cells
+        first_of_pair = np.zeros(len(sources), dtype=bool)
+        first_of_pair[np.unique(cell_pairs, return_index=True)[1]] = True
+        outside = np.flatnonzero(first_of_pair & ~inside & (source_cells != target_cells))
+        keep = np.sort(np.concatenate((np.flatnonzero(inside), _stride(outside, budget))))
+        return sources[keep], targets[keep]
+    inside = [s or t for s, t in zip(source_inside, target_inside)]
+    occupied: set[tuple[int, int]] = set()
+    outside = []
+    for position, cell_pair in enumerate(zip(source_cells, target_cells)):
+        if not inside[position] and cell_pair[0] != cell_pair[1] and cell_pair not in occupied:
+            occupied.add(cell_pair)
+            outside.append(position)
+    keep = sorted([position for position, is_inside in enumerate(inside) if is_inside] + _stride(outside, budget))
+    return gather(sources, keep), gather(targets, keep)
+
+
+def _cells_per_side(budget: int) -> int:
+    return max(1, math.isqrt(budget))
+
+
+def _cell_ids(axes: Axes, indices: Column, cells_per_side: int) -> Column:
+    """Return the grid cell of every node at ``indices``, on a grid over the bounding box of all nodes."""
+    cell_columns = []
+    for axis in axes[:2]:
+        values = gather(axis, indices)
+        low, high = (axis.min(), axis.max()) if np is not None else (min(axis), max(axis))
+        # the nodes on the upper edge fall into the last cell
+        scale = cells_per_side / (high - low) if high > low else 0.0
+        if np is not None:
+            cell_columns.append(np.minimum(((values - low) * scale).astype(np.int64), cells_per_side - 1))
+        else:
+            cell_columns.append([min(int((value - low) * scale), cells_per_side - 1) for value in values])
+    if np is not None:
+        return cell_columns[1] * cells_per_side + cell_columns[0]
+    return [row * cells_per_side + column for column, row in zip(*cell_columns)]
+
+
+def _inside(axes: Axes, indices: Column, focus_box: BoundingBox | None) -> Column:
+    """Return whether every node at ``indices`` lies within ``focus_box``."""
+    if focus_box is None:
+        return np.zeros(len(indices), dtype=bool) if np is not None else [False] * len(indices)
+    x_min, y_min, x_max, y_max = focus_box
+    x, y = gather(axes[0], indices), gather(axes[1], indices)
+    if np is not None:
+        return (x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)
+    return [x_min <= x_value <= x_max and y_min <= y_value <= y_max for x_value, y_value in zip(x, y)]
+
+
+def _stride(positions: Sequence[int], budget: int) -> Sequence[int]:
+    """Return every k-th of ``positions`` such that at most ``budget`` are left (none for a budget of 0)."""
+    if budget == 0:
+        return positions[:0]
+    return positions[:: math.ceil(len(positions) / budget)] if len(positions) > budget else positions
@@ -12,3 +12,34 @@ class PlotOptions:
     edge_width: int = 6
     edge_dash: Literal["solid", "dash", "dot", "longdash", "dashdot", "longdashdot"] = "solid"
     edge_opacity: float = 1.0
+    # "webgl" draws the 2D traces with ``go.Scattergl``, which stays responsive for many more points than SVG
+    renderer: Literal["svg", "webgl"] = "svg"
+    # (x_min, y_min, x_max, y_max) within which nodes and links are drawn in full detail despite the budgets
+    focus_box: tuple[float, float, float, float] | None = None
+    _max_nodes: int | None = None
+    _max_links: int | None = None
+
+    @property
+    def max_nodes(self) -> int | None:
+        """The number of nodes of every type beyond which they are thinned on a grid (None draws all, 0 only those
+        within ``focus_box``)."""
+        return self._max_nodes
+
+    @max_nodes.setter
+    def max_nodes(self, budget: int | None) -> None:
+        self._max_nodes = _checked_budget("max_nodes", budget)
+
+    @property
+    def max_links(self) -> int | None:
+        """The number of links of every type beyond which they are thinned on a grid, like ``max_nodes``."""
+        return self._max_links
+
+    @max_links.setter
+    def max_links(self, budget: int | None) -> None:
+        self._max_links = _checked_budget("max_links", budget)
+
+
+def _checked_budget(name: str, budget: int | None) -> int | None:
+    if budget is not None and (not isinstance(budget, int) or budget < 0):
+        raise ValueError(f"{name} must be None or a non-negative integer, not {budget!r}")
+    return budget
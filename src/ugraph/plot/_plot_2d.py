@@ -1,9 +1,21 @@
-from collections import defaultdict
-
 import plotly.graph_objects as go
-from plotly.graph_objs import Cone, Scatter
+from plotly.graph_objs import Cone, Scatter, Scattergl
 
-from .._abc import BaseLinkType, BaseNodeType, ImmutableNetworkABC, NodeABC, NodeId
+from .._abc import BaseLinkType, BaseNodeType, ImmutableNetworkABC
+from ._columns import (
+    Axes,
+    Column,
+    EndNodes,
+    coordinate_axes,
+    gather,
+    link_end_nodes_by_type,
+    midpoints_and_vectors,
+    node_id_column,
+    node_indices_by_type,
+    polyline,
+    polyline_end_node_ids,
+)
+from ._level_of_detail import level_of_detail
 from ._options import ColorMap, PlotOptions
 
 
@@ -25,98 +37,104 @@ def add_2d_ugraph_to_figure(
 
 def _compute_graph_traces(
     network: ImmutableNetworkABC, color_map: ColorMap, options: PlotOptions
-) -> list[Scatter] | list[Cone | Scatter]:
-    nodes_by_id = {node.node_id: node for node in network.all_nodes}
-    base_traces = _create_edge_traces(color_map, network, nodes_by_id, options) + _create_node_traces(
-        color_map, network, options
+) -> list[Scatter | Scattergl] | list[Cone | Scatter | Scattergl]:
+    axes = coordinate_axes(network)
+    node_ids = node_id_column(network)
+    node_indices, end_nodes_by_type = level_of_detail(
+        axes, node_indices_by_type(network), link_end_nodes_by_type(network), options
+    )
+    base_traces = _create_edge_traces(color_map, node_ids, axes, end_nodes_by_type, options) + _create_node_traces(
+        color_map, node_ids, axes, node_indices, options
     )
     if not options.add_arrow:
         return base_traces
-    return base_traces + _create_arrow_traces(color_map, network, nodes_by_id, options)
+    return base_traces + _create_arrow_traces(color_map, axes, end_nodes_by_type, options)
 
 
 def _create_arrow_traces(
-    color_map: ColorMap, network: ImmutableNetworkABC, nodes_by_id: dict[NodeId, NodeABC], options: PlotOptions
+    color_map: ColorMap, axes: Axes, end_nodes_by_type: dict[BaseLinkType, EndNodes], options: PlotOptions
 ) -> list[go.Cone]:
+    """Return one cone trace per link type, pointing from the midpoint of each link towards its target."""
     arrow_traces = []
-    for (s_idx, t_idx), link in network.iter_links_with_end_nodes():
-        s_cords, t_cords = nodes_by_id[s_idx].coordinates, nodes_by_id[t_idx].coordinates
-        arrow_vector = [t_cords.x - s_cords.x, t_cords.y - s_cords.y, t_cords.z - s_cords.z]
-        mid_point = [(s_cords.x + t_cords.x) * 0.5, (s_cords.y + t_cords.y) * 0.5, (s_cords.z + t_cords.z) * 0.5]
-
+    for link_type, end_nodes in end_nodes_by_type.items():
+        (x, u), (y, v) = (midpoints_and_vectors(axis, end_nodes) for axis in axes[:2])
         arrow_traces.append(
             go.Cone(
-                x=[mid_point[0]],
-                y=[mid_point[1]],
-                u=[arrow_vector[0]],
-                v=[arrow_vector[1]],
+                x=x,
+                y=y,
+                u=u,
+                v=v,
                 sizemode="absolute",
                 sizeref=options.arrow_width,
                 anchor="tail",
-                colorscale=[[0, color_map[link.link_type]], [1, color_map[link.link_type]]],
+                colorscale=[[0, color_map[link_type]], [1, color_map[link_type]]],
                 showscale=False,
-                name=f"Arrow: {link.link_type.name}",
-                legendgroup=link.link_type.name,
+                name=f"Arrow: {link_type.name}",
+                legendgroup=link_type.name,
             )
         )
     return arrow_traces
 
 
-def _create_node_traces(color_map: ColorMap, network: ImmutableNetworkABC, options: PlotOptions) -> list[Scatter]:
-    nodes_by_type: dict[BaseNodeType, dict[str, list[float | str | None]]] = defaultdict(
-        lambda: {_key: [] for _key in ["node_x", "node_y", "node_name"]}
-    )
-    for node in network.all_nodes:
-        _type = node.node_type
-        nodes_by_type[_type]["node_x"].append(node.coordinates.x)
-        nodes_by_type[_type]["node_y"].append(node.coordinates.y)
-        nodes_by_type[_type]["node_name"].append(f"{node.node_id} {node.node_type.name}")
-    return [
-        go.Scatter(
-            x=nodes["node_x"],
-            y=nodes["node_y"],
-            text=nodes["node_name"],
-            name=node_type.name,
-            mode="markers",
-            hoverinfo="x+y+text",
-            legendgroup=node_type.name,
-            marker={
-                "size": options.node_size,
-                "line_width": options.node_size * 0.1,
-                "color": color_map[node_type],
-                "symbol": options.node_shape,
-            },
+def _create_node_traces(
+    color_map: ColorMap,
+    node_ids: Column,
+    axes: Axes,
+    node_indices: dict[BaseNodeType, Column],
+    options: PlotOptions,
+) -> list[Scatter | Scattergl]:
+    """Return one marker trace per node type; the hover label is built by plotly from the node ids in ``customdata``."""
+    traces = []
+    for node_type, indices in node_indices.items():
+        x, y = (gather(axis, indices) for axis in axes[:2])
+        traces.append(
+            _scatter_class(options)(
+                x=x,
+                y=y,
+                customdata=gather(node_ids, indices),
+                hovertemplate=f"(%{{x}}, %{{y}})<br>%{{customdata}} {node_type.name}<extra></extra>",
+                name=node_type.name,
+                mode="markers",
+                legendgroup=node_type.name,
+                marker={
+                    "size": options.node_size,
+                    "line_width": options.node_size * 0.1,
+                    "color": color_map[node_type],
+                    "symbol": options.node_shape,
+                },
+            )
         )
-        for node_type, nodes in nodes_by_type.items()
-    ]
+    return traces
 
 
 def _create_edge_traces(
-    color_map: ColorMap, network: ImmutableNetworkABC, nodes_by_id: dict[NodeId, NodeABC], options: PlotOptions
-) -> list[Scatter]:
-    edges_by_type: dict[BaseLinkType, dict[str, list[float | str | None]]] = defaultdict(
-        lambda: {_key: [] for _key in ["edge_x", "edge_y", "edge_line_name", "info"]}
-    )
-    for end_node_pair, link in network.iter_links_with_end_nodes():
-        s_node = nodes_by_id[end_node_pair[0]]
-        t_node = nodes_by_id[end_node_pair[1]]
-        s_cords, t_cords = s_node.coordinates, t_node.coordinates
-        _type = link.link_type
-        edges_by_type[_type]["edge_x"].extend((s_cords.x, (t_cords.x + s_cords.x) * 0.5, t_cords.x, None))
-        edges_by_type[_type]["edge_y"].extend((s_cords.y, (t_cords.y + s_cords.y) * 0.5, t_cords.y, None))
-        text = f"S:{s_node.node_id} T:{t_node.node_id},<br>link_type:{link.link_type}"
-        edges_by_type[_type]["info"].extend((text, text, text, None))
-    return [
-        go.Scatter(
-            x=edges["edge_x"],
-            y=edges["edge_y"],
-            line={"width": options.edge_width, "color": color_map[edge_type], "dash": options.edge_dash},
-            mode="lines",
-            name=edge_type.name,
-            legendgroup=edge_type.name,
-            opacity=options.edge_opacity,
-            hoverinfo="text",
-            text=edges["info"],
+    color_map: ColorMap,
+    node_ids: Column,
+    axes: Axes,
+    end_nodes_by_type: dict[BaseLinkType, EndNodes],
+    options: PlotOptions,
+) -> list[Scatter | Scattergl]:
+    """Return one line trace per link type, with the source and target id of every point for the hover label."""
+    traces = []
+    for edge_type, end_nodes in end_nodes_by_type.items():
+        source_ids, target_ids = polyline_end_node_ids(node_ids, end_nodes)
+        x, y = (polyline(axis, end_nodes) for axis in axes[:2])
+        traces.append(
+            _scatter_class(options)(
+                x=x,
+                y=y,
+                line={"width": options.edge_width, "color": color_map[edge_type], "dash": options.edge_dash},
+                mode="lines",
+                name=edge_type.name,
+                legendgroup=edge_type.name,
+                opacity=options.edge_opacity,
+                customdata=source_ids,
+                text=target_ids,
+                hovertemplate=f"S:%{{customdata}} T:%{{text}},<br>link_type:{edge_type}<extra></extra>",
+            )
         )
-        for edge_type, edges in edges_by_type.items()
-    ]
+    return traces
+
+
+def _scatter_class(options: PlotOptions) -> type[Scatter] | type[Scattergl]:
+    return go.Scattergl if options.renderer == "webgl" else go.Scatter
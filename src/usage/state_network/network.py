@@ -10,32 +10,30 @@ from ._utils.result import Result
 class StateNetwork(MutableNetworkABC[StateNode, StateLink, StateNodeType, StateLinkType]):
 
     def reduce_to_agent_network(self) -> "StateNetwork":
-        copied = self.copy()
-        copied.delete_nodes_without_type(frozenset((StateNodeType.AGENT,)))
-        return copied
+        return _reduced(self, frozenset((StateNodeType.AGENT,)))
 
     def reduce_to_resource_network(self) -> "StateNetwork":
-        copied = self.copy()
-        copied.delete_nodes_without_type(frozenset((StateNodeType.RESOURCE,)))
-        return copied
+        return _reduced(self, frozenset((StateNodeType.RESOURCE,)))
 
     def reduce_to_transition_network(self) -> "StateNetwork":
-        copied = self.copy()
-        copied.delete_nodes_without_type(frozenset((StateNodeType.INFRASTRUCTURE,)))
-        return copied
+        return _reduced(self, frozenset((StateNodeType.INFRASTRUCTURE,)))
 
     def reduce_to_resource_and_infrastructure_network(self) -> "StateNetwork":
-        copied = self.copy()
-        copied.delete_nodes_without_type(frozenset((StateNodeType.RESOURCE, StateNodeType.INFRASTRUCTURE)))
-        return copied
+        return _reduced(self, frozenset((StateNodeType.RESOURCE, StateNodeType.INFRASTRUCTURE)))
 
     def reduce_to_infrastructure_and_agent_network(self) -> "StateNetwork":
-        copied = self.copy()
-        copied.delete_nodes_without_type(frozenset((StateNodeType.INFRASTRUCTURE, StateNodeType.AGENT)))
-        return copied
+        return _reduced(self, frozenset((StateNodeType.INFRASTRUCTURE, StateNodeType.AGENT)))
 
     def validate_topology(self) -> Result[bool, str]:
-        return _validate_topology(self)
+        return self.cached("validate_topology", _validate_topology)
+
+
+def _reduced(state_network: StateNetwork, types: frozenset[StateNodeType]) -> StateNetwork:
+    # copying and deleting keeps the order of the remaining nodes and links, as deleting the others from a copy does
+    graph = state_network.read_only_digraph.induced_subgraph(
+        state_network.node_indices_of_type(types), implementation="copy_and_delete"
+    )
+    return state_network.__class__(graph)
 
 
 def _validate_topology(state_network: StateNetwork) -> Result[bool, str]:
@@ -46,24 +44,27 @@ def _validate_topology(state_network: StateNetwork) -> Result[bool, str]:
 
 
 def _validate_network_incidence(state_network: StateNetwork) -> Result[bool, str]:
-    infra_only = state_network.reduce_to_transition_network()
-    for component in infra_only.weak_components():
-        if not component.underlying_digraph.is_dag():
-            component.debug_plot(file_name=f"inconsistent_infra.png")
-            return Result.from_failure(f"Infrastructure component {component} is not a DAG")
-        if not component.underlying_digraph.is_simple():
-            component.debug_plot(file_name=f"inconsistent_infra.png")
-            return Result.from_failure(
-                f"Infrastructure component {component} is not simple (contains loops or multiple edges)"
-            )
-    except_transitions = state_network.copy()
-    for component in except_transitions.weak_components():
-        if not component.underlying_digraph.is_dag():
-            component.debug_plot(file_name=f"inconsistent_transitions.png")
-            return Result.from_failure(f"Component {component} is not a DAG")
-        if not component.underlying_digraph.is_simple():
-            component.debug_plot(file_name=f"inconsistent_transitions.png")
-            return Result.from_failure(f"Component {component} is not simple (contains loops or multiple edges)")
+    infra_only = state_network.view(state_network.node_indices_of_type(frozenset((StateNodeType.INFRASTRUCTURE,))))
+    if not (infra_only.is_dag() and infra_only.is_simple()):
+        for component_view in infra_only.weak_components():
+            if not component_view.is_dag():
+                component = component_view.materialise()
+                component.debug_plot(file_name=f"inconsistent_infra.png")
+                return Result.from_failure(f"Infrastructure component {component} is not a DAG")
+            if not component_view.is_simple():
+                component = component_view.materialise()
+                component.debug_plot(file_name=f"inconsistent_infra.png")
+                return Result.from_failure(
+                    f"Infrastructure component {component} is not simple (contains loops or multiple edges)"
+                )
+    if not (state_network.is_dag() and state_network.is_simple()):
+        for component in state_network.iter_weak_components():
+            if not component.is_dag():
+                component.debug_plot(file_name=f"inconsistent_transitions.png")
+                return Result.from_failure(f"Component {component} is not a DAG")
+            if not component.is_simple():
+                component.debug_plot(file_name=f"inconsistent_transitions.png")
+                return Result.from_failure(f"Component {component} is not simple (contains loops or multiple edges)")
     return Result.from_success(True)
 
 
@@ -1,8 +1,8 @@
-from collections.abc import Collection
+from collections.abc import Sequence
 
 import plotly.graph_objects as go
 
-from ugraph.plot import ColorMap, add_3d_ugraph_to_figure
+from ugraph.plot import ColorMap, add_3d_ugraph_to_figure, frames_of_figures
 from usage.state_network import StateNetwork
 
 
@@ -12,12 +12,13 @@ def add_state_network_in_3d_to_figure(
     return add_3d_ugraph_to_figure(network, color_map, figure)
 
 
-def compose_with_slider(figures: Collection[go.Figure]) -> go.Figure:
+def compose_with_slider(figures: Sequence[go.Figure], delta_frames: bool = False) -> go.Figure:
     """
     Combine multiple 3D figures into one figure with a slider for navigation.
 
     Args:
-        figures (Collection[go.Figure]): A collection of Plotly figures to combine.
+        figures (Sequence[go.Figure]): A sequence of Plotly figures to combine.
+        delta_frames (bool): Emit the traces that are equal in all figures once, and only the others per frame.
 
     Returns:
         go.Figure: A combined figure with slider and animation frames.
@@ -26,10 +27,11 @@ def compose_with_slider(figures: Collection[go.Figure]) -> go.Figure:
         raise ValueError("The `figures` collection cannot be empty.")
 
     # Initialize the final figure and frames
-    final_fig = go.Figure(frames=[go.Frame(data=fig.data, name=str(i)) for i, fig in enumerate(figures)])
+    traces, frames = frames_of_figures(figures, delta=delta_frames)
+    final_fig = go.Figure(frames=frames)
 
     # Add the initial data (first figure's data)
-    final_fig.add_traces(figures[0].data)
+    final_fig.add_traces(traces)
 
     # Configure the layout with slider and play/pause buttons
     final_fig.update_layout(